@@ -0,0 +1,140 @@
+"""
+Compares parsed records held as plain dicts against the slotted record types.
+
+A synthetic dump is parsed once and every section is held both ways. For each
+size this reports the memory per record (measured with tracemalloc while
+building the section), the time to read the fields `prepare_works` uses from
+every work, and the pickled size of the sections:
+
+    python benchmarks/bench_records.py --sizes 1000 10000 --output records.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orcid_cv as ocv  # noqa: E402
+from orcid_cv.parser import SECTION_FOLDERS  # noqa: E402
+from synthetic_dump import write_dump  # noqa: E402
+
+DEFAULT_SIZES = [1000, 10000]
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by `build` once it returns, its result kept alive."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def _best_of(fun: Callable[[], Any], repeats: int) -> float:
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fun()
+        runs.append(time.perf_counter() - start)
+    return min(runs)
+
+
+def benchmark_size(size: int, workdir: str, repeats: int) -> List[Dict[str, Any]]:
+    root = os.path.join(workdir, f"dump_{size}")
+    write_dump(root, n_works=size, duplicate_pairs=0, n_reviews=size // 5)
+
+    sections: Dict[str, Dict[str, Any]] = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for section, (folder, loader) in SECTION_FOLDERS.items():
+            sections[section] = ocv.folder_to_dict(os.path.join(root, folder), loader)
+    plain = {name: {k: r.to_dict() for k, r in section.items()} for name, section in sections.items()}
+
+    results = []
+    for name, records in sections.items():
+        if not records:
+            continue
+        record_type = type(next(iter(records.values())))
+        as_dicts = plain[name]
+        dict_bytes = _allocated(lambda: {k: dict(v) for k, v in as_dicts.items()})
+        record_bytes = _allocated(lambda: {k: record_type(v) for k, v in as_dicts.items()})
+        results.append(
+            {
+                "size": size,
+                "section": name,
+                "records": len(records),
+                "dict_bytes_per_record": round(dict_bytes / len(records), 1),
+                "record_bytes_per_record": round(record_bytes / len(records), 1),
+                "dict_pickle_bytes": len(pickle.dumps(as_dicts, pickle.HIGHEST_PROTOCOL)),
+                "record_pickle_bytes": len(pickle.dumps(records, pickle.HIGHEST_PROTOCOL)),
+            }
+        )
+
+    works, work_dicts = list(sections["work"].values()), list(plain["work"].values())
+
+    def read_dicts() -> None:
+        for w in work_dicts:
+            w.get("year", ""), w.get("journal", ""), w.get("title", "")
+            w.get("subtitle", ""), w.get("type", ""), w.get("authors", [])
+
+    def read_records() -> None:
+        for w in works:
+            w.year, w.journal, w.title
+            w.subtitle, w.type, w.authors
+
+    results.append(
+        {
+            "size": size,
+            "section": "work",
+            "benchmark": "field_reads",
+            "dict_get_s": round(_best_of(read_dicts, repeats), 6),
+            "record_attribute_s": round(_best_of(read_records, repeats), 6),
+        }
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare dict and slotted records.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of works")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            print(f"Benchmarking {size} works...")
+            for result in benchmark_size(size, workdir, args.repeats):
+                if "benchmark" in result:
+                    print(
+                        f"  field reads    dict {result['dict_get_s'] * 1000:8.2f} ms"
+                        f"   record {result['record_attribute_s'] * 1000:8.2f} ms"
+                    )
+                else:
+                    print(
+                        f"  {result['section']:<11} {result['records']:7d} records"
+                        f"   dict {result['dict_bytes_per_record']:7.1f} B"
+                        f"   record {result['record_bytes_per_record']:7.1f} B"
+                    )
+                results.append(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=4)
+        print(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Times the main stages of a CV build on synthetic dumps of several sizes.
+
+For every size a dump is written with `synthetic_dump.write_dump` and these are
+timed, each repeated and reported by its best and median run:
+
+* extract_cold     `extract_orcid_info` with no cache
+* extract_cached   `extract_orcid_info` reloading an up-to-date cache
+* prune_duplicates `prune_duplicate_works` on the freshly parsed works
+* prepare_works    `prepare_works` for journal articles on a fresh copy of the works
+* prepare_works_cached  the same again on a profile whose entries are already prepared
+* build_<backend>  adding the `quick_build` sections and `build_document`, per backend
+* build_reportlab_table  the same with reportlab's "table" section layout
+
+Preprint and ISSN lookups are answered from a lookup cache seeded with the
+dump's own DOIs and ISSNs, so nothing goes to the network. Results are written
+as JSON for comparing runs:
+
+    python benchmarks/run_benchmarks.py --sizes 100 1000 5000 --output results.json
+"""
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orcid_cv as ocv  # noqa: E402
+from orcid_cv.lookups import DOI_HOST, ISSN_TITLE, LookupCache  # noqa: E402
+from orcid_cv.normalize import canonical_doi  # noqa: E402
+from synthetic_dump import write_dump  # noqa: E402
+
+DEFAULT_SIZES = [100, 500, 2000]
+
+
+def _time(fun: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """Runs `fun` `repeats` times with its output silenced, returning the durations."""
+    runs = []
+    with open(os.devnull, "w") as devnull:
+        for _ in range(repeats):
+            if setup is not None:
+                setup()
+            with contextlib.redirect_stdout(devnull):
+                start = time.perf_counter()
+                fun()
+                runs.append(time.perf_counter() - start)
+    return runs
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def benchmark_size(size: int, workdir: str, repeats: int, backends: List[str]) -> List[Dict[str, Any]]:
+    """Writes a dump with `size` works and times every stage on it."""
+    root = os.path.join(workdir, f"dump_{size}")
+    lookups = write_dump(
+        root,
+        n_works=size,
+        duplicate_pairs=size // 10,
+        n_reviews=max(10, size // 5),
+        n_journals=max(3, size // 50),
+    )
+
+    # Answer every lookup the parser will make from a private cache
+    lookup_cache = LookupCache(os.path.join(workdir, f"lookups_{size}.sqlite"))
+    lookup_cache.put_many(
+        DOI_HOST, {canonical_doi(doi): (True, "bioRxiv") for doi in lookups["preprints"]}
+    )
+    lookup_cache.put_many(ISSN_TITLE, {issn: (True, f"Journal {issn}") for issn in lookups["issns"]})
+    os.environ["ORCID_CV_LOOKUP_CACHE"] = lookup_cache.path
+
+    cache_path = os.path.join(root, "ORCID.json")
+
+    def remove_cache() -> None:
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    timings: Dict[str, Dict[str, Any]] = {}
+    timings["extract_cold"] = {
+        "runs": _time(lambda: ocv.extract_orcid_info(root), repeats, setup=remove_cache)
+    }
+    timings["extract_cached"] = {"runs": _time(lambda: ocv.extract_orcid_info(root), repeats)}
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        works = ocv.folder_to_dict(os.path.join(root, "works"), ocv.load_work)
+        orcid_dict = ocv.extract_orcid_info(root)
+    copies: List[Dict[str, Any]] = []
+    timings["prune_duplicates"] = {
+        "runs": _time(
+            lambda: ocv.prune_duplicate_works(copies.pop()),
+            repeats,
+            setup=lambda: copies.append(copy.deepcopy(works)),
+        )
+    }
+
+    # Prepared entries are kept with the profile's works, so the cold runs each
+    # get a profile holding a fresh copy of them
+    config = ocv.make_document_config("greenspon-default")
+    profiles: List[Dict[str, Any]] = []
+    timings["prepare_works"] = {
+        "runs": _time(
+            lambda: ocv.prepare_works(profiles.pop(), config, "journal-article"),
+            repeats,
+            setup=lambda: profiles.append(
+                {**orcid_dict, "work": ocv.work_map(orcid_dict).copy()}
+            ),
+        )
+    }
+    ocv.prepare_works(orcid_dict, config, "journal-article")
+    timings["prepare_works_cached"] = {
+        "runs": _time(lambda: ocv.prepare_works(orcid_dict, config, "journal-article"), repeats)
+    }
+
+    for backend in backends:
+        config = ocv.make_document_config("greenspon-default", backend=backend)
+        output = os.path.join(workdir, f"cv_{size}_{backend}.pdf")
+
+        def build() -> None:
+            elements: List[Any] = []
+            ocv.add_standard_sections(elements, orcid_dict, config)
+            ocv.build_document(output, elements, config, title="Benchmark")
+
+        timings[f"build_{backend}"] = {"runs": _time(build, repeats)}
+        if backend == "reportlab":
+            config["section_layout"] = "table"
+            timings["build_reportlab_table"] = {"runs": _time(build, repeats)}
+
+    results = []
+    for name, timing in timings.items():
+        runs = timing["runs"]
+        results.append(
+            {
+                "size": size,
+                "benchmark": name,
+                "min_s": round(min(runs), 6),
+                "median_s": round(statistics.median(runs), 6),
+                "runs_s": [round(r, 6) for r in runs],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark orcid_cv on synthetic dumps.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of works")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=list(ocv.BACKENDS), choices=ocv.BACKENDS)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            print(f"Benchmarking {size} works...")
+            for result in benchmark_size(size, workdir, args.repeats, args.backends):
+                print(f"  {result['benchmark']:<22} {result['median_s'] * 1000:10.1f} ms")
+                results.append(result)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as fp:
+        json.dump(report, fp, indent=4)
+    print(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
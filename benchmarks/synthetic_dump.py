@@ -0,0 +1,287 @@
+"""
+Writes synthetic ORCID dumps for benchmarking.
+
+The files follow the layout and namespaces of a real ORCID download (person.xml,
+works/, affiliations/*, fundings/, peer_reviews/) with the quirks the parser has
+to deal with: works without dates or external IDs, several IDs per work, empty
+contributors, shouted duplicate titles and preprint/article pairs.
+
+    python benchmarks/synthetic_dump.py out_dir --works 2000 --duplicate-pairs 100
+"""
+
+import argparse
+import os
+import random
+import shutil
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+NAMESPACES = " ".join(
+    f'xmlns:{ns}="http://www.orcid.org/ns/{ns}"'
+    for ns in (
+        "common",
+        "work",
+        "person",
+        "personal-details",
+        "researcher-url",
+        "email",
+        "employment",
+        "education",
+        "service",
+        "funding",
+        "peer-review",
+    )
+)
+HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+ORCID_ID = "0000-0002-6806-3302"
+SELF_NAME = "Charles M. Greenspon"
+WORDS = (
+    "neural coding touch cortex stimulation brain interface texture vibration "
+    "somatosensory model dynamics population encoding decoding primate hand "
+    "afferent feedback prosthesis of in the and with for"
+).split()
+GIVEN = ["Sliman J.", "Giacomo", "Natalya D.", "Thierri", "Řehoř", "Anna", "John", "Maria"]
+FAMILY = ["Bensmaia", "Valle", "Shelchkova", "Callier", "Novák", "Smith", "Doe", "García"]
+JOURNALS = ["Nature", "eLife", "J Neurosci &amp; Co", "Neuron", "PNAS", "Science"]
+ISSNS = ["2050-084X", "0270-6474", "1097-6256", "0896-6273", "0027-8424", "0036-8075"]
+# Work types roughly in the proportions of a real profile
+WORK_TYPES = (
+    ["journal-article"] * 6
+    + ["preprint"] * 2
+    + ["conference-presentation", "public-speech", "software", "book-chapter"]
+)
+
+
+def _write(path: str, body: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER + body)
+
+
+def _person() -> str:
+    return f"""<person:person path="/{ORCID_ID}/person" {NAMESPACES}>
+  <person:name path="{ORCID_ID}" visibility="public">
+    <personal-details:given-names>Charles M.</personal-details:given-names>
+    <personal-details:family-name>Greenspon</personal-details:family-name>
+  </person:name>
+  <researcher-url:researcher-urls>
+    <researcher-url:researcher-url put-code="1"><researcher-url:url-name>GitHub</researcher-url:url-name><researcher-url:url>https://github.com/example</researcher-url:url></researcher-url:researcher-url>
+    <researcher-url:researcher-url put-code="2"><researcher-url:url-name>Google Scholar</researcher-url:url-name><researcher-url:url>https://scholar.google.com/example</researcher-url:url></researcher-url:researcher-url>
+  </researcher-url:researcher-urls>
+  <email:emails>
+    <email:email primary="true" verified="true"><email:email>someone@example.edu</email:email></email:email>
+  </email:emails>
+</person:person>"""
+
+
+def _contributor(name: str, with_orcid: bool) -> str:
+    orcid = (
+        f"<common:contributor-orcid><common:uri>https://orcid.org/{ORCID_ID}</common:uri>"
+        f"<common:path>{ORCID_ID}</common:path><common:host>orcid.org</common:host>"
+        "</common:contributor-orcid>"
+        if with_orcid
+        else ""
+    )
+    return (
+        f"<work:contributor>{orcid}<work:credit-name>{escape(name)}</work:credit-name>"
+        "<work:contributor-attributes><work:contributor-sequence>additional"
+        "</work:contributor-sequence></work:contributor-attributes></work:contributor>"
+    )
+
+
+def _external_ids(rnd: random.Random, doi: str) -> str:
+    def eid(id_type: str, value: str) -> str:
+        return (
+            f"<common:external-id><common:external-id-type>{id_type}</common:external-id-type>"
+            f"<common:external-id-value>{value}</common:external-id-value>"
+            "<common:external-id-relationship>self</common:external-id-relationship>"
+            "</common:external-id>"
+        )
+
+    r = rnd.random()
+    if r < 0.4:
+        ids = eid("doi", doi)
+    elif r < 0.7:
+        ids = eid("doi", doi) + eid("pmid", str(rnd.randint(1, 99999)))
+    elif r < 0.8:
+        ids = eid("pmid", str(rnd.randint(1, 99999)))
+    elif r < 0.85:
+        return "<common:external-ids/>"
+    else:
+        return ""
+    return f"<common:external-ids>{ids}</common:external-ids>"
+
+
+def _work(rnd: random.Random, put_code: int, work_type: str, title: str, doi: str, authors: List[str]) -> str:
+    date = ""
+    if rnd.random() < 0.95:
+        month = f"<common:month>{rnd.randint(1, 12):02d}</common:month>" if rnd.random() < 0.7 else ""
+        date = f"<common:publication-date><common:year>{rnd.randint(2010, 2025)}</common:year>{month}</common:publication-date>"
+    journal = f"<work:journal-title>{rnd.choice(JOURNALS)}</work:journal-title>" if rnd.random() < 0.8 else ""
+    subtitle = "<common:subtitle>A subtitle</common:subtitle>" if rnd.random() < 0.3 else ""
+    url = f"<common:url>https://doi.org/{doi}</common:url>"
+    contributors = "".join(
+        _contributor(a, a == SELF_NAME and rnd.random() < 0.5) for a in authors
+    )
+    if rnd.random() < 0.05:
+        contributors += "<work:contributor/>"
+    return f"""<work:work put-code="{put_code}" path="/{ORCID_ID}/work/{put_code}" visibility="public" {NAMESPACES}>
+    <common:created-date>2020-01-01T00:00:00.000Z</common:created-date>
+    <common:source><common:source-orcid><common:path>{ORCID_ID}</common:path></common:source-orcid></common:source>
+    <work:title><common:title>{escape(title)}</common:title>{subtitle}</work:title>
+    {journal}
+    <work:citation><work:citation-type>bibtex</work:citation-type><work:citation-value>@article{{x, title={{a}}}}</work:citation-value></work:citation>
+    <work:type>{work_type}</work:type>
+    {date}
+    {_external_ids(rnd, doi)}
+    {url}
+    <work:contributors>{contributors}</work:contributors>
+</work:work>"""
+
+
+def _affiliation(rnd: random.Random, tag: str, put_code: int, index: int) -> str:
+    start = 2005 + index * 2
+    end = f"<common:end-date><common:year>{start + rnd.randint(1, 4)}</common:year></common:end-date>" if index else ""
+    department = "<common:department-name>Organismal Biology</common:department-name>" if rnd.random() < 0.7 else ""
+    role = "Advisor" if tag == "service" and index % 2 == 0 else rnd.choice(["Postdoc", "Fellow", "Scientist"])
+    return f"""<{tag}:{tag} put-code="{put_code}" {NAMESPACES}>
+  {department}
+  <common:role-title>{role} {index}</common:role-title>
+  <common:start-date><common:year>{start}</common:year><common:month>01</common:month></common:start-date>
+  {end}
+  <common:organization><common:name>University of Chicago</common:name><common:address><common:city>Chicago</common:city></common:address></common:organization>
+</{tag}:{tag}>"""
+
+
+def _funding(put_code: int, index: int) -> str:
+    return f"""<funding:funding put-code="{put_code}" {NAMESPACES}>
+  <funding:type>grant</funding:type>
+  <funding:organization-defined-type>PI</funding:organization-defined-type>
+  <funding:title><common:title>Grant {index}</common:title></funding:title>
+  <common:external-ids><common:external-id><common:external-id-type>grant_number</common:external-id-type><common:external-id-value>R01-{index}</common:external-id-value></common:external-id></common:external-ids>
+  <common:start-date><common:year>{2015 + index % 10}</common:year></common:start-date>
+  <common:organization><common:name>NIH</common:name></common:organization>
+</funding:funding>"""
+
+
+def _review(put_code: int, year: int, issn: str) -> str:
+    return f"""<peer-review:peer-review put-code="{put_code}" {NAMESPACES}>
+  <peer-review:reviewer-role>reviewer</peer-review:reviewer-role>
+  <peer-review:review-type>review</peer-review:review-type>
+  <peer-review:review-completion-date><common:year>{year}</common:year></peer-review:review-completion-date>
+  <peer-review:review-group-id>issn:{issn}</peer-review:review-group-id>
+</peer-review:peer-review>"""
+
+
+def write_dump(
+    root: str,
+    n_works: int = 100,
+    authors_per_work: int = 6,
+    duplicate_pairs: int = 10,
+    n_affiliations: int = 3,
+    n_fundings: int = 3,
+    n_reviews: int = 20,
+    n_journals: int = 3,
+    seed: int = 0,
+) -> Dict[str, List[str]]:
+    """
+    Writes a synthetic dump into `root`, replacing anything there.
+
+    `n_works` counts every work file, including the second copy of each of the
+    `duplicate_pairs` preprint/article pairs. Each work has up to twice
+    `authors_per_work` authors. `n_affiliations` records are written to each of
+    employments, educations and services, and the `n_reviews` peer reviews are
+    spread over `n_journals` ISSNs.
+
+    Returns the preprint URLs and ISSNs the parser will try to look up, so that
+    a benchmark can answer them from the lookup cache instead of the network.
+    """
+    rnd = random.Random(seed)
+    shutil.rmtree(root, ignore_errors=True)
+    _write(os.path.join(root, "person.xml"), _person())
+
+    coauthors = [f"{g} {f}" for g in GIVEN for f in FAMILY]
+    preprints: List[str] = []
+    originals: List[tuple] = []
+    duplicate_pairs = min(duplicate_pairs, n_works // 2)
+    for i in range(n_works):
+        put_code = 100000 + i
+        if i >= n_works - duplicate_pairs:
+            # The other half of a preprint/article pair, sometimes retitled in capitals
+            title, doi, authors = originals[i - (n_works - duplicate_pairs)]
+            work_type = "journal-article"
+            doi = doi + ".v2"
+            if rnd.random() < 0.5:
+                title = title.upper() + "!"
+        else:
+            title = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(6, 14))).capitalize()
+            doi = f"10.1101/{rnd.randint(1000000, 9999999)}"
+            n_authors = rnd.randint(0, 2 * authors_per_work)
+            authors = rnd.sample(coauthors, min(n_authors, len(coauthors)))
+            if authors and rnd.random() < 0.8:
+                authors[rnd.randrange(len(authors))] = SELF_NAME
+            work_type = "preprint" if i < duplicate_pairs else rnd.choice(WORK_TYPES)
+            originals.append((title, doi, authors))
+        if work_type == "preprint":
+            preprints.append(f"https://doi.org/{doi}")
+        _write(
+            os.path.join(root, "works", f"{put_code}.xml"),
+            _work(rnd, put_code, work_type, title, doi, authors),
+        )
+
+    for folder, tag in (
+        ("employments", "employment"),
+        ("educations", "education"),
+        ("services", "service"),
+    ):
+        for j in range(n_affiliations):
+            put_code = 200000 + j
+            _write(
+                os.path.join(root, "affiliations", folder, f"{put_code}.xml"),
+                _affiliation(rnd, tag, put_code, j),
+            )
+
+    for j in range(n_fundings):
+        put_code = 300000 + j
+        _write(os.path.join(root, "fundings", f"{put_code}.xml"), _funding(put_code, j))
+
+    issns = (ISSNS * (n_journals // len(ISSNS) + 1))[:n_journals]
+    issns = [issn if k < len(ISSNS) else f"{9000 + k:04d}-{k % 10000:04d}" for k, issn in enumerate(issns)]
+    for j in range(n_reviews):
+        put_code = 400000 + j
+        _write(
+            os.path.join(root, "peer_reviews", f"{put_code}.xml"),
+            _review(put_code, 2015 + j % 10, issns[j % len(issns)] if issns else ""),
+        )
+
+    return {"preprints": preprints, "issns": issns if n_reviews else []}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic ORCID dump.")
+    parser.add_argument("root", help="folder to write the dump into (replaced)")
+    parser.add_argument("--works", type=int, default=100)
+    parser.add_argument("--authors-per-work", type=int, default=6)
+    parser.add_argument("--duplicate-pairs", type=int, default=10)
+    parser.add_argument("--affiliations", type=int, default=3)
+    parser.add_argument("--fundings", type=int, default=3)
+    parser.add_argument("--reviews", type=int, default=20)
+    parser.add_argument("--journals", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_dump(
+        args.root,
+        n_works=args.works,
+        authors_per_work=args.authors_per_work,
+        duplicate_pairs=args.duplicate_pairs,
+        n_affiliations=args.affiliations,
+        n_fundings=args.fundings,
+        n_reviews=args.reviews,
+        n_journals=args.journals,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
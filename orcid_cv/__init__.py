@@ -1,19 +1,28 @@
 # Public API of orcid_cv package
 
+from typing import Any
+
 from orcid_cv.utils import (
     package_directory,
     initialize_name,
     initalize_name,
     embolden_authors,
     is_self_author,
+    author_matcher,
+    compile_author_matcher,
+    person_orcid,
     add_equal_author,
     get_recursive_key,
+    compile_path,
     dict_to_list,
+    resolve_workers,
 )
 
-from orcid_cv.config import make_document_config, BACKENDS
+from orcid_cv.config import make_document_config, BACKENDS, SECTION_LAYOUTS
 
 from orcid_cv.parser import (
+    ENGINES,
+    NEAR_DUPLICATE_THRESHOLD,
     load_xml,
     list_works,
     load_affiliation,
@@ -23,10 +32,21 @@ from orcid_cv.parser import (
     find_preprint_repository,
     load_funding,
     load_review,
+    parse_review,
+    resolve_review_journals,
     extract_orcid_info,
     folder_to_dict,
 )
 
+from orcid_cv.dedup import DedupIndex
+from orcid_cv.normalize import canonical_doi, work_keys
+from orcid_cv.records import Affiliation, Funding, Record, Review, Work, json_default
+from orcid_cv.workmap import WorkMap, work_map
+from orcid_cv.authors import AuthorTable
+from orcid_cv.cache import CACHE_FORMATS, SectionedCache, export_json
+from orcid_cv.lookups import LookupCache, get_lookup_cache
+from orcid_cv.icons import ICON_DIRECTORY, icon_path, icon_paths
+
 from orcid_cv.content import (
     prepare_person,
     prepare_affiliations,
@@ -54,9 +74,12 @@ from orcid_cv.builder import (
     add_funding_section,
     add_review_section,
     build_document,
+    add_standard_sections,
     quick_build,
 )
 
+from orcid_cv.variants import Variant, render_variants
+
 # The typst backend is reached through the functions above by passing
 # backend="typst" to make_document_config; the module is exposed for direct use.
 from orcid_cv import typst_builder
@@ -72,11 +95,19 @@ __all__ = [
     "initalize_name",
     "embolden_authors",
     "is_self_author",
+    "author_matcher",
+    "compile_author_matcher",
+    "person_orcid",
     "add_equal_author",
     "get_recursive_key",
+    "compile_path",
     "dict_to_list",
+    "resolve_workers",
     "make_document_config",
     "BACKENDS",
+    "SECTION_LAYOUTS",
+    "ENGINES",
+    "NEAR_DUPLICATE_THRESHOLD",
     "load_xml",
     "list_works",
     "load_affiliation",
@@ -86,8 +117,30 @@ __all__ = [
     "find_preprint_repository",
     "load_funding",
     "load_review",
+    "parse_review",
+    "resolve_review_journals",
     "extract_orcid_info",
     "folder_to_dict",
+    "DedupIndex",
+    "canonical_doi",
+    "work_keys",
+    "Record",
+    "Work",
+    "Affiliation",
+    "Funding",
+    "Review",
+    "json_default",
+    "WorkMap",
+    "work_map",
+    "AuthorTable",
+    "CACHE_FORMATS",
+    "SectionedCache",
+    "export_json",
+    "LookupCache",
+    "get_lookup_cache",
+    "ICON_DIRECTORY",
+    "icon_path",
+    "icon_paths",
     "prepare_person",
     "prepare_affiliations",
     "prepare_service",
@@ -111,9 +164,24 @@ __all__ = [
     "add_funding_section",
     "add_review_section",
     "build_document",
+    "add_standard_sections",
     "quick_build",
+    "Variant",
+    "render_variants",
+    "bulk_build",
+    "find_dumps",
     "typst_builder",
     "assemble_source",
     "SimpleDocTemplate",
     "letter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # orcid_cv.bulk is also run as a script (python -m orcid_cv.bulk), so it is
+    # only imported once one of its functions is asked for
+    if name in ("bulk_build", "find_dumps"):
+        from orcid_cv import bulk
+
+        return getattr(bulk, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,70 @@
+"""
+Author names as they are shown in a CV.
+
+The same co-authors appear on most of a researcher's works, and every work
+section of every document variant shows them again. `AuthorTable` works out
+the displayed form of each distinct author string, and whether it is the CV's
+owner, once per profile and hands back the same interned entry every time the
+string comes up again.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from orcid_cv.utils import AuthorMatcher, initialize_name
+
+# Author entries are (name, is_the_cv_owner) pairs.
+Author = Tuple[str, bool]
+
+# Characters that ORCID hands back in author names which look wrong in a CV.
+AUTHOR_CHAR_FIXES = str.maketrans(
+    {
+        "‐": "-",  # Unicode hyphen -> ascii hyphen
+        "ř": "r",
+    }
+)
+
+
+class AuthorTable:
+    """
+    Author entries of one profile, keyed by raw author string and contributor
+    ORCID iD. Edited names (e.g. by `add_equal_author`) are simply new strings,
+    so the table never goes stale.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        # (initialize, owner matcher) -> (raw name, ORCID iD) -> entry
+        self._entries: Dict[
+            Tuple[bool, Optional[AuthorMatcher]], Dict[Tuple[str, str], Author]
+        ] = {}
+
+    def authors(
+        self,
+        names: Iterable[str],
+        orcids: Sequence[str] = (),
+        initialize: bool = False,
+        is_owner: Optional[AuthorMatcher] = None,
+    ) -> List[Author]:
+        """
+        The entries of a work's authors. Names are initialized if asked to and
+        owner flags come from `is_owner`, given the name and the contributor
+        ORCID iD in `orcids` at the same position; without it no one is flagged.
+        """
+        entries = self._entries.get((initialize, is_owner))
+        if entries is None:
+            entries = self._entries[(initialize, is_owner)] = {}
+
+        out = []
+        for i, raw in enumerate(names):
+            orcid = orcids[i] if i < len(orcids) else ""
+            entry = entries.get((raw, orcid))
+            if entry is None:
+                name = initialize_name(raw) if initialize else raw
+                entry = entries[(raw, orcid)] = (
+                    sys.intern(name.translate(AUTHOR_CHAR_FIXES)),
+                    is_owner is not None and is_owner(name, orcid),
+                )
+            out.append(entry)
+        return out
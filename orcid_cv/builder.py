@@ -1,13 +1,16 @@
+import io
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Union
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple, Union
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import Paragraph, Spacer, Table, SimpleDocTemplate, Image
+from reportlab.platypus import Paragraph, Spacer, Table, LongTable, SimpleDocTemplate, Image
 
-from orcid_cv.utils import package_directory
+from orcid_cv.config import SECTION_LAYOUTS
+from orcid_cv.icons import ICON_DIRECTORY, embed_icon, icon_path, icon_reader, is_icon
+from orcid_cv.styles import CellParagraph
 from orcid_cv.content import (
     join_authors,
     prepare_affiliations,
@@ -20,6 +23,11 @@ from orcid_cv.parser import extract_orcid_info
 
 logger = logging.getLogger("orcid_cv")
 
+# Entries per table in the "table" section layout. Every page break splits a
+# table and carries all its style commands over to the rest, so long sections
+# are cut into tables of this many entries to keep that work bounded.
+SECTION_TABLE_ENTRIES = 20
+
 
 def _typst_delegate(config: Dict[str, Any], function_name: str):
     """
@@ -34,7 +42,11 @@ def _typst_delegate(config: Dict[str, Any], function_name: str):
 
 
 class HyperlinkedImage(Image, object):
-    """An Image subclass that overlays a clickable hyperlink on the rendered PDF canvas."""
+    """
+    An Image subclass that overlays a clickable hyperlink on the rendered PDF
+    canvas. Link icons from `orcid_cv.icons` are decoded and encoded once per
+    process rather than once per document.
+    """
 
     def __init__(
         self,
@@ -50,6 +62,13 @@ class HyperlinkedImage(Image, object):
             filename, width, height, kind, mask, lazy
         )
         self.hyperlink = hyperlink
+        if isinstance(filename, str) and is_icon(filename):
+            self._img = icon_reader(filename)
+
+    def draw(self) -> None:
+        if isinstance(self.filename, str) and is_icon(self.filename):
+            embed_icon(self.canv, self.filename, self._mask)
+        super(HyperlinkedImage, self).draw()
 
     def drawOn(self, canvas: canvas.Canvas, x: float, y: float, _sW: float = 0) -> None:
         if self.hyperlink:
@@ -63,37 +82,64 @@ class HyperlinkedImage(Image, object):
         super(HyperlinkedImage, self).drawOn(canvas, x, y, _sW)
 
 
+class SectionTable(LongTable):
+    """
+    A LongTable for a whole section. Its column widths are fixed, so a row is as
+    high on every page, yet reportlab measures the rows of a table again every
+    time it is wrapped or split. Measured heights are kept here and handed on
+    to the parts a split produces, so each row is measured once.
+    """
+
+    def _calc_height(self, availHeight, availWidth, H=None, W=None):
+        super()._calc_height(availHeight, availWidth, H=H, W=W)
+        self._argH = list(self._rowHeights)
+
+
 class FooterCanvas(canvas.Canvas):
-    """Custom canvas that captures page attributes to draw a 'Page X of Y' footer on save."""
+    """
+    Canvas that draws a 'Page X of Y' footer with today's date on every page as
+    it is finished. The page count is not known until the end, so each footer
+    only refers to a form XObject holding it, which `save` draws once all pages
+    are done. Pages are written out as they go and the document is laid out in
+    a single pass.
+    """
 
     left_str: str = ""
+    # Name of the form XObject holding the total page count
+    page_count_form = "pageCount"
 
     def __init__(self, *args, **kwargs):
         super(FooterCanvas, self).__init__(*args, **kwargs)
-        self.pages = []
+        self.date_str = datetime.today().strftime("%d-%b-%Y")
+        self.page_count = 0
 
     def showPage(self) -> None:
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
+        self.draw_canvas()
+        self.page_count += 1
+        super(FooterCanvas, self).showPage()
 
     def save(self) -> None:
-        page_count = len(self.pages)
-        for page in self.pages:
-            self.__dict__.update(page)
-            self.draw_canvas(page_count)
-            super(FooterCanvas, self).showPage()
+        if len(self._code):
+            self.showPage()
+        self.beginForm(self.page_count_form)
+        self.setFont("Helvetica", 9)
+        self.drawString(0, 0, str(self.page_count))
+        self.endForm()
         super(FooterCanvas, self).save()
 
-    def draw_canvas(self, page_count: int) -> None:
-        page_str = f"Page {self._pageNumber} of {page_count}"
+    def draw_canvas(self) -> None:
+        page_str = f"Page {self._pageNumber} of "
+        x = letter[0] - 90
         y = 40
         self.saveState()
         self.setStrokeColorRGB(0, 0, 0)
         self.setLineWidth(0.5)
         self.line(40, y + 10, letter[0] - 40, y + 10)
         self.setFont("Helvetica", 9)
-        self.drawString(letter[0] - 90, y, page_str)
-        self.drawString(40, y, datetime.today().strftime("%d-%b-%Y"))
+        self.drawString(x, y, page_str)
+        self.drawString(40, y, self.date_str)
+        self.translate(x + self.stringWidth(page_str, "Helvetica", 9), y)
+        self.doForm(self.page_count_form)
         self.restoreState()
 
 
@@ -153,17 +199,72 @@ def make_review_table(
     return config["renderer"].make_review_table(r, section_heading)
 
 
+def _section_tables(config: Dict[str, Any]) -> bool:
+    """Whether the config lays sections out as whole tables; see `_add_section_tables`."""
+    layout = config.get("section_layout", "entries")
+    if layout not in SECTION_LAYOUTS:
+        raise ValueError(f"Invalid section layout: {layout}. Choose one of {SECTION_LAYOUTS}.")
+    return layout == "table"
+
+
+def _add_section_tables(
+    elements: List[Any],
+    config: Dict[str, Any],
+    section_type: str,
+    heading: str,
+    entries: List[List[List[Any]]],
+) -> None:
+    """
+    Appends a section as a few LongTables, each holding the rows of up to
+    SECTION_TABLE_ENTRIES entries, instead of a table and a spacer per entry.
+    The style commands shared by every entry are given once per table, entries
+    are kept apart by empty rows `item_spacing` high, and NOSPLIT keeps each
+    entry, and the heading with the first one, on a single page as before.
+    """
+    if not entries:
+        return
+
+    _ensure_renderer(config)
+    renderer = config["renderer"]
+    column_widths = get_column_widths(config, section_type)
+    shared_style = renderer.section_style(section_type)
+    for start in range(0, len(entries), SECTION_TABLE_ENTRIES):
+        rows: List[List[Any]] = []
+        table_style = list(shared_style)
+        gaps = []
+        if start == 0:
+            rows.extend(renderer.heading_rows(heading))
+            table_style.extend(renderer.heading_style())
+
+        for i, entry_rows in enumerate(entries[start : start + SECTION_TABLE_ENTRIES]):
+            if i:
+                gaps.append(len(rows))
+                rows.append([[]] * len(column_widths))
+            first = 0 if start == 0 and i == 0 else len(rows)
+            rows.extend(entry_rows)
+            table_style.append(("NOSPLIT", (0, first), (-1, len(rows) - 1)))
+
+        row_heights: List[Any] = [None] * len(rows)
+        for row in gaps:
+            row_heights[row] = config["item_spacing"]
+        t = SectionTable(rows, colWidths=column_widths, rowHeights=row_heights)
+        t.setStyle(table_style)
+        elements.append(t)
+        elements.append(Spacer(0, config["item_spacing"]))
+
+
 def process_external_links(link_dict: Dict[str, str]) -> List[HyperlinkedImage]:
     """Converts a dictionary of website titles and URLs into hyperlinked image flowables."""
     link_list = []
     for k, v in link_dict.items():
-        im_path = os.path.join(package_directory, "external_link_img", f"{k}.png")
-        if os.path.exists(im_path):
+        im_path = icon_path(k)
+        if im_path is not None:
             link_list.append(
                 HyperlinkedImage(im_path, hyperlink=v, height=15, width=15)
             )
         else:
-            logger.warning(f"External link image missing at {im_path}")
+            missing = os.path.join(ICON_DIRECTORY, f"{k}.png")
+            logger.warning(f"External link image missing at {missing}")
     return link_list
 
 
@@ -191,9 +292,16 @@ def add_affiliation_section(
     if typst:
         return typst(elements, orcid_dict, config, heading, affiliation_type)
 
-    column_widths = get_column_widths(config, "affiliation")
     affiliations = prepare_affiliations(orcid_dict, affiliation_type)
+    if _section_tables(config):
+        _ensure_renderer(config)
+        rows = config["renderer"].affiliation_rows
+        _add_section_tables(
+            elements, config, "affiliation", heading, [rows(af) for af in affiliations]
+        )
+        return
 
+    column_widths = get_column_widths(config, "affiliation")
     is_heading = True
     for af in affiliations:
         if is_heading:
@@ -231,9 +339,16 @@ def add_service_section(
             elements, orcid_dict, config, heading, match=match, exclude=exclude
         )
 
-    column_widths = get_column_widths(config, "affiliation")
     services = prepare_service(orcid_dict, match=match, exclude=exclude)
+    if _section_tables(config):
+        _ensure_renderer(config)
+        rows = config["renderer"].affiliation_rows
+        _add_section_tables(
+            elements, config, "affiliation", heading, [rows(sv) for sv in services]
+        )
+        return
 
+    column_widths = get_column_widths(config, "affiliation")
     is_heading = True
     for sv in services:
         if is_heading:
@@ -250,6 +365,27 @@ def add_service_section(
         elements.append(Spacer(0, config["item_spacing"]))
 
 
+def _work_body(config: Dict[str, Any], work: Dict[str, Any]) -> Paragraph:
+    """The journal, link and author lines of a prepared work entry."""
+    author_cat = join_authors(work["authors"], bold=lambda name: f"<b>{name}</b>")
+
+    # Process DOI/link
+    link = work["link"]
+    if link is None:
+        work_str = work["journal"]
+    else:
+        anchor = (
+            f'<link href="{link["url"]}">{link["prefix"]}'
+            f'<u>{link["label"]} </u></link>'
+        )
+        work_str = f'{work["journal"]}, {anchor}'
+
+    if work["subtitle"]:
+        work_str = f'{work_str}, {work["subtitle"]}'
+
+    return CellParagraph(f"{work_str}<br/>{author_cat}", style=config["item_body_style"])
+
+
 def add_work_section(
     elements: List[Any],
     orcid_dict: Dict[str, Any],
@@ -262,33 +398,25 @@ def add_work_section(
     if typst:
         return typst(elements, orcid_dict, config, heading, search_str)
 
-    column_widths = get_column_widths(config, "work")
     works = prepare_works(orcid_dict, config, search_str)
+    if _section_tables(config):
+        _ensure_renderer(config)
+        rows = config["renderer"].work_rows
+        _add_section_tables(
+            elements,
+            config,
+            "work",
+            heading,
+            [rows(work["title"], _work_body(config, work), work["date"]) for work in works],
+        )
+        return
 
+    column_widths = get_column_widths(config, "work")
     is_heading = True
     for work in works:
         work_title = work["title"]
         work_date = work["date"]
-
-        author_cat = join_authors(work["authors"], bold=lambda name: f"<b>{name}</b>")
-
-        # Process DOI/link
-        link = work["link"]
-        if link is None:
-            work_str = work["journal"]
-        else:
-            anchor = (
-                f'<link href="{link["url"]}">{link["prefix"]}'
-                f'<u>{link["label"]} </u></link>'
-            )
-            work_str = f'{work["journal"]}, {anchor}'
-
-        if work["subtitle"]:
-            work_str = f'{work_str}, {work["subtitle"]}'
-
-        work_body = Paragraph(
-            f"{work_str}<br/>{author_cat}", style=config["item_body_style"]
-        )
+        work_body = _work_body(config, work)
 
         if is_heading:
             table_data, table_style = make_work_table(
@@ -317,9 +445,16 @@ def add_funding_section(
     if typst:
         return typst(elements, orcid_dict, config, heading)
 
-    column_widths = get_column_widths(config, "affiliation")
     fund = prepare_funding(orcid_dict)
+    if _section_tables(config):
+        _ensure_renderer(config)
+        rows = config["renderer"].funding_rows
+        _add_section_tables(
+            elements, config, "affiliation", heading, [rows(f) for f in fund]
+        )
+        return
 
+    column_widths = get_column_widths(config, "affiliation")
     is_heading = True
     for f in fund:
         if is_heading:
@@ -360,19 +495,27 @@ def add_review_section(
         sk.append("")
         review_dict[""] = 0
 
+    pairs = [
+        (sk[i], review_dict[sk[i]], sk[i + 1], review_dict[sk[i + 1]])
+        for i in range(0, len(sk), 2)
+    ]
+    if _section_tables(config):
+        _ensure_renderer(config)
+        rows = config["renderer"].review_rows
+        _add_section_tables(
+            elements, config, "review", heading, [rows(pair) for pair in pairs]
+        )
+        return
+
     is_heading = True
-    for i in range(0, len(sk), 2):
+    for pair in pairs:
         if is_heading:
             table_data, table_style = make_review_table(
-                config,
-                (sk[i], review_dict[sk[i]], sk[i + 1], review_dict[sk[i + 1]]),
-                section_heading=heading,
+                config, pair, section_heading=heading
             )
             is_heading = False
         else:
-            table_data, table_style = make_review_table(
-                config, (sk[i], review_dict[sk[i]], sk[i + 1], review_dict[sk[i + 1]])
-            )
+            table_data, table_style = make_review_table(config, pair)
 
         t = Table(table_data, colWidths=column_widths)
         t.setStyle(table_style)
@@ -381,17 +524,21 @@ def add_review_section(
 
 
 def build_document(
-    output_fname: str,
+    output_fname: Union[str, BinaryIO, None],
     elements: List[Any],
     config: Dict[str, Any],
     title: str = "",
     author: str = "",
     **kwargs: Any,
-) -> Any:
+) -> Optional[bytes]:
     """
     Renders the accumulated elements to `output_fname` with whichever backend the
     config selects, so the same script can target reportlab or typst.
 
+    `output_fname` may also be a binary file-like object to write the PDF to,
+    or None to get the PDF back as bytes; neither touches the disk. Either
+    backend returns the PDF bytes for None and None otherwise.
+
     Set config['page_footer'] = True for a 'Page X of Y' footer with today's date.
     """
     typst = _typst_delegate(config, "build_document")
@@ -403,8 +550,9 @@ def build_document(
     bottom_margin = (
         config["margin"] + 10 if config.get("page_footer") else config["margin"]
     )
+    buffer = io.BytesIO() if output_fname is None else None
     doc = SimpleDocTemplate(
-        output_fname,
+        output_fname if buffer is None else buffer,
         pagesize=config["pagesize"],
         leftMargin=config["margin"],
         rightMargin=config["margin"],
@@ -416,10 +564,25 @@ def build_document(
     )
 
     if config.get("page_footer"):
-        doc.multiBuild(elements, canvasmaker=FooterCanvas)
+        doc.build(elements, canvasmaker=FooterCanvas)
     else:
         doc.build(elements)
-    return None
+    return None if buffer is None else buffer.getvalue()
+
+
+def add_standard_sections(
+    elements: List[Any], orcid_dict: Dict[str, Any], config: Dict[str, Any]
+) -> None:
+    """Appends the default set of sections used by `quick_build`."""
+    add_person_section(elements, orcid_dict, config)
+    add_affiliation_section(elements, orcid_dict, config, "Employment", "employment")
+    add_affiliation_section(elements, orcid_dict, config, "Education", "education")
+    add_work_section(
+        elements, orcid_dict, config, "Research Publications", "journal-article"
+    )
+    add_work_section(elements, orcid_dict, config, "Talks", "public-speech")
+    add_work_section(elements, orcid_dict, config, "Preprints", "preprint")
+    add_service_section(elements, orcid_dict, config, "Mentorship & Service")
 
 
 def quick_build(
@@ -439,15 +602,7 @@ def quick_build(
 
     fullname = orcid_dict["personal"]["fullname"]
     elements: List[Any] = []
-    add_person_section(elements, orcid_dict, config)
-    add_affiliation_section(elements, orcid_dict, config, "Employment", "employment")
-    add_affiliation_section(elements, orcid_dict, config, "Education", "education")
-    add_work_section(
-        elements, orcid_dict, config, "Research Publications", "journal-article"
-    )
-    add_work_section(elements, orcid_dict, config, "Talks", "public-speech")
-    add_work_section(elements, orcid_dict, config, "Preprints", "preprint")
-    add_service_section(elements, orcid_dict, config, "Mentorship & Service")
+    add_standard_sections(elements, orcid_dict, config)
 
     build_document(
         output_fname, elements, config, title=f"{fullname} - CV", author=fullname
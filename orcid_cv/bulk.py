@@ -0,0 +1,340 @@
+"""
+Building CVs for many researchers in one run.
+
+`bulk_build` takes a folder of ORCID dumps (unpacked folders or zip archives) or
+a manifest listing them, and builds one PDF per dump across a process pool.
+Every finished dump is appended to a checkpoint file as soon as it is done, so
+a run that is interrupted picks up where it stopped when started again. A
+summary of throughput and failures is written at the end.
+
+From the command line:
+
+    python -m orcid_cv.bulk dumps/ cvs/ --workers 8 --backend typst
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from orcid_cv.builder import add_standard_sections, build_document
+from orcid_cv.cache import CACHE_FORMATS
+from orcid_cv.config import BACKENDS, make_document_config
+from orcid_cv.parser import extract_orcid_info
+from orcid_cv.utils import resolve_workers
+
+CHECKPOINT_NAME = "bulk_checkpoint.jsonl"
+SUMMARY_NAME = "bulk_summary.json"
+
+# (dump, output file) of one CV to build
+Job = Tuple[str, str]
+
+
+def _is_dump(path: str) -> bool:
+    if os.path.isdir(path):
+        return os.path.isfile(os.path.join(path, "person.xml"))
+    return path.lower().endswith(".zip") and os.path.isfile(path)
+
+
+def find_dumps(source: str) -> List[str]:
+    """
+    Lists the dumps to build from a folder holding them (sorted by name), or from
+    a manifest file with one dump path per line. Blank lines and lines starting
+    with '#' are ignored and relative paths are taken from the manifest's folder.
+    """
+    if os.path.isdir(source):
+        return [
+            os.path.join(source, name)
+            for name in sorted(os.listdir(source))
+            if _is_dump(os.path.join(source, name))
+        ]
+
+    base = os.path.dirname(os.path.abspath(source))
+    dumps = []
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                dumps.append(os.path.join(base, line))
+    return dumps
+
+
+def output_name(dump: str) -> str:
+    """PDF file name for a dump: its folder or archive name, e.g. 0000-0002-6806-3302.pdf."""
+    name = os.path.basename(os.path.normpath(dump))
+    if name.lower().endswith(".zip"):
+        name = name[:-4]
+    return name + ".pdf"
+
+
+def output_names(dumps: List[str]) -> Dict[str, str]:
+    """
+    PDF file name of every dump, as `output_name` gives it unless two dumps
+    would share it (same folder name in different places): those also get a
+    short hash of their path, e.g. 0000-0002-6806-3302-1a2b3c4d.pdf, which
+    stays the same from one run to the next.
+    """
+    names = {dump: output_name(dump) for dump in dumps}
+    counts = Counter(name.lower() for name in names.values())
+    for dump, name in names.items():
+        if counts[name.lower()] > 1:
+            digest = hashlib.sha1(os.path.abspath(dump).encode("utf-8")).hexdigest()[:8]
+            names[dump] = f"{name[:-4]}-{digest}.pdf"
+    return names
+
+
+def build_cv(
+    orcid_dir: str,
+    output_fname: str,
+    style: str = "greenspon-default",
+    backend: str = "reportlab",
+    cache_format: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Parses one dump and renders the `quick_build` layout from it. Returns a
+    record of what was done, as stored in the checkpoint.
+    """
+    start = time.perf_counter()
+    orcid_dict = extract_orcid_info(orcid_dir, cache_format=cache_format)
+    parsed = time.perf_counter()
+
+    config = make_document_config(style, backend=backend)
+    fullname = orcid_dict["personal"]["fullname"]
+    elements: List[Any] = []
+    add_standard_sections(elements, orcid_dict, config)
+    build_document(
+        output_fname, elements, config, title=f"{fullname} - CV", author=fullname
+    )
+    end = time.perf_counter()
+
+    return {
+        "output": output_fname,
+        "parse_s": round(parsed - start, 3),
+        "render_s": round(end - parsed, 3),
+    }
+
+
+def _failure(dump: str, e: BaseException) -> Dict[str, Any]:
+    return {
+        "dump": dump,
+        "status": "failed",
+        "error": "".join(traceback.format_exception_only(type(e), e)).strip(),
+    }
+
+
+def _build_job(dump: str, output_fname: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs in a worker: builds one CV and reports failure instead of raising."""
+    start = time.perf_counter()
+    try:
+        record = {"dump": dump, "status": "ok", **build_cv(dump, output_fname, **options)}
+    except Exception as e:
+        record = _failure(dump, e)
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _build_alone(job: Job, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds one CV in a pool of its own, so a worker dying only fails that CV."""
+    with ProcessPoolExecutor(1) as executor:
+        try:
+            return executor.submit(_build_job, *job, options).result()
+        except Exception as e:
+            return {**_failure(job[0], e), "seconds": 0.0}
+
+
+def _pool_round(jobs: List[Job], workers: int, options: Dict[str, Any], record) -> List[Job]:
+    """
+    Builds `jobs` over a process pool, recording every result. A worker that
+    dies (out of memory, a crash in native code) takes the pool down with every
+    job still waiting. The pool takes jobs in order and holds at most
+    `workers` + 1 at a time, so the one to blame is among the first of those
+    left: they are built again one pool each, the culprit being recorded as
+    failed, and the rest are returned for a new pool.
+    """
+    def finish(future: Future, job: Job) -> None:
+        error = future.exception()
+        record(future.result() if error is None else _failure(job[0], error))
+
+    handled: Set[Future] = set()
+    broken = False
+    with ProcessPoolExecutor(workers) as executor:
+        job_of = {executor.submit(_build_job, *job, options): job for job in jobs}
+        try:
+            for future in as_completed(job_of):
+                handled.add(future)
+                if isinstance(future.exception(), BrokenProcessPool):
+                    broken = True
+                    break
+                finish(future, job_of[future])
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # Once the pool is down every job has an outcome, in submission order here
+    left = []
+    for future, job in job_of.items():
+        if isinstance(future.exception(), BrokenProcessPool):
+            left.append(job)
+        elif future not in handled:
+            finish(future, job)
+    if not broken:
+        return []
+
+    print(f"A worker died; rebuilding {min(len(left), workers + 1)} dumps one at a time.")
+    for job in left[: workers + 1]:
+        record(_build_alone(job, options))
+    return left[workers + 1 :]
+
+
+def read_checkpoint(checkpoint_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the latest record for every dump in a checkpoint file. A line cut
+    short by an interrupted run is ignored.
+    """
+    done: Dict[str, Dict[str, Any]] = {}
+    if not os.path.isfile(checkpoint_path):
+        return done
+    with open(checkpoint_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[record["dump"]] = record
+    return done
+
+
+def bulk_build(
+    source: str,
+    output_dir: str,
+    style: str = "greenspon-default",
+    backend: str = "reportlab",
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    summary_path: Optional[str] = None,
+    retry_failed: bool = False,
+    cache_format: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Builds a CV into `output_dir` for every dump `find_dumps(source)` lists, over
+    `workers` processes (None for every core). PDFs are named by
+    `output_names`. A dump whose worker dies is recorded as failed and the run
+    carries on with a fresh pool.
+
+    Dumps already recorded in the checkpoint (default: bulk_checkpoint.jsonl in
+    `output_dir`) are skipped; failed ones too unless `retry_failed`. Returns the
+    run summary, which is also written to `summary_path` (default:
+    bulk_summary.json in `output_dir`).
+
+    On Windows the calling script needs an `if __name__ == "__main__":` guard.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint_path = checkpoint_path or os.path.join(output_dir, CHECKPOINT_NAME)
+    summary_path = summary_path or os.path.join(output_dir, SUMMARY_NAME)
+
+    dumps = [os.path.abspath(d) for d in find_dumps(source)]
+    previous = read_checkpoint(checkpoint_path)
+    todo = [
+        d
+        for d in dumps
+        if d not in previous
+        or (retry_failed and previous[d]["status"] != "ok")
+    ]
+    print(f"{len(dumps)} dumps, {len(dumps) - len(todo)} already done, {len(todo)} to build.")
+
+    options = {"style": style, "backend": backend, "cache_format": cache_format}
+    started = datetime.now()
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    workers = max(1, min(resolve_workers(workers), len(todo) or 1))
+    names = output_names(dumps)
+    jobs = [(d, os.path.join(output_dir, names[d])) for d in todo]
+
+    # Start on a fresh line if the last run was stopped mid-write
+    if os.path.isfile(checkpoint_path) and os.path.getsize(checkpoint_path):
+        with open(checkpoint_path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+
+        def record(result: Dict[str, Any]) -> None:
+            results.append(result)
+            checkpoint.write(json.dumps(result) + "\n")
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+            status = "ok" if result["status"] == "ok" else f"FAILED: {result['error']}"
+            print(f"[{len(results)}/{len(todo)}] {os.path.basename(result['dump'])} {status}")
+
+        if workers == 1:
+            for job in jobs:
+                record(_build_job(*job, options))
+        else:
+            while jobs:
+                jobs = _pool_round(jobs, workers, options, record)
+
+    elapsed = time.perf_counter() - start
+    failures = [r for r in results if r["status"] != "ok"]
+    built = len(results) - len(failures)
+    summary = {
+        "started": started.isoformat(timespec="seconds"),
+        "elapsed_s": round(elapsed, 3),
+        "workers": workers,
+        "dumps": len(dumps),
+        "skipped": len(dumps) - len(todo),
+        "built": built,
+        "failed": len(failures),
+        "cvs_per_minute": round(built / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        "mean_parse_s": _mean(r["parse_s"] for r in results if r["status"] == "ok"),
+        "mean_render_s": _mean(r["render_s"] for r in results if r["status"] == "ok"),
+        "failures": [{"dump": r["dump"], "error": r["error"]} for r in failures],
+    }
+    with open(summary_path, "w", encoding="utf-8") as fp:
+        json.dump(summary, fp, indent=4)
+    print(f"Built {built}, failed {len(failures)} in {elapsed:.1f}s.")
+    return summary
+
+
+def _mean(values) -> float:
+    values = list(values)
+    return round(sum(values) / len(values), 3) if values else 0.0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m orcid_cv.bulk", description="Build CVs for many ORCID dumps."
+    )
+    parser.add_argument("source", help="folder of ORCID dumps, or a manifest file")
+    parser.add_argument("output_dir", help="folder to write the PDFs into")
+    parser.add_argument("--style", default="greenspon-default")
+    parser.add_argument("--backend", default="reportlab", choices=BACKENDS)
+    parser.add_argument("--workers", type=int, default=None, help="default: every core")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file")
+    parser.add_argument("--summary", default=None, help="summary JSON file")
+    parser.add_argument("--retry-failed", action="store_true")
+    parser.add_argument("--cache-format", default=None, choices=list(CACHE_FORMATS))
+    args = parser.parse_args(argv)
+
+    bulk_build(
+        args.source,
+        args.output_dir,
+        style=args.style,
+        backend=args.backend,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        summary_path=args.summary,
+        retry_failed=args.retry_failed,
+        cache_format=args.cache_format,
+    )
+
+
+if __name__ == "__main__":
+    main()
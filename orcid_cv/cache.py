@@ -0,0 +1,282 @@
+"""
+Bookkeeping for the `ORCID.json` cache.
+
+Every XML file that went into the cache is recorded with its size, modification
+time and content hash. A reload compares those against the dump on disk so that
+only files added or edited since are parsed again and removed ones are dropped.
+
+The cache is written either as JSON or as a sectioned binary file: a table of
+offsets followed by each section pickled on its own, so that reading it back
+only decodes the sections that are actually used.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from orcid_cv.dump import Dump
+from orcid_cv.records import json_default, section_records
+from orcid_cv.workmap import WorkMap
+
+# Key under which the per-file records are stored in the cache file. It is
+# stripped from the dictionary handed back to callers.
+SOURCES_KEY = "_sources"
+
+# Relative path (always '/'-separated) -> {"size", "mtime_ns", "sha256", ...}
+Sources = Dict[str, Dict[str, Any]]
+
+# Cache file formats, and the file extension each is written with by default
+CACHE_FORMATS = {"json": ".json", "sections": ".pkl"}
+
+# A sectioned file starts with this magic and the length of the offset table
+_MAGIC = b"ORCIDCV\x01"
+_HEADER = struct.Struct("<8sQ")
+
+
+def file_digest(dump: Dump, rel: str) -> str:
+    """Returns the SHA-256 hex digest of a dump file's contents."""
+    return hashlib.sha256(dump.read(rel)).hexdigest()
+
+
+def scan_sources(dump: Dump, folders: Iterable[str]) -> Sources:
+    """
+    Records the size and mtime of `person.xml` and every XML file directly inside
+    `folders`, without reading any of them.
+    """
+    sources: Sources = {}
+    for folder in ["", *folders]:
+        for rel, (size, mtime_ns) in dump.scan(folder).items():
+            if not folder and rel != "person.xml":
+                continue
+            sources[rel] = {"size": size, "mtime_ns": mtime_ns}
+    return sources
+
+
+def hash_sources(dump: Dump, sources: Sources) -> None:
+    """Fills in the content hash of every scanned file that does not have one yet."""
+    for rel, entry in sources.items():
+        if "sha256" not in entry:
+            entry["sha256"] = file_digest(dump, rel)
+
+
+def diff_sources(
+    dump: Dump, previous: Sources, current: Sources
+) -> Tuple[List[str], List[str]]:
+    """
+    Compares a fresh scan against the records saved with the cache and returns
+    the relative paths that were (added or edited, deleted).
+
+    A file whose size and mtime are unchanged is trusted without reading it. One
+    whose stat changed is hashed, and only counts as edited if its content did.
+    Everything saved for an unchanged file (e.g. which work it was merged into)
+    is carried over into `current`.
+    """
+    changed = []
+    for rel, entry in current.items():
+        saved = previous.get(rel)
+        if (
+            saved
+            and saved.get("size") == entry["size"]
+            and saved.get("mtime_ns") == entry["mtime_ns"]
+        ):
+            current[rel] = {**saved, **entry}
+            continue
+
+        entry["sha256"] = file_digest(dump, rel)
+        if saved and saved.get("sha256") == entry["sha256"]:
+            current[rel] = {**saved, **entry}
+        else:
+            changed.append(rel)
+
+    deleted = [rel for rel in previous if rel not in current]
+    return changed, deleted
+
+
+def load_section(name: str, section: Any) -> Any:
+    """
+    A section as read from a cache, with its entries converted to records (see
+    `section_records`) and the works held in a `WorkMap`, so that the profile
+    handed out keeps the same work dictionary and records for its lifetime.
+    """
+    section = section_records(name, section)
+    if name == "work" and isinstance(section, dict) and not isinstance(section, WorkMap):
+        section = WorkMap(section)
+    return section
+
+
+def _file_stat(fd: int) -> Tuple[int, int, int]:
+    """Identifies the version of an open file, to notice it being replaced."""
+    st = os.fstat(fd)
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class SectionedCache(MutableMapping):
+    """
+    The sections of a sectioned cache file, each unpickled the first time it is
+    looked up. Sections never read are written back byte for byte, so updating
+    one section does not decode the others either.
+
+    The file is only open while a section is read from it, so it can be
+    replaced by a newer cache while this one is still around. Sections not
+    loaded by then can no longer be read from it.
+
+    Only open cache files this package wrote: unpickling runs arbitrary code.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._loaded: Dict[str, Any] = {}
+        self._open()
+
+    def _open(self) -> None:
+        with open(self.path, "rb") as f:
+            magic, table_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a sectioned ORCID cache: {self.path}")
+            table = pickle.loads(f.read(table_size))
+            self._stat = _file_stat(f.fileno())
+        start = _HEADER.size + table_size
+        # Section name -> (offset, length) of its pickle in the file. The per-file
+        # records are kept apart from the sections; see `sources`.
+        self._table: Dict[str, Tuple[int, int]] = {
+            name: (start + offset, length)
+            for name, (offset, length) in table.items()
+            if name not in self._loaded
+        }
+        self._sources_span = self._table.pop(SOURCES_KEY, None)
+
+    def _read(self, span: Tuple[int, int]) -> bytes:
+        offset, length = span
+        with open(self.path, "rb") as f:
+            if _file_stat(f.fileno()) != self._stat:
+                raise ValueError(
+                    f"{self.path} was rewritten since it was loaded; load the cache again."
+                )
+            f.seek(offset)
+            return f.read(length)
+
+    def sources(self) -> Optional[Sources]:
+        """The per-file records saved with the cache."""
+        if self._sources_span is None:
+            return None
+        return pickle.loads(self._read(self._sources_span))
+
+    def raw(self, name: str) -> Optional[bytes]:
+        """The pickled bytes of a section that has not been loaded, else None."""
+        if name in self._loaded or name not in self._table:
+            return None
+        return self._read(self._table[name])
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._loaded:
+            if name not in self._table:
+                raise KeyError(name)
+            self._loaded[name] = load_section(name, pickle.loads(self.raw(name)))
+        return self._loaded[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._loaded[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._loaded.pop(name, None)
+        self._table.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaded or name in self._table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._table, *self._loaded]))
+
+    def __len__(self) -> int:
+        return len(self._table.keys() | self._loaded.keys())
+
+    def __repr__(self) -> str:
+        return f"SectionedCache({self.path!r}, sections={list(self)})"
+
+
+def is_sectioned(path: str) -> bool:
+    """Whether a cache file is in the sectioned binary format."""
+    with open(path, "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+def read_cache(json_path: str) -> Tuple[Dict[str, Any], Optional[Sources]]:
+    """
+    Reads a cache file, JSON or sectioned, and splits off its per-file records.
+    Caches written before those were kept return None for them. A sectioned
+    file comes back as a `SectionedCache` that decodes sections on first use.
+    """
+    if is_sectioned(json_path):
+        cached = SectionedCache(json_path)
+        return cached, cached.sources()
+
+    with open(json_path, encoding="utf-8") as f:
+        cached = json.load(f)
+    sources = cached.pop(SOURCES_KEY, None)
+    for name, section in cached.items():
+        cached[name] = load_section(name, section)
+    return cached, sources
+
+
+def _write_sections(path: str, orcid_dict: Dict[str, Any], sources: Sources) -> None:
+    blobs = []
+    for name in orcid_dict:
+        blob = orcid_dict.raw(name) if isinstance(orcid_dict, SectionedCache) else None
+        if blob is None:
+            blob = pickle.dumps(orcid_dict[name], protocol=pickle.HIGHEST_PROTOCOL)
+        blobs.append((name, blob))
+    blobs.append((SOURCES_KEY, pickle.dumps(sources, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    table, offset = {}, 0
+    for name, blob in blobs:
+        table[name] = (offset, len(blob))
+        offset += len(blob)
+    table_blob = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Written beside the target and swapped in, so a crash never leaves half a
+    # cache. A cache saved over its own file reads the new offsets afterwards.
+    reopen = isinstance(orcid_dict, SectionedCache) and (
+        os.path.abspath(orcid_dict.path) == os.path.abspath(path)
+    )
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(table_blob)))
+            f.write(table_blob)
+            for _, blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+        if reopen:
+            orcid_dict._open()
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_cache(
+    json_path: str, orcid_dict: Dict[str, Any], sources: Sources, cache_format: str = "json"
+) -> None:
+    """Writes the parsed dump and its per-file records to the cache file."""
+    if cache_format == "sections":
+        _write_sections(json_path, orcid_dict, sources)
+        return
+    with open(json_path, "w", encoding="utf-8") as fp:
+        json.dump({**orcid_dict, SOURCES_KEY: sources}, fp, indent=4, default=json_default)
+
+
+def export_json(cache_path: str, json_path: str) -> None:
+    """Writes a cache file of either format out as a JSON cache."""
+    cached, sources = read_cache(cache_path)
+    out = dict(cached)
+    if sources is not None:
+        out[SOURCES_KEY] = sources
+    with open(json_path, "w", encoding="utf-8") as fp:
+        json.dump(out, fp, indent=4, default=json_default)
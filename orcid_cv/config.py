@@ -3,6 +3,10 @@ from typing import Dict, Any
 # Backends able to turn a style config into a PDF
 BACKENDS = ("reportlab", "typst")
 
+# How the reportlab backend lays out a section: a table per entry, or the whole
+# section as a few long tables (fewer, larger flowables for big sections)
+SECTION_LAYOUTS = ("entries", "table")
+
 
 def make_document_config(style: str, backend: str = "reportlab") -> Dict[str, Any]:
     """
@@ -39,6 +43,7 @@ def _make_reportlab_config(style: str) -> Dict[str, Any]:
             "heading_rule_width": 2,
             "heading_rule_padding": 2,
             "page_footer": False,
+            "section_layout": "entries",
             "initalize_authors": True,
             "embolden_author": True,
             "initalize_primary_author": True,
@@ -9,29 +9,21 @@ render the exact same CV content in their own idioms.
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from orcid_cv.utils import dict_to_list, initialize_name, is_self_author
+from orcid_cv.authors import Author, AuthorTable
+from orcid_cv.normalize import work_keys
+from orcid_cv.records import Affiliation, Funding, Review, Work, as_record
+from orcid_cv.utils import AuthorMatcher, author_matcher
+from orcid_cv.workmap import work_map
 
 logger = logging.getLogger("orcid_cv")
 
-# Author entries are (name, is_the_cv_owner) pairs.
-Author = Tuple[str, bool]
-
-# Characters that ORCID hands back which look wrong in a CV.
-_CHAR_FIXES = {
-    "‐": "-",  # Unicode hyphen -> ascii hyphen
-}
-_AUTHOR_CHAR_FIXES = {
-    "‐": "-",
-    "ř": "r",
-}
-
-
-def _apply_fixes(text: str, fixes: Dict[str, str]) -> str:
-    """Applies a table of character substitutions to a string."""
-    for old, new in fixes.items():
-        if old in text:
-            text = text.replace(old, new)
-    return text
+# Characters that ORCID hands back which look wrong in a CV (author names have
+# their own table, see `orcid_cv.authors`).
+_CHAR_FIXES = str.maketrans(
+    {
+        "‐": "-",  # Unicode hyphen -> ascii hyphen
+    }
+)
 
 
 def prepare_person(orcid_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -60,7 +52,7 @@ def prepare_affiliations(
         logger.warning(f"Dict does not contain affiliation type: {affiliation_type}")
         return []
 
-    affiliations = dict_to_list(orcid_dict[affiliation_type])
+    affiliations = [as_record(Affiliation, v) for v in orcid_dict[affiliation_type].values()]
     try:
         affiliations = sorted(
             affiliations, key=lambda v: int(v.get("start_date", 0)), reverse=True
@@ -102,7 +94,7 @@ def prepare_service(
 
     filtered = []
     for entry in services:
-        role = entry.get("role", "").lower()
+        role = entry.role.lower()
         if match_terms and not any(term in role for term in match_terms):
             continue
         if exclude_terms and any(term in role for term in exclude_terms):
@@ -117,7 +109,7 @@ def prepare_funding(orcid_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
         logger.warning("Dict does not contain funding")
         return []
 
-    fund = dict_to_list(orcid_dict["funding"])
+    fund = [as_record(Funding, v) for v in orcid_dict["funding"].values()]
     try:
         fund = sorted(fund, key=lambda v: int(v.get("start_year", 0)), reverse=True)
     except (ValueError, TypeError):
@@ -135,7 +127,7 @@ def prepare_reviews(orcid_dict: Dict[str, Any]) -> List[Tuple[str, int]]:
 
     review_dict: Dict[str, int] = {}
     for v in orcid_dict["reviews"].values():
-        org_name = v.get("org", "")
+        org_name = as_record(Review, v).org
         if org_name:
             review_dict[org_name] = review_dict.get(org_name, 0) + 1
 
@@ -149,29 +141,49 @@ def format_review(org: str, count: int) -> str:
     return f"{org}, {count} reviews" if count > 1 else f"{org}, 1 review"
 
 
-def _prepare_link(doi_str: str) -> Optional[Dict[str, str]]:
-    """
-    Splits a work's URL into a display prefix, a short label and the target URL.
-    Returns None when the work has no link.
-    """
-    if not doi_str:
-        return None
-
-    if "doi.org/" in doi_str:
-        short = doi_str[doi_str.find("doi.org/") + 8 :]
-        return {
-            "prefix": "DOI: ",
-            "label": short,
-            "url": f"https://www.doi.org/{short}",
-        }
-    if "github.com/" in doi_str:
-        short = doi_str[doi_str.find("github.com/") + 11 :]
-        return {
-            "prefix": "GitHub: ",
-            "label": short,
-            "url": f"https://www.github.com/{short}",
-        }
-    return {"prefix": "", "label": doi_str, "url": doi_str}
+def _work_fingerprint(work: Work) -> Tuple[Any, ...]:
+    """Every field of a work that goes into its prepared entry."""
+    return (
+        work.type,
+        work.title,
+        work.subtitle,
+        work.journal,
+        work.doi,
+        work.year,
+        tuple(work.authors),
+        tuple(work.author_orcids),
+    )
+
+
+def _prepare_work(
+    work: Work,
+    author_table: AuthorTable,
+    initialize: bool,
+    is_owner: Optional[AuthorMatcher],
+) -> Dict[str, Any]:
+    work_date = str(work.year)
+    work_journal = work.journal
+    work_title = work.title.translate(_CHAR_FIXES)
+    subtitle = work.subtitle
+
+    # Software entries store the repository in the subtitle and the year in journal
+    if work.type == "software":
+        work_journal = subtitle
+        work_date = str(work.journal)
+        subtitle = ""
+
+    # Each distinct author is initialized, fixed up and matched against the
+    # owner once per profile; see `AuthorTable`
+    authors = author_table.authors(work.authors, work.author_orcids, initialize, is_owner)
+
+    return {
+        "title": work_title,
+        "date": work_date,
+        "journal": work_journal,
+        "subtitle": subtitle,
+        "link": work_keys(work)["link"],
+        "authors": authors,
+    }
 
 
 def prepare_works(
@@ -181,62 +193,39 @@ def prepare_works(
 ) -> List[Dict[str, Any]]:
     """
     Returns the works matching `search_str`, sorted newest first, with authors,
-    journal and link information resolved into markup-free fields.
+    journal and link information resolved into markup-free fields. The works
+    are looked up through the profile's `WorkMap` (see `work_map`).
+
+    Entries are kept with the profile and shared by later calls, from either
+    backend and any document built from the same `orcid_dict`, so treat them as
+    read-only. Each is rebuilt only once a field it was made from changes.
     """
     if isinstance(search_str, str):
         search_str = [search_str]
 
-    works = dict_to_list(orcid_dict["work"])
-    works = [w for w in works if w.get("type") in search_str]
+    work_dict = work_map(orcid_dict)
+    works = work_dict.sorted_works(search_str)
     if not works:
         logger.warning(f"No matching works for: {search_str}")
         return []
 
-    try:
-        works = sorted(
-            works,
-            key=lambda v: int(v.get("year", 0)) * 1000 + int(v.get("month", 0)),
-            reverse=True,
-        )
-    except (ValueError, TypeError):
-        pass
+    initialize = bool(config.get("initalize_authors"))
+    is_owner = None
+    if config.get("embolden_author"):
+        is_owner = author_matcher(orcid_dict.get("personal", {}))
 
-    personal = orcid_dict.get("personal", {})
+    cache = work_dict.prepared
     prepared = []
     for work in works:
-        work_date = str(work.get("year", ""))
-        work_journal = work.get("journal", "")
-        work_title = _apply_fixes(work.get("title", ""), _CHAR_FIXES)
-        subtitle = work.get("subtitle", "")
-
-        # Software entries store the repository in the subtitle and the year in journal
-        if work.get("type") == "software":
-            work_journal = subtitle
-            work_date = str(work.get("journal", ""))
-            subtitle = ""
-
-        author_list = list(work.get("authors", []))
-        if config.get("initalize_authors"):
-            author_list = [initialize_name(i) for i in author_list]
-        embolden = bool(config.get("embolden_author"))
-        authors: List[Author] = [
-            (
-                _apply_fixes(a, _AUTHOR_CHAR_FIXES),
-                embolden and is_self_author(personal, a),
-            )
-            for a in author_list
-        ]
-
-        prepared.append(
-            {
-                "title": work_title,
-                "date": work_date,
-                "journal": work_journal,
-                "subtitle": subtitle,
-                "link": _prepare_link(work.get("doi", "")),
-                "authors": authors,
-            }
-        )
+        # Entries are looked up by work and the settings that shape them, and
+        # checked against the work's current fields
+        key = (id(work), initialize, is_owner)
+        fingerprint = _work_fingerprint(work)
+        cached = cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            entry = _prepare_work(work, work_dict.author_table, initialize, is_owner)
+            cached = cache[key] = (fingerprint, entry)
+        prepared.append(cached[1])
 
     return prepared
 
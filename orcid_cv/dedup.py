@@ -0,0 +1,268 @@
+"""
+Persistent index of duplicate preprints and articles.
+
+Works are grouped with a union-find structure: every work is linked to the ones
+sharing its normalized title or an external ID and, if asked to, to
+near-identical titles found through MinHash/LSH buckets. Each group keeps its chosen representative
+and the union of its members' external IDs. The index is saved next to the
+cache, so works added to an existing cache are grouped with O(k·α(n)) lookups
+rather than by regrouping every work.
+
+The index remembers every work it has seen, including the ones merged away,
+since those no longer appear in the parsed data.
+"""
+
+import os
+import pickle
+import re
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from orcid_cv.minhash import MinHasher, NUM_PERM, jaccard, lsh_params, shingles
+from orcid_cv.normalize import canonical_id, normalize_title, work_keys
+
+# Bumped whenever the layout of a saved index changes. Buckets are keyed by the
+# built-in hash of a signature band, which only stays put within a Python
+# version, so that is part of the version too.
+INDEX_VERSION = (3, sys.version_info[:2])
+
+# A near match also needs the two works' years to be at most this far apart
+NEAR_MATCH_YEARS = 2
+
+# Words of a normalized title that number it: anything with a digit, and roman
+# numerals up to xx. "Part I" and "Part II" are different papers however alike
+# the rest of their titles.
+_NUMBERING = re.compile(r"\d|^(x{0,2})(ix|iv|v?i{0,3})$")
+
+# (is article, year, month, longest external ID, DOI length), larger is better
+Priority = Tuple[int, int, int, int, int]
+
+
+def work_priority(work: Dict[str, Any]) -> Priority:
+    """
+    How good a representative a work makes: prefer journal articles, then newer
+    year and month, then the longest external ID and the longest DOI.
+    """
+    eids = work.get("external_ids", [])
+    keys = work_keys(work)
+    return (
+        1 if work.get("type") == "journal-article" else 0,
+        keys["year"],
+        keys["month"],
+        max((len(eid) for eid in eids), default=0),
+        len(work.get("doi", "")),
+    )
+
+
+def title_numbering(title: str) -> FrozenSet[str]:
+    """The words numbering a normalized title, e.g. {'ii'} or {'2year'}."""
+    return frozenset(word for word in title.split() if _NUMBERING.search(word))
+
+
+def first_author(work: Dict[str, Any]) -> str:
+    """The last name of a work's first author, lower case, or '' if unknown."""
+    authors = work.get("authors") or []
+    words = normalize_title(authors[0]).split() if authors else []
+    return words[-1] if words else ""
+
+
+def index_path(cache_path: str) -> str:
+    """Where the index for a cache file is kept: '<cache name>.dedup.pkl'."""
+    return os.path.splitext(cache_path)[0] + ".dedup.pkl"
+
+
+class DedupIndex:
+    """
+    Union-find over works. `add` links a work to everything it duplicates and
+    returns its group's root; `group` gives the representative, external IDs
+    and members of a group.
+
+    With `similarity` below 1, a preprint is also linked to an article whose
+    title has at least that shingle similarity, provided the evidence agrees:
+    the same words number both titles, the first authors share a last name and
+    the years are at most `NEAR_MATCH_YEARS` apart (where known). At 1, the
+    default, only equal titles and shared IDs link works.
+    """
+
+    def __init__(self, similarity: float = 1.0):
+        self.version = INDEX_VERSION
+        self.similarity = similarity
+        # Key -> (type, normalized title, external IDs, priority, insertion
+        # order, first author)
+        self.records: Dict[str, Tuple[str, str, Tuple[str, ...], Priority, int, str]] = {}
+        # Only works that are not their own root, and only groups of two or
+        # more, are stored: most works have no duplicate.
+        self.parent: Dict[str, str] = {}
+        # Root -> {"representative", "external_ids", "members"}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.by_title: Dict[str, str] = {}
+        # Keyed by `canonical_id`, so DOIs differing only in case or prefix link
+        self.by_eid: Dict[str, str] = {}
+        # hash((band, *band values)) -> works in that LSH bucket
+        self.buckets: Dict[int, List[str]] = {}
+        self._counter = 0
+        self._hasher: Optional[MinHasher] = None
+
+    # Union-find
+
+    def find(self, key: str) -> str:
+        parent = self.parent
+        root = key
+        while root in parent:
+            root = parent[root]
+        # Path compression
+        while key != root and parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
+
+    def _better(self, a: str, b: str) -> str:
+        """The better representative of two works; ties go to the later one."""
+        ra, rb = self.records[a], self.records[b]
+        return a if (ra[3], ra[4]) > (rb[3], rb[4]) else b
+
+    def union(self, a: str, b: str) -> str:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        ga, gb = self.group(ra), self.group(rb)
+        # Union by size: the smaller group is folded into the larger one
+        if len(ga["members"]) < len(gb["members"]):
+            ra, rb, ga, gb = rb, ra, gb, ga
+        self.parent[rb] = ra
+        ga["members"].extend(gb["members"])
+        ga["external_ids"] |= gb["external_ids"]
+        ga["representative"] = self._better(ga["representative"], gb["representative"])
+        self.groups[ra] = ga
+        self.groups.pop(rb, None)
+        return ra
+
+    # Building
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def group(self, key: str) -> Dict[str, Any]:
+        """The group a work belongs to."""
+        root = self.find(key)
+        if root in self.groups:
+            return self.groups[root]
+        return {
+            "representative": root,
+            "external_ids": set(self.records[root][2]),
+            "members": [root],
+        }
+
+    def _bucket_keys(self, title: str) -> List[int]:
+        if self._hasher is None:
+            self._hasher = MinHasher(NUM_PERM)
+        bands, rows = lsh_params(NUM_PERM, self.similarity)
+        sig = self._hasher.signature(shingles(title))
+        # Hashing the band keeps the saved index small; a collision only adds a
+        # candidate, which the exact check then rejects
+        return [hash((band, *sig[band * rows : (band + 1) * rows])) for band in range(bands)]
+
+    def add(self, key: str, work: Dict[str, Any], title: str) -> str:
+        """
+        Records a preprint or article under `key` with its normalized `title`,
+        links it to its duplicates and returns the root of its group.
+        """
+        eids = tuple(eid for eid in work.get("external_ids", []) if eid)
+        return self._insert(
+            key, work.get("type", ""), title, eids, work_priority(work), first_author(work)
+        )
+
+    def _near_match(self, a: str, b: str) -> bool:
+        """Whether the evidence besides their titles lets two works be merged."""
+        ra, rb = self.records[a], self.records[b]
+        if title_numbering(ra[1]) != title_numbering(rb[1]):
+            return False
+        if ra[5] and rb[5] and ra[5] != rb[5]:
+            return False
+        year_a, year_b = ra[3][1], rb[3][1]
+        return not (year_a and year_b and abs(year_a - year_b) > NEAR_MATCH_YEARS)
+
+    def _insert(
+        self,
+        key: str,
+        work_type: str,
+        title: str,
+        eids: Tuple[str, ...],
+        priority: Priority,
+        author: str = "",
+    ) -> str:
+        self.records[key] = (work_type, title, eids, priority, self._counter, author)
+        self._counter += 1
+
+        if title:
+            other = self.by_title.setdefault(title, key)
+            if other != key:
+                self.union(key, other)
+        for eid in eids:
+            other = self.by_eid.setdefault(canonical_id(eid), key)
+            if other != key:
+                self.union(key, other)
+
+        if self.similarity < 1 and title:
+            own = shingles(title)
+            candidates: Set[str] = set()
+            for bucket in self._bucket_keys(title):
+                members = self.buckets.setdefault(bucket, [])
+                candidates.update(members)
+                members.append(key)
+            for other in candidates:
+                other_type, other_title = self.records[other][:2]
+                if other_type == work_type or self.find(other) == self.find(key):
+                    continue
+                if (
+                    jaccard(own, shingles(other_title)) >= self.similarity
+                    and self._near_match(key, other)
+                ):
+                    self.union(key, other)
+
+        return self.find(key)
+
+    def without(self, keys: Iterable[str]) -> "DedupIndex":
+        """
+        A new index holding every work but `keys`. Union-find cannot split
+        groups, so removing works regroups the rest from their saved records.
+        """
+        drop = set(keys)
+        index = DedupIndex(self.similarity)
+        for key, (work_type, title, eids, priority, _, author) in sorted(
+            self.records.items(), key=lambda item: item[1][4]
+        ):
+            if key not in drop:
+                index._insert(key, work_type, title, eids, priority, author)
+        return index
+
+    # Persistence
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_hasher"] = None
+        return state
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_index(path: str, similarity: float) -> Optional[DedupIndex]:
+    """
+    Loads a saved index, or returns None if there is none or it was built with
+    another layout or similarity threshold.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            index = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if (
+        not isinstance(index, DedupIndex)
+        or getattr(index, "version", None) != INDEX_VERSION
+        or index.similarity != similarity
+    ):
+        return None
+    return index
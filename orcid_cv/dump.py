@@ -0,0 +1,183 @@
+"""
+Access to an ORCID dump, either unpacked on disk or still inside the zip archive
+ORCID delivers it as.
+
+Files in a dump are named by their '/'-separated path relative to the dump's top
+level, e.g. 'works/123.xml', whatever the platform and whichever folder the
+archive wraps everything in. Zip members are streamed straight out of the
+archive; nothing is extracted to disk.
+"""
+
+import calendar
+import os
+import zipfile
+from typing import Dict, List, Optional, Tuple, Union
+
+# What the record loaders are handed: a file path, or the bytes of an XML file
+XmlSource = Union[str, bytes]
+
+
+class DirectoryDump:
+    """An ORCID dump unpacked into a directory."""
+
+    def __init__(self, root: str):
+        self.root = self.path = root
+
+    def __enter__(self) -> "DirectoryDump":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def default_cache_path(self) -> str:
+        return os.path.join(self.root, "ORCID.json")
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self.root, *rel.split("/")) if rel else self.root
+
+    def has_folder(self, folder: str) -> bool:
+        return os.path.isdir(self._path(folder))
+
+    def scan(self, folder: str) -> Dict[str, Tuple[int, int]]:
+        """Returns the size and mtime (ns) of every XML file directly in `folder`."""
+        found: Dict[str, Tuple[int, int]] = {}
+        path = self._path(folder)
+        if not os.path.isdir(path):
+            return found
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".xml") and entry.is_file():
+                    stat = entry.stat()
+                    rel = f"{folder}/{entry.name}" if folder else entry.name
+                    found[rel] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def list(self, folder: str) -> List[str]:
+        """Returns the XML files directly in `folder`, in directory order."""
+        path = self._path(folder)
+        prefix = f"{folder}/" if folder else ""
+        return [prefix + x for x in os.listdir(path) if x.endswith(".xml")]
+
+    def exists(self, rel: str) -> bool:
+        return os.path.isfile(self._path(rel))
+
+    def source(self, rel: str) -> XmlSource:
+        """A file's path, which is cheap to hand to worker processes."""
+        return self._path(rel)
+
+    def read(self, rel: str) -> bytes:
+        with open(self._path(rel), "rb") as f:
+            return f.read()
+
+
+class ZipDump:
+    """
+    An ORCID dump still packed in its zip archive. The dump's top level is taken
+    to be wherever the shallowest `person.xml` sits, so archives that wrap
+    everything in a folder named after the ORCID iD work as they are.
+    """
+
+    def __init__(self, archive: str):
+        self.archive = self.path = archive
+        self._zip = zipfile.ZipFile(archive)
+        infos = [
+            i
+            for i in self._zip.infolist()
+            if not i.is_dir() and not i.filename.startswith("__MACOSX/")
+        ]
+
+        people = sorted(
+            (i.filename for i in infos if i.filename.rpartition("/")[2] == "person.xml"),
+            key=lambda name: name.count("/"),
+        )
+        prefix = people[0][: -len("person.xml")] if people else ""
+
+        self._members: Dict[str, zipfile.ZipInfo] = {
+            i.filename[len(prefix) :]: i for i in infos if i.filename.startswith(prefix)
+        }
+
+    def __enter__(self) -> "ZipDump":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zip.close()
+
+    @property
+    def default_cache_path(self) -> str:
+        # Kept beside the archive, named after it so several dumps can share a folder
+        return os.path.splitext(self.archive)[0] + ".ORCID.json"
+
+    def has_folder(self, folder: str) -> bool:
+        prefix = f"{folder}/" if folder else ""
+        return any(rel.startswith(prefix) for rel in self._members)
+
+    def scan(self, folder: str) -> Dict[str, Tuple[int, int]]:
+        """Returns the size and mtime (ns) of every XML file directly in `folder`."""
+        found: Dict[str, Tuple[int, int]] = {}
+        for rel in self.list(folder):
+            info = self._members[rel]
+            mtime = calendar.timegm(info.date_time + (0, 0, 0))
+            found[rel] = (info.file_size, mtime * 1_000_000_000)
+        return found
+
+    def list(self, folder: str) -> List[str]:
+        """Returns the XML files directly in `folder`, in archive order."""
+        return [
+            rel
+            for rel in self._members
+            if rel.endswith(".xml") and rel.rpartition("/")[0] == folder
+        ]
+
+    def exists(self, rel: str) -> bool:
+        return rel in self._members
+
+    def source(self, rel: str) -> XmlSource:
+        """A member's bytes; the archive handle itself cannot go to worker processes."""
+        return self.read(rel)
+
+    def read(self, rel: str) -> bytes:
+        return self._zip.read(self._members[rel])
+
+
+Dump = Union[DirectoryDump, ZipDump]
+
+
+def open_dump(path: str) -> Dump:
+    """Opens an ORCID dump from a directory or a zip archive."""
+    if os.path.isdir(path):
+        return DirectoryDump(path)
+    if os.path.isfile(path) and zipfile.is_zipfile(path):
+        return ZipDump(path)
+    raise FileNotFoundError(f"No ORCID dump directory or zip archive at {path}")
+
+
+def open_dump_folder(path: str) -> Tuple[Optional[Dump], str]:
+    """
+    Opens the dump holding `path` and returns it with the folder `path` names
+    inside it. A path can lead into an archive, e.g. 'orcid.zip/works'. Returns
+    (None, '') when there is nothing at `path`.
+    """
+    if os.path.isdir(path):
+        return DirectoryDump(path), ""
+
+    head, parts = os.path.abspath(path), []
+    while head and not os.path.exists(head):
+        head, tail = os.path.split(head)
+        if not tail:
+            break
+        parts.insert(0, tail)
+
+    if parts and os.path.isfile(head) and zipfile.is_zipfile(head):
+        dump = ZipDump(head)
+        folder = "/".join(parts)
+        if dump.has_folder(folder):
+            return dump, folder
+        dump.close()
+    return None, ""
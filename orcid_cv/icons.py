@@ -0,0 +1,132 @@
+"""
+Icons of the external links shown next to a CV owner's name.
+
+Every document shows the same few icons from `external_link_img/`. The folder
+is scanned once per process, and each icon is decoded and compressed for PDF
+once per process too: the reportlab backend keeps a prepared image object per
+icon and hands every document its own light copy of it, so building many CVs
+does not read and encode the same PNG files for each of them. Within one PDF an
+icon is a single embedded image however often it is drawn.
+"""
+
+import copy
+from functools import lru_cache
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from orcid_cv.utils import package_directory
+
+ICON_DIRECTORY = os.path.join(package_directory, "external_link_img")
+
+
+@lru_cache(maxsize=None)
+def icon_paths() -> Dict[str, str]:
+    """
+    Website name, lower case -> icon file, e.g. "github" -> .../GitHub.png.
+    Names are matched regardless of case, as file systems on macOS and Windows
+    would.
+    """
+    try:
+        entries = list(os.scandir(ICON_DIRECTORY))
+    except FileNotFoundError:
+        return {}
+    return {
+        name.lower(): entry.path
+        for entry in entries
+        for name, ext in [os.path.splitext(entry.name)]
+        if ext.lower() == ".png" and entry.is_file()
+    }
+
+
+def icon_path(name: str) -> Optional[str]:
+    """The icon file of website `name`, or None if there is no icon for it."""
+    return icon_paths().get(name.lower())
+
+
+def is_icon(path: str) -> bool:
+    """Whether `path` is one of the icons found in `ICON_DIRECTORY`."""
+    return path in icon_paths().values()
+
+
+@lru_cache(maxsize=None)
+def icon_reader(path: str) -> Any:
+    """The decoded icon at `path` as a reportlab `ImageReader`, shared by the process."""
+    from reportlab.lib.utils import ImageReader
+
+    reader = ImageReader(path)
+    reader.getRGBData()  # decode now, so documents only ever read it
+    return reader
+
+
+# (icon file, str(mask)) -> (name `drawImage` gives it, prepared image object),
+# or None where this reportlab lacks what `embed_icon` relies on
+_prepared: Dict[Tuple[str, str], Optional[Tuple[str, Any]]] = {}
+
+
+def _prepare_icon(path: str, mask: Any) -> Optional[Tuple[str, Any]]:
+    """
+    The name reportlab's `drawImage` gives the icon at `path` and the image
+    object it would embed for it, made once per process. Masks are told apart
+    by their text, as `drawImage` does, so list masks work too.
+    """
+    key = (path, str(mask))
+    if key not in _prepared:
+        try:
+            from reportlab.lib.utils import _digester
+            from reportlab.pdfbase.pdfdoc import PDFImageXObject
+
+            reader = icon_reader(path)
+            alpha = reader._dataA
+            if mask == "auto" and alpha:
+                mask_data = alpha.getRGBData()
+            else:
+                mask_data = str(mask).encode("utf8")
+            name = _digester(reader.getRGBData() + mask_data)
+            _prepared[key] = (name, PDFImageXObject(name, reader, mask=mask))
+        except (ImportError, AttributeError):
+            _prepared[key] = None
+    return _prepared[key]
+
+
+def embed_icon(canv: Any, path: str, mask: Any = "auto") -> bool:
+    """
+    Adds the icon at `path` to the document of `canv` unless it already holds
+    it, so that drawing it with `canv.drawImage(icon_reader(path), ...)` embeds
+    a copy of the prepared image instead of encoding the file again. Mirrors
+    the registration done by `drawImage` itself.
+
+    This reaches into reportlab's internals. Returns False, leaving the icon to
+    `drawImage`, on a reportlab version that does not have them.
+    """
+    prepared = _prepare_icon(path, mask)
+    doc = getattr(canv, "_doc", None)
+    if (
+        prepared is None
+        or not hasattr(canv, "_setXObjects")
+        or not all(hasattr(doc, a) for a in ("idToObject", "getXObjectName", "addForm"))
+    ):
+        return False
+    from reportlab.pdfbase.pdfdoc import PDFObjectReference
+
+    name, image = prepared
+    reg_name = doc.getXObjectName(name)
+    if reg_name in doc.idToObject:
+        return True
+
+    # Registering an object marks it with its name in the document, so each
+    # document gets its own copy; the encoded stream itself is shared
+    image = copy.copy(image)
+    canv._setXObjects(image)
+    doc.Reference(image, reg_name)
+    doc.addForm(name, image)
+    smask = getattr(image, "_smask", None)
+    if smask is not None:
+        mask_reg_name = doc.getXObjectName(smask.name)
+        if mask_reg_name in doc.idToObject:
+            image.smask = PDFObjectReference(mask_reg_name)
+        else:
+            smask = copy.copy(smask)
+            canv._setXObjects(smask)
+            image.smask = doc.Reference(smask, mask_reg_name)
+        del image._smask
+    return True
@@ -0,0 +1,182 @@
+"""
+Persistent cache of network lookups, shared by every ORCID dump on the machine.
+
+Resolving a preprint DOI to its host and an ISSN to a journal title gives the
+same answer for every researcher, so the answers are kept in one SQLite file
+rather than in each dump's ORCID.json. Failed lookups are remembered too, for a
+shorter time, so an unreachable ISSN is not retried on every build.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger("orcid_cv")
+
+# Lookup kinds stored in the cache
+DOI_HOST = "doi-host"
+ISSN_TITLE = "issn-title"
+
+# Successful lookups are trusted for 90 days, failures are retried after a day
+DEFAULT_TTL = 90 * 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL = 24 * 60 * 60
+
+# A cached answer: (found, value). `found` is False for a remembered failure.
+Hit = Tuple[bool, str]
+
+
+def default_cache_path() -> str:
+    """
+    Location of the shared cache: $ORCID_CV_LOOKUP_CACHE if set, otherwise
+    orcid_cv/lookups.sqlite in the user's cache directory.
+    """
+    path = os.environ.get("ORCID_CV_LOOKUP_CACHE")
+    if path:
+        return path
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "orcid_cv", "lookups.sqlite")
+
+
+class LookupCache:
+    """
+    SQLite-backed store of lookup results with a time to live.
+
+    Each thread and process gets its own connection and the database runs in WAL
+    mode, so parse workers and lookup threads can read and write it at once. If
+    the file cannot be opened the cache logs a warning and stays empty, so
+    lookups still go to the network.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._local = threading.local()
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Connections stay behind; a worker process opens its own
+        return {"path": self.path, "ttl": self.ttl, "negative_ttl": self.negative_ttl}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # A connection must not outlive a fork, so it is tied to the process too
+        if getattr(self._local, "pid", None) == os.getpid():
+            return self._local.conn
+
+        conn = None
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                " kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " found INTEGER NOT NULL, fetched REAL NOT NULL,"
+                " PRIMARY KEY (kind, key))"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Lookup cache unavailable at {self.path}: {e}")
+            conn = None
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, Hit]:
+        """Returns the unexpired answers held for any of `keys`."""
+        keys = list(dict.fromkeys(keys))
+        hits: Dict[str, Hit] = {}
+        now = time.time()
+        conn = self._connection()
+        if conn is None:
+            return hits
+        # Stay well under SQLite's limit on bound parameters
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            rows = conn.execute(
+                "SELECT key, value, found, fetched FROM lookups"
+                f" WHERE kind = ? AND key IN ({', '.join('?' * len(chunk))})",
+                [kind, *chunk],
+            )
+            for key, value, found, fetched in rows:
+                ttl = self.ttl if found else self.negative_ttl
+                if now - fetched < ttl:
+                    hits[key] = (bool(found), value)
+        return hits
+
+    def get(self, kind: str, key: str) -> Optional[Hit]:
+        """Returns the unexpired answer held for `key`, or None."""
+        return self.get_many(kind, [key]).get(key)
+
+    def put_many(self, kind: str, answers: Dict[str, Hit]) -> None:
+        """Stores (found, value) answers, replacing any older ones."""
+        if not answers:
+            return
+        now = time.time()
+        conn = self._connection()
+        if conn is None:
+            return
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO lookups (kind, key, value, found, fetched)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (kind, key, value, int(found), now)
+                    for key, (found, value) in answers.items()
+                ],
+            )
+
+    def put(self, kind: str, key: str, value: str, found: bool = True) -> None:
+        """Stores a single answer."""
+        self.put_many(kind, {key: (found, value)})
+
+    def lookup(self, kind: str, key: str, fetch: Callable[[str], str]) -> Hit:
+        """
+        Returns the cached answer for `key`, or calls `fetch(key)` and stores what
+        it returns. An empty result is stored as a failure.
+        """
+        hit = self.get(kind, key)
+        if hit is not None:
+            return hit
+        value = fetch(key)
+        self.put(kind, key, value, found=bool(value))
+        return bool(value), value
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Forgets every answer, or only those of one kind."""
+        conn = self._connection()
+        if conn is None:
+            return
+        with conn:
+            if kind is None:
+                conn.execute("DELETE FROM lookups")
+            else:
+                conn.execute("DELETE FROM lookups WHERE kind = ?", (kind,))
+
+
+_default_cache: Optional[LookupCache] = None
+_default_lock = threading.Lock()
+
+
+def get_lookup_cache() -> LookupCache:
+    """Returns the process-wide cache at `default_cache_path()`."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None or _default_cache.path != default_cache_path():
+            _default_cache = LookupCache()
+        return _default_cache
@@ -0,0 +1,100 @@
+"""
+Near-duplicate detection for short texts such as work titles.
+
+Each text is cut into overlapping character shingles and summarised by a MinHash
+signature: two signatures agree in a given position with probability equal to
+the Jaccard similarity of the shingle sets. Signatures are split into bands and
+texts that share any whole band land in the same bucket, so likely matches are
+found without comparing every pair. Candidates are then confirmed against the
+exact Jaccard similarity of their shingles.
+
+Signatures use one-permutation hashing: every shingle is hashed once and the
+hash decides both the position it competes for and its value, with empty
+positions filled from their neighbours. That keeps the cost per text linear in
+its length rather than in length times signature size.
+"""
+
+import hashlib
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Signature length and shingle size used unless told otherwise
+NUM_PERM = 64
+SHINGLE_SIZE = 4
+
+# Pairs at the similarity threshold are found with at least this probability
+_LSH_RECALL = 0.99
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> FrozenSet[str]:
+    """The set of overlapping `size`-character pieces of `text`."""
+    if len(text) <= size:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i : i + size] for i in range(len(text) - size + 1))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Size of the intersection over size of the union (0 for two empty sets)."""
+    if not a and not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Picks (bands, rows) for a signature of `num_perm` values: the most rows per
+    band, i.e. the fewest false candidates, that still make a pair with
+    similarity `threshold` a candidate with probability `_LSH_RECALL`.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= _LSH_RECALL:
+            return bands, rows
+    return num_perm, 1
+
+
+class MinHasher:
+    """Computes one-permutation MinHash signatures of shingle sets."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 0):
+        self.num_perm = num_perm
+        self._salt = seed.to_bytes(8, "little")
+        # Titles share most of their shingles, so each is only hashed once
+        self._hashes: Dict[str, int] = {}
+
+    def _hash(self, shingle: str) -> int:
+        h = self._hashes.get(shingle)
+        if h is None:
+            digest = hashlib.blake2b(
+                shingle.encode("utf-8"), digest_size=8, salt=self._salt
+            ).digest()
+            h = self._hashes[shingle] = int.from_bytes(digest, "little")
+        return h
+
+    def signature(self, shingle_set: Iterable[str]) -> Signature:
+        k = self.num_perm
+        hashes = self._hashes
+        slots: List[Optional[int]] = [None] * k
+        for s in shingle_set:
+            h = hashes.get(s)
+            if h is None:
+                h = self._hash(s)
+            slot, value = h % k, h // k
+            current = slots[slot]
+            if current is None or value < current:
+                slots[slot] = value
+        if all(v is None for v in slots):
+            return tuple([0] * k)
+
+        # Densify: an empty slot takes the value of the next filled one to its
+        # right, offset by the distance so that borrowed values stay distinct.
+        offset = 1 << 64
+        out = []
+        for i in range(k):
+            j = i
+            while slots[j % k] is None:
+                j += 1
+            out.append(slots[j % k] + (j - i) * offset)
+        return tuple(out)
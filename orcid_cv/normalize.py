@@ -0,0 +1,121 @@
+"""
+Typed keys derived once from each parsed work.
+
+Duplicate pruning matches on a normalized title, sorting wants integer years and
+months, and rendering wants the work's link split into a label and a URL. Rather
+than each stage re-deriving these from the raw strings, `load_work` stores them
+under the work's "keys" entry, where they are saved with the cache.
+
+Each set of keys records the raw fields it was computed from, so `work_keys`
+recomputes them when a work was edited after loading (e.g. by a script fixing a
+title) or comes from a cache written before keys were stored.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from orcid_cv.records import Work
+
+KEYS_FIELD = "keys"
+
+
+def normalize_title(title: str) -> str:
+    """Helper to normalize paper titles for robust matching."""
+    if not title:
+        return ""
+    # Lowercase and remove all non-alphanumeric characters, ignoring whitespace differences
+    cleaned = "".join(c.lower() for c in title if c.isalnum() or c.isspace())
+    return " ".join(cleaned.split())
+
+
+def canonical_doi(doi_str: str) -> str:
+    """
+    The bare, lower-case DOI in a URL or DOI string, e.g. '10.7554/elife.1' for
+    'https://doi.org/10.7554/eLife.1'. Empty when the string holds no DOI.
+    """
+    if not doi_str:
+        return ""
+    doi = doi_str.strip()
+    if "doi.org/" in doi:
+        doi = doi[doi.find("doi.org/") + 8 :]
+    elif doi.lower().startswith("doi:"):
+        doi = doi[4:].strip()
+    doi = doi.lower()
+    return doi if doi.startswith("10.") else ""
+
+
+def canonical_id(external_id: str) -> str:
+    """
+    The form an external ID is matched by: the canonical DOI for a DOI, so
+    '10.1101/ABC' and 'https://doi.org/10.1101/abc' agree, else the ID as is.
+    """
+    return canonical_doi(external_id) or external_id
+
+
+def link_descriptor(doi_str: str) -> Optional[Dict[str, str]]:
+    """
+    Splits a work's URL into a display prefix, a short label and the target URL.
+    Returns None when the work has no link.
+    """
+    if not doi_str:
+        return None
+
+    if "doi.org/" in doi_str:
+        short = doi_str[doi_str.find("doi.org/") + 8 :]
+        return {
+            "prefix": "DOI: ",
+            "label": short,
+            "url": f"https://www.doi.org/{short}",
+        }
+    if "github.com/" in doi_str:
+        short = doi_str[doi_str.find("github.com/") + 11 :]
+        return {
+            "prefix": "GitHub: ",
+            "label": short,
+            "url": f"https://www.github.com/{short}",
+        }
+    return {"prefix": "", "label": doi_str, "url": doi_str}
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _source_fields(work: Dict[str, Any]) -> List[Any]:
+    return [
+        work.get("title", ""),
+        work.get("doi", ""),
+        work.get("year", 0),
+        work.get("month", 0),
+    ]
+
+
+def compute_work_keys(work: Dict[str, Any]) -> Dict[str, Any]:
+    """Derives a work's keys from its raw fields."""
+    source = _source_fields(work)
+    title, doi, year, month = source
+    return {
+        "source": source,
+        "title": normalize_title(title),
+        "doi": canonical_doi(doi),
+        "year": _int(year),
+        "month": _int(month),
+        "link": link_descriptor(doi),
+    }
+
+
+def work_keys(work: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a work's stored keys: normalized `title`, canonical `doi`, integer
+    `year` and `month` (0 when unknown) and the `link` descriptor. They are
+    recomputed if missing or stale, and stored again on `Work` records only:
+    plain dicts passed in from outside are left as they are.
+    """
+    keys = work.get(KEYS_FIELD)
+    if keys is None or keys.get("source") != _source_fields(work):
+        keys = compute_work_keys(work)
+        if isinstance(work, Work):
+            work[KEYS_FIELD] = keys
+    return keys
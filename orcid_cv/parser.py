@@ -1,22 +1,196 @@
 import os
 import re
-import json
+import math
 import logging
 import requests
 import xmltodict
-from typing import Dict, List, Any, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
 from urllib.parse import urlparse
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-from orcid_cv.utils import get_recursive_key, dict_to_list
+from orcid_cv.cache import (
+    CACHE_FORMATS,
+    SectionedCache,
+    Sources,
+    diff_sources,
+    hash_sources,
+    read_cache,
+    scan_sources,
+    write_cache,
+)
+from orcid_cv.dump import Dump, XmlSource, open_dump, open_dump_folder
+from orcid_cv.dedup import DedupIndex, index_path, load_index
+from orcid_cv.normalize import (
+    KEYS_FIELD,
+    canonical_id,
+    compute_work_keys,
+    work_keys,
+)
+# Defined here before it moved to orcid_cv.normalize; kept importable from here
+from orcid_cv.normalize import normalize_title  # noqa: F401
+from orcid_cv.lookups import DOI_HOST, ISSN_TITLE, LookupCache, get_lookup_cache
+from orcid_cv.records import Affiliation, Funding, Review, Work
+from orcid_cv.schema import Column, First, Pairs, RecordSpec, Repeated, Sole, Text
+from orcid_cv.stream import Entries, StreamExtractor
+from orcid_cv.utils import (
+    PathAccessor,
+    compile_path,
+    initialize_name,
+    resolve_workers,
+)
+from orcid_cv.workmap import WorkMap
 
 logger = logging.getLogger("orcid_cv")
 
+# Folders with fewer XML files than this are parsed serially even when workers
+# are available: starting a process pool costs more than it saves on them.
+PARALLEL_MIN_FILES = 64
 
-def load_xml(xml_path: str) -> Dict[str, Any]:
-    """Loads an XML file and converts it into a Python dictionary."""
-    with open(xml_path, encoding="utf-8") as xd:
-        xml_dict = xmltodict.parse(xd.read())
+# Network lookups (preprint hosts) run this many requests at once by default
+LOOKUP_WORKERS = 8
+
+# Record loaders read a file with one of two engines: "stream" walks it once with
+# expat keeping only the fields below, "xmltodict" builds the whole tree with
+# `load_xml` and looks the same paths up in it.
+ENGINES = ("stream", "xmltodict")
+
+# A preprint and an article whose titles share at least this fraction of their
+# 4-character shingles are taken to be the same work, if their numbering, first
+# author and years agree; see `prune_duplicate_works`. At 1 only equal titles
+# and shared IDs merge works: pass a lower `similarity` (e.g. 0.85) to
+# `extract_orcid_info` to opt in to near matches.
+NEAR_DUPLICATE_THRESHOLD = 1.0
+
+# Output field -> number of files it was missing from. `_extract` counts, and
+# `_map_files` reports the totals once per folder instead of once per file.
+_missing_fields: Counter = Counter()
+
+
+def _issn_of_group(group_id: str) -> str:
+    """A review group ID is the journal's ISSN behind an 'issn:' prefix."""
+    return group_id[5:]
+
+
+# What every record type reads from its XML files; see `orcid_cv.schema`
+AFFILIATION_SPEC = RecordSpec(
+    Affiliation,
+    {
+        "organization": Text(("common:organization", "common:name")),
+        "department": Text(("common:department-name",)),
+        "role": Text(("common:role-title",)),
+        "start_date": Text(("common:start-date", "common:year")),
+        "end_date": Text(("common:end-date", "common:year")),
+    },
+)
+
+WORK_SPEC = RecordSpec(
+    Work,
+    {
+        "type": Text(("work:type",)),
+        "title": Text(("work:title", "common:title")),
+        "subtitle": Text(("work:title", "common:subtitle")),
+        "journal": Text(("work:journal-title",)),
+        "doi": Text(("common:url",)),
+        # Undated works sort last
+        "year": Text(("common:publication-date", "common:year"), default=0),
+        "month": Text(("common:publication-date", "common:month"), default=0),
+        "authors": Column("contributors", "name"),
+        # The contributor ORCID iD of each author, where the work lists any
+        "author_orcids": Column("contributors", "orcid", keep_empty=True, if_any=True),
+        # DOIs only, but a lone ID is kept whatever its type
+        "external_ids": Column(
+            "external_ids", "value", where=("type", "doi"), where_several=True
+        ),
+    },
+    {
+        "contributors": Repeated(
+            ("work:contributors", "work:contributor"),
+            {
+                "name": ("work:credit-name",),
+                "orcid": ("common:contributor-orcid", "common:path"),
+            },
+            require=("name",),
+        ),
+        "external_ids": Repeated(
+            ("common:external-ids", "common:external-id"),
+            {
+                "type": ("common:external-id-type",),
+                "value": ("common:external-id-value",),
+            },
+        ),
+    },
+)
+
+_WORK_TITLE_SPEC = RecordSpec(
+    dict, {"title": Text(("work:title", "common:title")), "put_code": Text(("@put-code",))}
+)
+
+FUNDING_SPEC = RecordSpec(
+    Funding,
+    {
+        "title": Text(("funding:title", "common:title")),
+        "role": Text(("funding:organization-defined-type",)),
+        "org": Text(("common:organization", "common:name")),
+        # Only a grant with exactly one external ID has an unambiguous number
+        "id": Sole("external_ids", "value"),
+        "start_year": Text(("common:start-date", "common:year")),
+        "end_year": Text(("common:end-date", "common:year")),
+        "value": Text(("common:external-ids", "#text")),
+    },
+    {
+        "external_ids": Repeated(
+            ("common:external-ids", "common:external-id"),
+            {"value": ("common:external-id-value",)},
+        ),
+    },
+)
+
+# The journal (`org`) is named from the ISSN later, see `resolve_review_journals`
+REVIEW_SPEC = RecordSpec(
+    Review,
+    {
+        "year": Text(("peer-review:review-completion-date", "common:year")),
+        "role": Text(("peer-review:review-type",)),
+        "issn": Text(("peer-review:review-group-id",), convert=_issn_of_group),
+    },
+)
+
+PERSON_SPEC = RecordSpec(
+    dict,
+    {
+        "lastname": Text(("person:name", "personal-details:family-name")),
+        "givenname": Text(("person:name", "personal-details:given-names")),
+        "orcid": Text(("person:name", "@path")),
+        "links": Pairs("urls", "name", "url"),
+        # The primary email, else the first one listed
+        "email": First("emails", "address", flag="primary"),
+    },
+    {
+        "urls": Repeated(
+            ("researcher-url:researcher-urls", "researcher-url:researcher-url"),
+            {"name": ("researcher-url:url-name",), "url": ("researcher-url:url",)},
+        ),
+        "emails": Repeated(
+            ("email:emails", "email:email"),
+            {"address": ("email:email",), "primary": ("@primary",)},
+        ),
+    },
+)
+
+
+def load_xml(xml_path: XmlSource) -> Dict[str, Any]:
+    """
+    Loads an XML file, given by path or as raw bytes, and converts it into a
+    Python dictionary.
+    """
+    if isinstance(xml_path, bytes):
+        xml_dict = xmltodict.parse(xml_path)
+    else:
+        with open(xml_path, encoding="utf-8") as xd:
+            xml_dict = xmltodict.parse(xd.read())
 
     # Remove top-level wrapper if it exists
     if len(xml_dict.keys()) == 1:
@@ -25,40 +199,100 @@ def load_xml(xml_path: str) -> Dict[str, Any]:
         raise ValueError("XML dictionary has more than one top-level key")
 
 
+@lru_cache(maxsize=None)
+def _tree_accessors(extractor: StreamExtractor) -> Tuple[
+    List[Tuple[str, PathAccessor]],
+    List[Tuple[str, PathAccessor, List[Tuple[str, PathAccessor]]]],
+]:
+    """An extractor's field and group paths compiled for looking up in a tree."""
+    fields = [(name, compile_path(*path)) for name, path in extractor.fields.items()]
+    groups = [
+        (
+            group,
+            compile_path(*root),
+            [(name, compile_path(*sub_path)) for name, sub_path in sub_fields.items()],
+        )
+        for group, (root, sub_fields) in extractor.groups.items()
+    ]
+    return fields, groups
+
+
+def _extract_from_tree(
+    xml_dict: Dict[str, Any], extractor: StreamExtractor
+) -> Tuple[Dict[str, Any], Dict[str, Entries]]:
+    """
+    Looks an extractor's paths up in an already parsed xmltodict tree, giving the
+    same `(values, groups)` shape that streaming the file would.
+    """
+    field_paths, group_paths = _tree_accessors(extractor)
+    values = {}
+    for name, get in field_paths:
+        value = get(xml_dict)
+        if value != "":
+            values[name] = value
+
+    groups = {}
+    for group, get_root, sub_fields in group_paths:
+        found = get_root(xml_dict)
+        if isinstance(found, dict):
+            found = [found]
+        elif not isinstance(found, list):
+            found = []
+
+        entries = []
+        for item in found:
+            if not isinstance(item, dict):
+                continue
+            entry = {}
+            for name, get in sub_fields:
+                value = get(item)
+                if value != "":
+                    entry[name] = value
+            entries.append(entry)
+        groups[group] = entries
+    return values, groups
+
+
+def _extract(xml_path: XmlSource, spec: RecordSpec, engine: str) -> Any:
+    """
+    Reads a record of the given spec from one file with the chosen engine,
+    counting the fields it lacks in `_missing_fields`.
+    """
+    extractor = spec.extractor
+    if engine == "stream":
+        values, groups = extractor(xml_path)
+    elif engine == "xmltodict":
+        values, groups = _extract_from_tree(load_xml(xml_path), extractor)
+    else:
+        raise ValueError(f"Invalid engine: {engine}. Choose one of {ENGINES}.")
+    if len(values) < len(extractor.fields):
+        _missing_fields.update(name for name in extractor.fields if name not in values)
+    return spec.build(values, groups)
+
+
 def list_works(orcid_dir: str) -> None:
-    """Lists the titles and put-codes of all works in the works directory."""
-    works_path = os.path.join(orcid_dir, "works")
-    if not os.path.exists(works_path):
-        print(f"No works directory found at {works_path}")
-        return
-        
-    work_xml_list = os.listdir(works_path)
-    for i, w in enumerate(work_xml_list):
-        xml_dict = load_xml(os.path.join(works_path, w))
-        title = get_recursive_key(xml_dict, "work:work", "work:title", "common:title")
-        put_code = get_recursive_key(xml_dict, "work:work", "@put-code")
-        print(f"{i}: {title} ({put_code})")
+    """
+    Lists the titles and put-codes of all works in the works directory of a dump
+    folder or zip archive.
+    """
+    with open_dump(orcid_dir) as dump:
+        if not dump.has_folder("works"):
+            print(f"No works directory found in {orcid_dir}")
+            return
+
+        for i, w in enumerate(dump.list("works")):
+            work = _WORK_TITLE_SPEC.build(*_WORK_TITLE_SPEC.extractor(dump.source(w)))
+            print(f"{i}: {work['title']} ({work['put_code']})")
 
 
-def load_affiliation(affiliation_path: str) -> Dict[str, Any]:
+def load_affiliation(
+    affiliation_path: XmlSource, engine: str = "stream"
+) -> Affiliation:
     """
     Loads a single affiliation record. Employments, educations and services all
     use the same `common:` schema, so one loader covers all three folders.
     """
-    affiliation_xml = load_xml(affiliation_path)
-    affiliation_dict = {
-        "organization": get_recursive_key(
-            affiliation_xml, "common:organization", "common:name"
-        ),
-        "department": get_recursive_key(affiliation_xml, "common:department-name"),
-        "role": get_recursive_key(affiliation_xml, "common:role-title"),
-        "start_date": get_recursive_key(
-            affiliation_xml, "common:start-date", "common:year"
-        ),
-        "end_date": get_recursive_key(
-            affiliation_xml, "common:end-date", "common:year"
-        ),
-    }
+    affiliation_dict = _extract(affiliation_path, AFFILIATION_SPEC, engine)
     
     if affiliation_dict["end_date"] == "":
         affiliation_dict["date_range"] = affiliation_dict["start_date"] + " - present"
@@ -73,84 +307,25 @@ def load_affiliation(affiliation_path: str) -> Dict[str, Any]:
     return affiliation_dict
 
 
-def load_work(work_path: str) -> Dict[str, Any]:
+def load_work(work_path: XmlSource, engine: str = "stream") -> Work:
     """Loads a single work record, extracting metadata, identifiers, and authors."""
-    in_work_dict = load_xml(work_path)
-    out_work_dict = {
-        "type": in_work_dict.get("work:type", ""),
-        "title": get_recursive_key(in_work_dict, "work:title", "common:title"),
-        "subtitle": "",
-        "journal": get_recursive_key(in_work_dict, "work:journal-title"),
-        "doi": get_recursive_key(in_work_dict, "common:url"),
-        "year": get_recursive_key(
-            in_work_dict, "common:publication-date", "common:year"
-        ),
-        "month": get_recursive_key(
-            in_work_dict, "common:publication-date", "common:month"
-        ),
-        "authors": get_recursive_key(
-            in_work_dict, "work:contributors", "work:contributor"
-        ),
-        "external_ids": []
-    }
-
-    # Extract external IDs (specifically DOIs)
-    external_ids = get_recursive_key(
-        in_work_dict, "common:external-ids", "common:external-id"
-    )
-    if isinstance(external_ids, list):
-        out_work_dict["external_ids"] = [
-            d["common:external-id-value"]
-            for d in external_ids
-            if d.get("common:external-id-type") == "doi"
-        ]
-    elif isinstance(external_ids, dict):
-        out_work_dict["external_ids"] = [external_ids.get("common:external-id-value", "")]
-
-    # Remove empty external IDs
-    out_work_dict["external_ids"] = [eid for eid in out_work_dict["external_ids"] if eid]
-
-    # Defaults for sorting
-    if out_work_dict["year"] == "":
-        out_work_dict["year"] = 0
-    if out_work_dict["month"] == "":
-        out_work_dict["month"] = 0
-
-    # Extract authors list
-    authors = out_work_dict["authors"]
-    if authors != "":
-        if isinstance(authors, dict):
-            out_work_dict["authors"] = [authors.get("work:credit-name")]
-        elif isinstance(authors, list):
-            out_work_dict["authors"] = [
-                item.get("work:credit-name") for item in authors if item
-            ]
-        out_work_dict["authors"] = [a for a in out_work_dict["authors"] if a]
-    else:
-        out_work_dict["authors"] = []
+    out_work_dict = _extract(work_path, WORK_SPEC, engine)
 
     # Random shuffling of keys
-    if out_work_dict["type"] in ["software", "conference-presentation"]:
-        out_work_dict["subtitle"] = get_recursive_key(
-            in_work_dict, "work:title", "common:subtitle"
-        )
+    if out_work_dict["type"] not in ["software", "conference-presentation"]:
+        out_work_dict["subtitle"] = ""
     
     # Remove author from presentations
     if out_work_dict["type"] in ["public-speech", "conference-presentation"]:
         out_work_dict["authors"] = ""
+        out_work_dict["author_orcids"] = []
+
+    # Typed title, DOI, date and link keys for every later stage
+    out_work_dict[KEYS_FIELD] = compute_work_keys(out_work_dict)
         
     return out_work_dict
 
 
-def normalize_title(title: str) -> str:
-    """Helper to normalize paper titles for robust matching."""
-    if not title:
-        return ""
-    # Lowercase and remove all non-alphanumeric characters, ignoring whitespace differences
-    cleaned = "".join(c.lower() for c in title if c.isalnum() or c.isspace())
-    return " ".join(cleaned.split())
-
-
 def check_duplicates(input_dict: Dict[str, Any]) -> bool:
     """
     Checks if there are duplicate titles or external IDs across preprints and articles.
@@ -160,111 +335,143 @@ def check_duplicates(input_dict: Dict[str, Any]) -> bool:
     for di in input_dict.values():
         if di.get("type") not in ["preprint", "journal-article"]:
             continue
-        eids.extend(di.get("external_ids", []))
-        titles.append(normalize_title(di.get("title", "")))
+        eids.extend(canonical_id(eid) for eid in di.get("external_ids", []))
+        titles.append(work_keys(di)["title"])
 
     if len(eids) != len(set(eids)) or len(titles) != len(set(titles)):
         return True
     return False
 
 
-def prune_duplicate_works(work_dict: Dict[str, Any]) -> Dict[str, Any]:
+def prune_duplicate_works(
+    work_dict: Dict[str, Any],
+    keys: Optional[Iterable[str]] = None,
+    merged: Optional[Dict[str, str]] = None,
+    similarity: Optional[float] = None,
+    index: Optional[DedupIndex] = None,
+) -> Dict[str, Any]:
     """
-    Groups duplicate preprints and articles using a connected components graph algorithm,
-    merging their IDs and choosing the best representative in a single pass.
+    Groups duplicate preprints and articles with a union-find index, merging
+    their IDs and choosing the best representative in a single pass.
+
+    Works are linked by equal normalized titles and shared external IDs. With
+    `similarity` below 1 a preprint is also linked to an article whose title is
+    nearly the same, e.g. reworded on publication. Near matches are found with
+    MinHash/LSH (see `orcid_cv.minhash`), need a shingle similarity of at least
+    `similarity` and are only merged when the titles carry the same numbers
+    ("part I" is not "part II"), the first authors agree and the years are
+    close; see `DedupIndex`. It defaults to `NEAR_DUPLICATE_THRESHOLD`, 1 (off).
+
+    Pass `index` to keep grouping into an existing `DedupIndex`: only works it
+    has not seen are linked, so adding k works costs O(k·α(n)). Works already in
+    it are taken as grouped; drop edited ones first with `index.without`.
+
+    Pass `keys` to only merge the groups containing those works, e.g. the ones
+    just added to an already pruned dict. Every removed key is recorded in
+    `merged`, if given, against the key it was merged into.
     """
-    # 1. Build adjacency list of connected papers
-    adj = defaultdict(list)
-    title_to_keys = defaultdict(list)
-    eid_to_keys = defaultdict(list)
-    
-    keys_to_process = []
+    if similarity is None:
+        similarity = index.similarity if index is not None else NEAR_DUPLICATE_THRESHOLD
+    if index is None:
+        index = DedupIndex(similarity)
+    only_keys = set(keys) if keys is not None else None
+
+    # 1. Link every preprint and article the index has not seen to its duplicates
+    added = []
     for key, w in work_dict.items():
-        if w.get("type") not in ["preprint", "journal-article"]:
+        if w.get("type") not in ["preprint", "journal-article"] or key in index:
             continue
-        keys_to_process.append(key)
-        
-        nt = normalize_title(w.get("title", ""))
-        if nt:
-            title_to_keys[nt].append(key)
-        for eid in w.get("external_ids", []):
-            if eid:
-                eid_to_keys[eid].append(key)
-                
-    # Connect keys sharing the same normalized title
-    for keys in title_to_keys.values():
-        for i in range(len(keys) - 1):
-            adj[keys[i]].append(keys[i+1])
-            adj[keys[i+1]].append(keys[i])
-            
-    # Connect keys sharing the same external ID
-    for keys in eid_to_keys.values():
-        for i in range(len(keys) - 1):
-            adj[keys[i]].append(keys[i+1])
-            adj[keys[i+1]].append(keys[i])
-            
-    # 2. Find connected components (duplicate groups)
-    visited = set()
-    components = []
-    for key in keys_to_process:
-        if key not in visited:
-            comp = []
-            stack = [key]
-            while stack:
-                node = stack.pop()
-                if node not in visited:
-                    visited.add(node)
-                    comp.append(node)
-                    if node in adj:
-                        stack.extend(adj[node])
-            components.append(comp)
-            
-    # 3. For each group with duplicates, merge them into the best representative
-    for comp in components:
-        if len(comp) <= 1:
+        index.add(key, w, work_keys(w)["title"])
+        if only_keys is None or key in only_keys:
+            added.append(key)
+
+    # 2. Merge each group that gained a work into its representative
+    for root in dict.fromkeys(index.find(key) for key in added):
+        group = index.group(root)
+        if len(group["members"]) <= 1:
             continue
-            
-        # Priority logic to select the best representative (keep_key)
-        # Prefer journal-article, newer year, newer month, longest ID, longest DOI
-        def get_priority(k: str):
-            w = work_dict[k]
-            type_pref = 1 if w.get("type") == "journal-article" else 0
-            try:
-                year = int(w.get("year", 0))
-            except (ValueError, TypeError):
-                year = 0
-            try:
-                month = int(w.get("month", 0))
-            except (ValueError, TypeError):
-                month = 0
-            eids = w.get("external_ids", [])
-            max_eid_len = max(len(eid) for eid in eids) if eids else 0
-            doi_len = len(w.get("doi", ""))
-            return (type_pref, year, month, max_eid_len, doi_len)
-            
-        # Sort so that highest priority is last
-        comp.sort(key=get_priority)
-        keep_key = comp[-1]
-        del_keys = comp[:-1]
-        
+
+        present = [k for k in group["members"] if k in work_dict]
+        keep_key = group["representative"]
+        if keep_key not in work_dict:
+            keep_key = max(present, key=lambda k: index.records[k][3:5])
+
         # Merge all external IDs into keep_key
-        all_eids = set(work_dict[keep_key].get("external_ids", []))
-        for dk in del_keys:
-            all_eids.update(work_dict[dk].get("external_ids", []))
-        work_dict[keep_key]["external_ids"] = sorted(list(all_eids))
-        
+        work_dict[keep_key]["external_ids"] = sorted(group["external_ids"])
+
         # Delete duplicate entries
-        for dk in del_keys:
+        for dk in present:
+            if dk == keep_key:
+                continue
             print(f"Merging {work_dict[dk]['title']} into {work_dict[keep_key]['title']}")
             del work_dict[dk]
-            
+            if merged is not None:
+                merged[dk] = keep_key
+
     return work_dict
 
 
-def find_preprint_repository(work_dict: Dict[str, Any]) -> Dict[str, Any]:
+def _make_session(pool_size: int) -> requests.Session:
+    """A keep-alive session whose connection pool fits `pool_size` threads."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _resolve_redirects(session: requests.Session, url: str) -> str:
     """
-    Fetches preprint metadata via requests with timeouts to populate the repository name.
+    Returns the URL a link finally redirects to without downloading the page
+    behind it: a HEAD request, or a streamed GET whose body is never read for
+    hosts that refuse HEAD.
+
+    The final URL is returned whatever its status: a landing page answering
+    403 to bots (as bioRxiv's does) still names the host. Only connection
+    errors and timeouts raise.
     """
+    # Timeout set to 5 seconds to prevent indefinite hangs
+    response = session.head(url, allow_redirects=True, timeout=5)
+    if response.status_code >= 400:
+        response = session.get(url, allow_redirects=True, timeout=5, stream=True)
+        response.close()
+    return response.url
+
+
+def _repository_name(url: str) -> str:
+    """Names a preprint server after its domain, e.g. 'bioRxiv' for biorxiv.org."""
+    netloc = urlparse(url).netloc
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+
+    parts = netloc.split(".")
+    if len(parts) >= 2:
+        domain = parts[-2]
+    else:
+        domain = netloc
+
+    if "rxiv" in domain:
+        domain = domain.replace("rxiv", "Rxiv")
+    return domain
+
+
+def find_preprint_repository(
+    work_dict: Dict[str, Any],
+    workers: int = LOOKUP_WORKERS,
+    lookup_cache: Optional[LookupCache] = None,
+) -> Dict[str, Any]:
+    """
+    Populates the repository name of every preprint by following its DOI to the
+    host it redirects to. Up to `workers` DOIs are resolved at once over one
+    pooled keep-alive session, and only redirects are fetched, never the page.
+
+    Answers (and failures) are kept in the shared lookup cache, or in
+    `lookup_cache` if given, so a DOI already resolved for any dump is not
+    looked up again until its entry expires.
+    """
+    pending = []
     for w in work_dict.values():
         if w.get("type") != "preprint":
             continue
@@ -275,62 +482,84 @@ def find_preprint_repository(work_dict: Dict[str, Any]) -> Dict[str, Any]:
             if "eLife" in doi:
                 w["journal"] = "eLife"
             else:
-                try:
-                    # Timeout set to 5 seconds to prevent indefinite hangs
-                    doi_data = requests.get(doi, timeout=5)
-                    url = doi_data.url
-                    parsed = urlparse(url)
-                    netloc = parsed.netloc
-                    if netloc.startswith("www."):
-                        netloc = netloc[4:]
-                    
-                    parts = netloc.split(".")
-                    if len(parts) >= 2:
-                        domain = parts[-2]
-                    else:
-                        domain = netloc
-                        
-                    if "rxiv" in domain:
-                        domain = domain.replace("rxiv", "Rxiv")
-                    w["journal"] = domain
-                except Exception as e:
+                pending.append(w)
+
+    if not pending:
+        return work_dict
+
+    # Lookups are keyed by canonical DOI, so the same DOI written two ways is
+    # looked up and cached once
+    by_doi: Dict[str, List[Any]] = defaultdict(list)
+    for w in pending:
+        by_doi[work_keys(w)["doi"] or w["doi"]].append(w)
+
+    cache = lookup_cache or get_lookup_cache()
+    known = cache.get_many(DOI_HOST, list(by_doi))
+    # Caches written before then hold answers under the DOIs as written: carry
+    # those found over to the canonical keys rather than looking them up again
+    written = {
+        w["doi"]: doi
+        for doi, works in by_doi.items()
+        if doi not in known
+        for w in works
+        if w["doi"] != doi
+    }
+    if written:
+        carried = {
+            written[raw]: hit
+            for raw, hit in cache.get_many(DOI_HOST, list(written)).items()
+            if hit[0]
+        }
+        cache.put_many(DOI_HOST, carried)
+        known.update(carried)
+    unresolved = []
+    for doi, works in by_doi.items():
+        found, name = known.get(doi, (None, ""))
+        if found is None:
+            unresolved.append(doi)
+        for w in works:
+            if found:
+                w["journal"] = name
+            elif found is not None:
+                print(f"Could not lookup preprint: {w['title']} (failed recently)")
+
+    if not unresolved:
+        return work_dict
+
+    answers = {}
+    workers = max(1, min(workers, len(unresolved)))
+    with _make_session(workers) as session, ThreadPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(_resolve_redirects, session, by_doi[doi][0]["doi"])
+            for doi in unresolved
+        ]
+        for doi, future in zip(unresolved, futures):
+            try:
+                name = _repository_name(future.result())
+            except Exception as e:
+                answers[doi] = (False, "")
+                for w in by_doi[doi]:
                     print(f"Could not lookup preprint: {w['title']} ({e})")
+                continue
+            answers[doi] = (True, name)
+            for w in by_doi[doi]:
+                w["journal"] = name
+    cache.put_many(DOI_HOST, answers)
 
     return work_dict
 
 
-def load_funding(funding_path: str) -> Dict[str, Any]:
+def load_funding(funding_path: XmlSource, engine: str = "stream") -> Funding:
     """Loads a single funding record."""
-    in_funding_dict = load_xml(funding_path)
-    out_funding_dict = {
-        "title": get_recursive_key(in_funding_dict, "funding:title", "common:title"),
-        "role": get_recursive_key(in_funding_dict, "funding:organization-defined-type"),
-        "org": get_recursive_key(in_funding_dict, "common:organization", "common:name"),
-        "id": get_recursive_key(
-            in_funding_dict,
-            "common:external-ids",
-            "common:external-id",
-            "common:external-id-value",
-        ),
-        "start_year": get_recursive_key(
-            in_funding_dict, "common:start-date", "common:year"
-        ),
-        "end_year": get_recursive_key(
-            in_funding_dict, "common:end-date", "common:year"
-        ),
-        "value": get_recursive_key(in_funding_dict, "common:external-ids", "#text"),
-    }
-    return out_funding_dict
-
+    return _extract(funding_path, FUNDING_SPEC, engine)
 
-def load_review(review_path: str) -> Dict[str, Any]:
-    """Loads a peer review record, lookup journal name by ISSN online."""
-    in_review_dict = load_xml(review_path)
-    issn = in_review_dict["peer-review:review-group-id"][5:]
 
+def _fetch_issn_title(issn: str, session: Optional[requests.Session] = None) -> str:
+    """Looks a journal's name up on portal.issn.org, returning '' if not found."""
     potential_name = ""
     try:
-        r = requests.get(f"https://portal.issn.org/resource/ISSN/{str(issn)}", timeout=5)
+        url = f"https://portal.issn.org/resource/ISSN/{str(issn)}"
+        r = (session or requests).get(url, timeout=5)
         if r.status_code == 200:
             match = re.search(r"<title>ISSN\s+[\dXY-]+\s+-\s+(.*?)</title>", r.text, re.IGNORECASE)
             if match:
@@ -340,144 +569,479 @@ def load_review(review_path: str) -> Dict[str, Any]:
                     potential_name = potential_name[:idx].strip()
     except Exception as e:
         logger.warning(f"Could not lookup ISSN {issn}: {e}")
+    return potential_name
 
-    if not potential_name:
-        print(f"Could not identify ISSN {issn}")
 
-    out_review_dict = {
-        "year": get_recursive_key(
-            in_review_dict, "peer-review:review-completion-date", "common:year"
-        ),
-        "role": get_recursive_key(in_review_dict, "peer-review:review-type"),
-        "org": potential_name.title(),
-    }
+def parse_review(review_path: XmlSource, engine: str = "stream") -> Review:
+    """
+    Loads a peer review record without going online: the journal is left as its
+    ISSN for `resolve_review_journals` to name.
+    """
+    return _extract(review_path, REVIEW_SPEC, engine)
+
+
+def resolve_review_journals(
+    review_dict: Dict[str, Any],
+    workers: int = LOOKUP_WORKERS,
+    lookup_cache: Optional[LookupCache] = None,
+) -> Dict[str, Any]:
+    """
+    Fills in the journal name (`org`) of every parsed peer review by ISSN. Each
+    distinct ISSN is looked up once, up to `workers` at a time over one pooled
+    session, so the cost scales with the number of journals, not of reviews.
+    Names are kept in the shared lookup cache, or in `lookup_cache` if given.
+    """
+    issns = list(dict.fromkeys(r["issn"] for r in review_dict.values() if r.get("issn")))
+    if not issns:
+        return review_dict
+
+    cache = lookup_cache or get_lookup_cache()
+    names = {issn: name for issn, (_, name) in cache.get_many(ISSN_TITLE, issns).items()}
+    missing = [issn for issn in issns if issn not in names]
+    if missing:
+        workers = max(1, min(workers, len(missing)))
+        with _make_session(workers) as session, ThreadPoolExecutor(workers) as pool:
+            fetched = pool.map(lambda issn: _fetch_issn_title(issn, session), missing)
+            for issn, name in zip(missing, fetched):
+                names[issn] = name
+        cache.put_many(ISSN_TITLE, {issn: (bool(names[issn]), names[issn]) for issn in missing})
+
+    for issn in issns:
+        if not names[issn]:
+            print(f"Could not identify ISSN {issn}")
+    for r in review_dict.values():
+        if r.get("issn"):
+            r["org"] = names[r["issn"]].title()
+    return review_dict
+
+
+def load_review(
+    review_path: XmlSource,
+    engine: str = "stream",
+    lookup_cache: Optional[LookupCache] = None,
+) -> Review:
+    """
+    Loads a peer review record, lookup journal name by ISSN online. To load many,
+    `parse_review` them and `resolve_review_journals` once for all of them.
+    """
+    out_review_dict = parse_review(review_path, engine)
+    resolve_review_journals({"": out_review_dict}, workers=1, lookup_cache=lookup_cache)
     return out_review_dict
 
 
-def folder_to_dict(path: str, load_fun: Callable[[str], Any]) -> Dict[str, Any]:
-    """Reads all XML files in a directory and applies a loader function to each."""
-    _dict = {}
-    if not os.path.exists(path):
-        logger.warning(f"Directory does not exist: {path}")
-        return _dict
-        
-    xml_list = os.listdir(path)
-    for x in xml_list:
-        if x.endswith(".xml"):
-            _dict[x[:-4]] = load_fun(os.path.join(path, x))
-    return _dict
+def _process_pool(workers: Optional[int]):
+    """
+    Returns a process pool for `workers` above one, otherwise a null context so
+    callers can write `with _process_pool(n) as executor:` either way. Worker
+    processes are only started once the pool is first handed some work.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        return nullcontext(None)
+    return ProcessPoolExecutor(max_workers=workers)
 
 
-def extract_orcid_info(orcid_dir: str) -> Dict[str, Any]:
+def _load_counting_misses(
+    load_fun: Callable[[XmlSource], Any], xml_path: XmlSource
+) -> Tuple[Any, Dict[str, int]]:
+    """Runs a loader in a worker process, returning the fields it found missing too."""
+    _missing_fields.clear()
+    return load_fun(xml_path), dict(_missing_fields)
+
+
+def _report_missing(folder: str, missing: Dict[str, int], total: int) -> None:
+    """Logs how many files of a folder lacked each field, one line per field."""
+    if not missing or not logger.isEnabledFor(logging.INFO):
+        return
+    for name, count in sorted(missing.items()):
+        logger.info(f"{folder}: no {name} in {count} of {total} files")
+
+
+def _map_files(
+    load_fun: Callable[[XmlSource], Any],
+    xml_paths: List[XmlSource],
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    folder: str = "",
+) -> List[Any]:
     """
-    Coordinates XML parsing across personal, works, and affiliations,
-    caching findings as an ORCID.json file.
+    Applies a loader to every file, in a process pool when it is worth it, and
+    reports the fields missing from them once for the whole `folder`.
     """
-    json_path = os.path.join(orcid_dir, "ORCID.json")
-    if os.path.isfile(json_path):
-        print("Loading ORCID dict from local json.")
-        with open(json_path, encoding="utf-8") as f:
-            cached = json.load(f)
-
-        # Caches written before the service section existed lack that key. Read
-        # just that folder back in rather than re-parsing everything, which would
-        # repeat the preprint and ISSN network lookups.
-        if "service" not in cached:
-            print("Adding service section to cached json.")
-            cached["service"] = folder_to_dict(
-                os.path.join(orcid_dir, "affiliations", "services"), load_affiliation
-            )
-            with open(json_path, "w", encoding="utf-8") as fp:
-                json.dump(cached, fp, indent=4)
+    workers = resolve_workers(workers)
+    if (workers <= 1 and executor is None) or len(xml_paths) < PARALLEL_MIN_FILES:
+        _missing_fields.clear()
+        records = [load_fun(x) for x in xml_paths]
+        _report_missing(folder, _missing_fields, len(xml_paths))
+        return records
 
-        return cached
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(xml_paths) / (workers * 4)))
+    load = partial(_load_counting_misses, load_fun)
+    missing: Counter = Counter()
+    records = []
+    with nullcontext(executor) if executor else _process_pool(workers) as pool:
+        for record, record_missing in pool.map(load, xml_paths, chunksize=chunksize):
+            records.append(record)
+            missing.update(record_missing)
+    _report_missing(folder, missing, len(xml_paths))
+    return records
 
-    # Personal info
-    person_path = os.path.join(orcid_dir, "person.xml")
-    if not os.path.exists(person_path):
-        raise FileNotFoundError(f"Missing required person.xml in {orcid_dir}")
-        
-    personal_info = load_xml(person_path)
+
+def folder_to_dict(
+    path: str,
+    load_fun: Callable[[XmlSource], Any],
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Reads all XML files in a directory and applies a loader function to each.
+    The directory may also be a folder inside a zipped dump, e.g.
+    'orcid.zip/works', whose members are read without extracting them.
+
+    With `workers` above one (None for every core) the files are sent to a process
+    pool in chunks of `chunksize` (by default about four chunks per worker) and
+    the records come back in directory order. Pass `executor` to reuse a pool
+    across folders. Folders smaller than PARALLEL_MIN_FILES are always parsed
+    serially. `load_fun` must be a module-level function so it can be pickled,
+    and on Windows the calling script needs an `if __name__ == "__main__":` guard.
+    """
+    dump, folder = open_dump_folder(path)
+    if dump is None:
+        logger.warning(f"Directory does not exist: {path}")
+        return {}
+
+    with dump:
+        return _folder_records(dump, folder, load_fun, workers, chunksize, executor)
+
+
+def _folder_records(
+    dump: Dump,
+    folder: str,
+    load_fun: Callable[[XmlSource], Any],
+    workers: Optional[int] = 1,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """Loads every XML file in one folder of an open dump, keyed by file name."""
+    if not dump.has_folder(folder):
+        logger.warning(f"Directory does not exist: {folder}")
+        return {}
+
+    rels = dump.list(folder)
+    records = _map_files(
+        load_fun,
+        [dump.source(rel) for rel in rels],
+        workers=workers,
+        chunksize=chunksize,
+        executor=executor,
+        folder=folder or os.path.basename(os.path.normpath(dump.path)),
+    )
+    return {_record_key(rel): record for rel, record in zip(rels, records)}
+
+
+def load_person(person_path: XmlSource, engine: str = "stream") -> Dict[str, Any]:
+    """Loads the owner's name, ORCID link, researcher URLs and primary email."""
+    person = _extract(person_path, PERSON_SPEC, engine)
     personal = {
-        "lastname": get_recursive_key(
-            personal_info, "person:name", "personal-details:family-name"
-        ),
-        "givenname": get_recursive_key(
-            personal_info, "person:name", "personal-details:given-names"
-        ),
-        "links": {
-            "ORCID": "https://orcid.org/"
-            + get_recursive_key(personal_info, "person:name", "@path")
-        },
+        "lastname": person["lastname"],
+        "givenname": person["givenname"],
+        "links": {"ORCID": "https://orcid.org/" + person["orcid"], **person["links"]},
     }
     
     personal["fullname"] = personal["givenname"] + " " + personal["lastname"]
-    from orcid_cv.utils import initialize_name
     personal["name-short"] = initialize_name(personal["fullname"])
     
     first_space = personal["fullname"].find(" ")
     personal["firstname"] = personal["fullname"][0:first_space] if first_space != -1 else personal["fullname"]
+    personal["email"] = person["email"]
+
+    return personal
+
+
+# Cache section -> folder holding its XML records (relative to the dump) and
+# the loader for each file in it, in the order sections appear in the cache.
+SECTION_FOLDERS = {
+    "work": ("works", load_work),
+    "employment": ("affiliations/employments", load_affiliation),
+    "education": ("affiliations/educations", load_affiliation),
+    "service": ("affiliations/services", load_affiliation),
+    "funding": ("fundings", load_funding),
+    "reviews": ("peer_reviews", parse_review),
+}
 
-    # Extract links
-    if "researcher-url:researcher-urls" in personal_info.keys():
-        link_list = get_recursive_key(
-            personal_info,
-            "researcher-url:researcher-urls",
-            "researcher-url:researcher-url",
+
+def _section_of(rel: str) -> Optional[str]:
+    """Returns the cache section a dump file belongs to, None for person.xml."""
+    folder = rel.rpartition("/")[0]
+    for section, (section_folder, _) in SECTION_FOLDERS.items():
+        if folder == section_folder:
+            return section
+    return None
+
+
+def _record_key(rel: str) -> str:
+    """Key of a record in its section: the file name without '.xml'."""
+    return rel.rpartition("/")[2][:-4]
+
+
+def extract_orcid_info(
+    orcid_dir: str,
+    workers: Optional[int] = 1,
+    cache_path: Optional[str] = None,
+    cache_format: Optional[str] = None,
+    similarity: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Coordinates XML parsing across personal, works, and affiliations,
+    caching findings as an ORCID.json file.
+
+    `orcid_dir` is the unpacked dump or the zip archive ORCID delivers, which is
+    read in place. The cache goes to `cache_path`, by default ORCID.json inside
+    the dump folder or '<archive name>.ORCID.json' next to the archive.
+
+    The cache remembers the size, mtime and hash of every file it was built
+    from. Loading it again re-parses only files added or edited since and drops
+    records whose file was removed; duplicate pruning and preprint lookups run
+    only for the works that were re-parsed.
+
+    `workers` above one (None for every core) parses the record folders in a
+    single shared process pool; see `folder_to_dict`.
+
+    `cache_format` 'sections' saves the cache as a binary file (ORCID.pkl by
+    default) whose sections are only decoded when first looked up, so a build
+    that uses two sections does not pay for the rest. Later calls that load it
+    return a `SectionedCache`; the call that writes it from the XML, or from a
+    JSON cache it converts, returns the plain dict it saved. By default the
+    format follows the extension of `cache_path`, and is JSON otherwise. When
+    there is no cache at `cache_path` but one of the other format sits beside
+    it under the same name (ORCID.json for ORCID.pkl and the other way round),
+    that one is read and written out in the format asked for.
+
+    `similarity` below 1 (e.g. 0.85) also merges preprints into articles with
+    nearly the same title; see `prune_duplicate_works`. It defaults to
+    `NEAR_DUPLICATE_THRESHOLD` and applies to the works parsed by the call, so
+    delete the cache to regroup works it already holds.
+    """
+    if cache_format is not None and cache_format not in CACHE_FORMATS:
+        raise ValueError(
+            f"Invalid cache format: {cache_format}. Choose one of {tuple(CACHE_FORMATS)}."
         )
-        if isinstance(link_list, list):
-            for link in link_list:
-                personal["links"][link["researcher-url:url-name"]] = link["researcher-url:url"]
-        elif isinstance(link_list, dict):
-            personal["links"][link_list["researcher-url:url-name"]] = link_list["researcher-url:url"]
-
-    # Get primary email
-    emails_wrapper = personal_info.get("email:emails")
-    if emails_wrapper and isinstance(emails_wrapper.get("email:email"), list):
-        email_list = emails_wrapper["email:email"]
-        primary_emails = [e["email:email"] for e in email_list if e.get("@primary") == "true"]
-        if primary_emails:
-            personal["email"] = primary_emails[0]
-        elif email_list:
-            personal["email"] = email_list[0]["email:email"]
-        else:
-            personal["email"] = ""
-    elif emails_wrapper and isinstance(emails_wrapper.get("email:email"), dict):
-        personal["email"] = emails_wrapper["email:email"].get("email:email", "")
-    else:
-        personal["email"] = ""
+    with open_dump(orcid_dir) as dump:
+        if cache_path is None:
+            stem = os.path.splitext(dump.default_cache_path)[0]
+            cache_path = stem + CACHE_FORMATS[cache_format or "json"]
+        if cache_format is None:
+            is_sections = cache_path.endswith(CACHE_FORMATS["sections"])
+            cache_format = "sections" if is_sections else "json"
+        read_path = _existing_cache(cache_path)
+        return _extract_dump(dump, workers, cache_path, cache_format, read_path, similarity)
+
+
+def _existing_cache(cache_path: str) -> str:
+    """
+    The cache to load for `cache_path`: itself if it exists, otherwise a cache
+    of another format with the same name if there is one.
+    """
+    if not os.path.isfile(cache_path):
+        stem, ext = os.path.splitext(cache_path)
+        for other_ext in CACHE_FORMATS.values():
+            if other_ext != ext and os.path.isfile(stem + other_ext):
+                return stem + other_ext
+    return cache_path
+
+
+def _extract_dump(
+    dump: Dump,
+    workers: Optional[int],
+    json_path: str,
+    cache_format: str = "json",
+    read_path: Optional[str] = None,
+    similarity: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Does the work of `extract_orcid_info` on an open dump, loading the cache at
+    `read_path` (by default `json_path`) and saving it to `json_path`.
+    """
+    folders = [folder for folder, _ in SECTION_FOLDERS.values()]
+    read_path = read_path or json_path
+    if similarity is None:
+        similarity = NEAR_DUPLICATE_THRESHOLD
+
+    if os.path.isfile(read_path):
+        print(f"Loading ORCID dict from local cache {os.path.basename(read_path)}.")
+        cached, previous = read_cache(read_path)
+        current = scan_sources(dump, folders)
+        if "person.xml" not in current:
+            # The XML has been cleared out since; the cache is all that is left
+            return cached
+
+        untracked = previous is None
+        if untracked:
+            # Caches written before files were tracked: trust every section they
+            # have and only read the folders of sections they lack (the service
+            # section was added this way). They are rewritten with the records
+            # below, so this hashing happens once.
+            hash_sources(dump, current)
+            previous = {
+                rel: entry
+                for rel, entry in current.items()
+                if _section_of(rel) is None or _section_of(rel) in cached
+            }
+
+        changed, deleted = diff_sources(dump, previous, current)
+        if changed or deleted:
+            print(f"Updating cache: {len(changed)} new or edited, {len(deleted)} removed.")
+            _update_cached(
+                dump, cached, previous, current, changed, deleted, workers,
+                index_path(json_path), similarity,
+            )
+        converted = (
+            read_path != json_path
+            or isinstance(cached, SectionedCache) != (cache_format == "sections")
+        )
+        if changed or deleted or current != previous or converted or untracked:
+            write_cache(json_path, cached, current, cache_format)
+        return cached
+
+    # Personal info
+    if not dump.exists("person.xml"):
+        raise FileNotFoundError(f"Missing required person.xml in {dump.path}")
+    personal = load_person(dump.source("person.xml"))
 
     # Parse XML folders to make dictionaries
-    employment_dict = folder_to_dict(
-        os.path.join(orcid_dir, "affiliations", "employments"), load_affiliation
-    )
-    education_dict = folder_to_dict(
-        os.path.join(orcid_dir, "affiliations", "educations"), load_affiliation
-    )
-    service_dict = folder_to_dict(
-        os.path.join(orcid_dir, "affiliations", "services"), load_affiliation
-    )
-    work_dict = folder_to_dict(os.path.join(orcid_dir, "works"), load_work)
-    funding_dict = folder_to_dict(os.path.join(orcid_dir, "fundings"), load_funding)
-    review_dict = folder_to_dict(os.path.join(orcid_dir, "peer_reviews"), load_review)
+    sections = {}
+    with _process_pool(workers) as executor:
+        for section, (folder, loader) in SECTION_FOLDERS.items():
+            sections[section] = _folder_records(
+                dump, folder, loader, workers=workers, executor=executor
+            )
 
     # Check for duplicate work dicts & get preprint repositories
-    work_dict = prune_duplicate_works(work_dict)
+    merged: Dict[str, str] = {}
+    index = DedupIndex(similarity)
+    work_dict = prune_duplicate_works(sections["work"], merged=merged, index=index)
     work_dict = find_preprint_repository(work_dict)
+    resolve_review_journals(sections["reviews"])
 
     out_dict = {
         "personal": personal,
-        "work": work_dict,
-        "employment": employment_dict,
-        "education": education_dict,
-        "service": service_dict,
-        "funding": funding_dict,
-        "reviews": review_dict,
+        "work": WorkMap(work_dict),
+        "employment": sections["employment"],
+        "education": sections["education"],
+        "service": sections["service"],
+        "funding": sections["funding"],
+        "reviews": sections["reviews"],
     }
 
+    sources = scan_sources(dump, folders)
+    hash_sources(dump, sources)
+    for dk, keep_key in merged.items():
+        sources[f"works/{dk}.xml"]["merged_into"] = keep_key
+
     # Save cache
-    print("Saving local json.")
-    with open(json_path, "w", encoding="utf-8") as fp:
-        json.dump(out_dict, fp, indent=4)
+    print(f"Saving local cache {os.path.basename(json_path)}.")
+    write_cache(json_path, out_dict, sources, cache_format)
+    index.save(index_path(json_path))
 
     return out_dict
+
+
+def _update_cached(
+    dump: Dump,
+    cached: Dict[str, Any],
+    previous: Sources,
+    current: Sources,
+    changed: List[str],
+    deleted: List[str],
+    workers: Optional[int] = 1,
+    dedup_path: Optional[str] = None,
+    similarity: float = NEAR_DUPLICATE_THRESHOLD,
+) -> None:
+    """
+    Applies added, edited and removed dump files to a loaded cache in place and
+    records in `current` which re-parsed works were merged into which.
+
+    Duplicates are grouped at `similarity` with the index saved at
+    `dedup_path`, which is updated. Without one, or if it was built at another
+    similarity, it is rebuilt from the cached works.
+    """
+    if "person.xml" in changed:
+        cached["personal"] = load_person(dump.source("person.xml"))
+
+    # A merged-away duplicate only lives on inside its representative, so a
+    # change to any member of a duplicate group re-parses the whole group.
+    def group_of(key: str) -> str:
+        return previous.get(f"works/{key}.xml", {}).get("merged_into", key)
+
+    touched_works = {
+        group_of(_record_key(rel))
+        for rel in changed + deleted
+        if _section_of(rel) == "work" and rel in previous
+    }
+    regrouped = [
+        rel
+        for rel in current
+        if _section_of(rel) == "work" and group_of(_record_key(rel)) in touched_works
+    ]
+
+    to_parse: Dict[str, List[str]] = defaultdict(list)
+    for rel in dict.fromkeys(changed + regrouped):
+        if _section_of(rel) is not None:
+            to_parse[_section_of(rel)].append(rel)
+
+    for rel in deleted:
+        section = _section_of(rel)
+        if section is not None:
+            cached.get(section, {}).pop(_record_key(rel), None)
+    for key in touched_works:
+        cached.get("work", {}).pop(key, None)
+
+    parsed: Dict[str, Dict[str, Any]] = {}
+    with _process_pool(workers) as executor:
+        for section, rels in to_parse.items():
+            loader = SECTION_FOLDERS[section][1]
+            records = _map_files(
+                loader,
+                [dump.source(rel) for rel in rels],
+                workers=workers,
+                executor=executor,
+                folder=SECTION_FOLDERS[section][0],
+            )
+            parsed[section] = {_record_key(rel): r for rel, r in zip(rels, records)}
+            cached.setdefault(section, {}).update(parsed[section])
+
+    resolve_review_journals(parsed.get("reviews", {}))
+
+    new_works = parsed.get("work", {})
+    removed_works = [_record_key(rel) for rel in deleted if _section_of(rel) == "work"]
+    if not new_works and not removed_works:
+        return
+
+    index = load_index(dedup_path, similarity) if dedup_path else None
+    if index is None:
+        index = DedupIndex(similarity)
+    else:
+        # Union-find cannot split groups: drop edited and removed works by regrouping
+        stale = [key for key in [*new_works, *removed_works] if key in index]
+        if stale:
+            index = index.without(stale)
+
+    merged: Dict[str, str] = {}
+    prune_duplicate_works(cached["work"], keys=new_works, merged=merged, index=index)
+    if dedup_path:
+        index.save(dedup_path)
+    for key in new_works:
+        current[f"works/{key}.xml"].pop("merged_into", None)
+    for dk, keep_key in merged.items():
+        current[f"works/{dk}.xml"]["merged_into"] = keep_key
+    # Older duplicates of a work that has now been merged follow it along
+    for entry in current.values():
+        while entry.get("merged_into") in merged:
+            entry["merged_into"] = merged[entry["merged_into"]]
+
+    find_preprint_repository(
+        {key: cached["work"][key] for key in new_works if key in cached["work"]}
+    )
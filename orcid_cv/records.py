@@ -0,0 +1,235 @@
+"""
+Slotted record types for parsed works, affiliations, fundings and reviews.
+
+A bulk run holds hundreds of thousands of records that share a handful of field
+names, so keeping each one as a dict spends most of its memory on repeating
+the same hash table layout. Records keep their known fields in `__slots__`
+instead and can be read as attributes (`work.title`). They still behave as
+mutable mappings, so `work["title"]`, `work.get("year")` and scripts editing
+`orcid_dict` the way `my_cv.py` does keep working.
+
+Every known field is always set: one missing from the data a record is made
+from takes its default ('', [] for lists and None for a work's keys), and
+deleting one resets it. Fields the record type does not know are kept in a
+small overflow dict. Records convert to plain dicts for the JSON cache and back
+with no loss.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Work fields whose value decides where a work sits in a `WorkMap` index
+INDEXED_FIELDS = frozenset(("type", "year", "month"))
+
+# Fields holding lists; see `_default`
+_LIST_FIELDS = frozenset(("authors", "external_ids", "author_orcids"))
+
+_MISSING = object()
+
+
+def _slot_name(field: str) -> str:
+    """The attribute a field is stored in, renamed where it would hide a method."""
+    return field + "_" if hasattr(MutableMapping, field) else field
+
+
+def _slots(fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(_slot_name(field) for field in fields)
+
+
+def _default(field: str) -> Any:
+    """The value of a field missing from the data a record was made from."""
+    if field in _LIST_FIELDS:
+        return []
+    return None if field == "keys" else ""
+
+
+class Record(MutableMapping):
+    """Base class of the record types: a mapping over slotted fields."""
+
+    __slots__ = ("_extra",)
+    FIELDS: Tuple[str, ...] = ()
+    # Field -> the attribute holding it and back, filled in for every record type
+    _SLOT: Dict[str, str] = {}
+    _FIELD: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._SLOT = {field: _slot_name(field) for field in cls.FIELDS}
+        cls._FIELD = {slot: field for field, slot in cls._SLOT.items()}
+
+    def __init__(self, values: Any = (), **kwargs: Any):
+        values = dict(values, **kwargs)
+        for field, slot in self._SLOT.items():
+            value = values.pop(field, _MISSING)
+            object.__setattr__(self, slot, _default(field) if value is _MISSING else value)
+        object.__setattr__(self, "_extra", values or None)
+
+    def _changed(self, field: str) -> None:
+        """Called after a field is set or reset."""
+
+    def __getitem__(self, field: str) -> Any:
+        slot = self._SLOT.get(field)
+        if slot is not None:
+            return getattr(self, slot)
+        if self._extra is None:
+            raise KeyError(field)
+        return self._extra[field]
+
+    def get(self, field: str, default: Any = None) -> Any:
+        slot = self._SLOT.get(field)
+        if slot is not None:
+            return getattr(self, slot)
+        if self._extra is None:
+            return default
+        return self._extra.get(field, default)
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        slot = self._SLOT.get(field)
+        if slot is not None:
+            object.__setattr__(self, slot, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[field] = value
+        self._changed(field)
+
+    def __delitem__(self, field: str) -> None:
+        # Known fields cannot go missing, so removing one resets it
+        slot = self._SLOT.get(field)
+        if slot is not None:
+            object.__setattr__(self, slot, _default(field))
+        elif self._extra is None:
+            raise KeyError(field)
+        else:
+            del self._extra[field]
+        self._changed(field)
+
+    def __delattr__(self, name: str) -> None:
+        field = self._FIELD.get(name)
+        if field is None:
+            object.__delattr__(self, name)
+        else:
+            del self[field]
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._SLOT or (self._extra is not None and field in self._extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._SLOT
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self._SLOT) + len(self._extra or ())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The record as a plain dict, fields in their usual order."""
+        out = {field: getattr(self, slot) for field, slot in self._SLOT.items()}
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    def copy(self) -> "Record":
+        return type(self)(self.to_dict())
+
+    def __reduce__(self) -> Any:
+        return (type(self), (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Work(Record):
+    """
+    A work, e.g. a journal article, preprint or talk. A work held by a `WorkMap`
+    tells it when its type, year or month changes.
+    """
+
+    FIELDS = (
+        "type",
+        "title",
+        "subtitle",
+        "journal",
+        "doi",
+        "year",
+        "month",
+        "authors",
+        "external_ids",
+        "keys",
+        "author_orcids",
+    )
+    __slots__ = _slots(FIELDS) + ("_owner",)
+
+    def __init__(self, values: Any = (), **kwargs: Any):
+        object.__setattr__(self, "_owner", None)
+        super().__init__(values, **kwargs)
+
+    def _changed(self, field: str) -> None:
+        if field in INDEXED_FIELDS and self._owner is not None:
+            self._owner.version += 1
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        self._changed(name)
+
+
+class Affiliation(Record):
+    """An employment, education or service entry."""
+
+    FIELDS = ("organization", "department", "role", "start_date", "end_date", "date_range")
+    __slots__ = _slots(FIELDS)
+
+
+class Funding(Record):
+    """A grant or award."""
+
+    FIELDS = ("title", "role", "org", "id", "start_year", "end_year", "value")
+    __slots__ = _slots(FIELDS)
+
+
+class Review(Record):
+    """A peer review, counted per journal."""
+
+    FIELDS = ("year", "role", "org", "issn")
+    __slots__ = _slots(FIELDS)
+
+
+# Record type of every section of a parsed profile
+SECTION_RECORDS = {
+    "work": Work,
+    "employment": Affiliation,
+    "education": Affiliation,
+    "service": Affiliation,
+    "funding": Funding,
+    "reviews": Review,
+}
+
+
+def as_record(record_type: type, value: Mapping) -> Record:
+    """
+    `value` if it already is a `record_type`, else a copy of it as one, e.g.
+    for an entry a script added to `orcid_dict` as a plain dict.
+    """
+    return value if type(value) is record_type else record_type(value)
+
+
+def section_records(name: str, section: Any) -> Any:
+    """
+    Converts the entries of a loaded section to its record type, in place.
+    Sections without a record type, and entries that are not mappings, are left
+    alone.
+    """
+    record_type: Optional[type] = SECTION_RECORDS.get(name)
+    if record_type is None or not isinstance(section, dict):
+        return section
+    for key, value in section.items():
+        if type(value) is not record_type and isinstance(value, Mapping):
+            section[key] = record_type(value)
+    return section
+
+
+def json_default(obj: Any) -> Any:
+    """`default` hook for `json.dump` that writes records as plain objects."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,205 @@
+"""
+Declarative specs of the ORCID record types.
+
+A `RecordSpec` says where every field of a record lives in its XML file, how
+many values it takes, which occurrences count and what it defaults to. It
+compiles once into a `StreamExtractor` that reads every path it needs in one
+pass over the file, plus a builder that turns what was read into the record.
+Adding a field to a record is then one more entry in its spec, with no extra
+walk over the file and no hand-written handling of single versus repeated
+elements.
+
+Fields are one of:
+
+- `Text`: the text or attribute at a path, the first occurrence winning.
+- `Column`: one field of every occurrence of a repeated element, as a list.
+- `Sole`: one field of a repeated element that must occur exactly once.
+- `First`: one field of the first occurrence, or of the first one flagged.
+- `Pairs`: two fields of every occurrence, as a dict.
+
+Repeated elements are declared once per spec as `Repeated` groups and shared by
+name, so fields read from the same element (a contributor's name and ORCID iD)
+stay aligned.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from orcid_cv.stream import Entries, Path, StreamExtractor
+
+Values = Dict[str, str]
+Groups = Dict[str, Entries]
+
+
+class Repeated:
+    """
+    An element that may occur any number of times, e.g. a work's contributors,
+    and the paths to read inside each occurrence. Occurrences lacking any of the
+    fields in `require` are dropped.
+    """
+
+    __slots__ = ("root", "fields", "require")
+
+    def __init__(self, root: Path, fields: Dict[str, Path], require: Tuple[str, ...] = ()):
+        self.root = root
+        self.fields = fields
+        self.require = require
+
+    def entries(self, found: Entries) -> Entries:
+        if not self.require:
+            return found
+        return [e for e in found if all(e.get(name) for name in self.require)]
+
+
+class Text:
+    """The text at `path`, passed through `convert` when found, else `default`."""
+
+    __slots__ = ("path", "default", "convert")
+
+    def __init__(
+        self, path: Path, default: Any = "", convert: Optional[Callable[[str], Any]] = None
+    ):
+        self.path = path
+        self.default = default
+        self.convert = convert
+
+    def value(self, name: str, values: Values, groups: Groups) -> Any:
+        text = values.get(name)
+        if text is None:
+            return self.default
+        return text if self.convert is None else self.convert(text)
+
+
+class Column:
+    """
+    `field` of every occurrence of `group`, in document order. Occurrences
+    without it are left out unless `keep_empty`, which puts '' in their place so
+    the list lines up with another column of the group. `where=(field, value)`
+    keeps only the occurrences where that field has that value; with
+    `where_several` the filter only applies when there is more than one.
+    `if_any` gives the default, [], unless some occurrence has the field.
+    """
+
+    __slots__ = ("group", "field", "where", "where_several", "keep_empty", "if_any")
+
+    def __init__(
+        self,
+        group: str,
+        field: str,
+        where: Optional[Tuple[str, str]] = None,
+        where_several: bool = False,
+        keep_empty: bool = False,
+        if_any: bool = False,
+    ):
+        self.group = group
+        self.field = field
+        self.where = where
+        self.where_several = where_several
+        self.keep_empty = keep_empty
+        self.if_any = if_any
+
+    def value(self, name: str, values: Values, groups: Groups) -> Any:
+        entries = groups[self.group]
+        if self.where is not None and (not self.where_several or len(entries) > 1):
+            key, wanted = self.where
+            entries = [e for e in entries if e.get(key) == wanted]
+        column = [e.get(self.field, "") for e in entries]
+        if self.if_any and not any(column):
+            return []
+        return column if self.keep_empty else [v for v in column if v]
+
+
+class Sole:
+    """`field` of the only occurrence of `group`; `default` for none or several."""
+
+    __slots__ = ("group", "field", "default")
+
+    def __init__(self, group: str, field: str, default: Any = ""):
+        self.group = group
+        self.field = field
+        self.default = default
+
+    def value(self, name: str, values: Values, groups: Groups) -> Any:
+        entries = groups[self.group]
+        if len(entries) != 1:
+            return self.default
+        return entries[0].get(self.field, self.default)
+
+
+class First:
+    """
+    `field` of the first occurrence of `group` whose `flag` field is "true",
+    falling back to the first occurrence, or `default` if there is none.
+    """
+
+    __slots__ = ("group", "field", "flag", "default")
+
+    def __init__(self, group: str, field: str, flag: Optional[str] = None, default: Any = ""):
+        self.group = group
+        self.field = field
+        self.flag = flag
+        self.default = default
+
+    def value(self, name: str, values: Values, groups: Groups) -> Any:
+        entries = groups[self.group]
+        if not entries:
+            return self.default
+        if self.flag is not None:
+            for e in entries:
+                if e.get(self.flag) == "true":
+                    return e.get(self.field, self.default)
+        return entries[0].get(self.field, self.default)
+
+
+class Pairs:
+    """`{key field: value field}` over the occurrences of `group` that have a key."""
+
+    __slots__ = ("group", "key", "field")
+
+    def __init__(self, group: str, key: str, field: str):
+        self.group = group
+        self.key = key
+        self.field = field
+
+    def value(self, name: str, values: Values, groups: Groups) -> Any:
+        return {e[self.key]: e.get(self.field, "") for e in groups[self.group] if e.get(self.key)}
+
+
+FieldSpec = Union[Text, Column, Sole, First, Pairs]
+
+
+class RecordSpec:
+    """
+    A record type's fields, compiled into an `extractor` that reads all of them
+    in one pass and a `build` step making the record from what it read.
+    """
+
+    def __init__(
+        self,
+        record_type: Callable[..., Any],
+        fields: Dict[str, FieldSpec],
+        groups: Optional[Dict[str, Repeated]] = None,
+    ):
+        self.record_type = record_type
+        self.fields = dict(fields)
+        self.groups = dict(groups or {})
+        for name, spec in self.fields.items():
+            group = getattr(spec, "group", None)
+            if group is not None and group not in self.groups:
+                raise ValueError(f"Field {name} reads undeclared group {group}")
+
+        self.extractor = StreamExtractor(
+            {name: spec.path for name, spec in self.fields.items() if isinstance(spec, Text)},
+            {name: (group.root, group.fields) for name, group in self.groups.items()},
+        )
+        self._steps = [(name, spec.value) for name, spec in self.fields.items()]
+        self._filtered = [
+            (name, group.entries) for name, group in self.groups.items() if group.require
+        ]
+
+    def build(self, values: Values, groups: Groups) -> Any:
+        """The record made from the `(values, groups)` the extractor returned."""
+        for name, entries in self._filtered:
+            groups[name] = entries(groups[name])
+        return self.record_type(
+            {name: value(name, values, groups) for name, value in self._steps}
+        )
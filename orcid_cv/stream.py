@@ -0,0 +1,174 @@
+"""
+Streaming extraction of ORCID records.
+
+`load_xml` turns a whole file into an xmltodict tree only for the loaders to
+read a handful of paths back out of it. The extractors here walk each file once
+with expat, keep the text of the paths they were asked for and skip every other
+element without building anything for it.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+from xml.parsers import expat
+
+# A path of qualified element names below the record's root element, e.g.
+# ("work:title", "common:title"). A last component starting with "@" names an
+# attribute of the element before it and "#text" the element's own text, the
+# same spelling xmltodict uses for both.
+Path = Tuple[str, ...]
+
+# One dict of field values per occurrence of a repeated element
+Entries = List[Dict[str, str]]
+
+
+class StreamExtractor:
+    """
+    Pulls a fixed set of paths out of an ORCID XML record in a single pass.
+
+    `fields` maps output names to paths; the first occurrence of each path wins.
+    `groups` maps output names to a repeated element and the paths to read inside
+    each occurrence of it, e.g. every contributor of a work:
+
+        {"authors": (("work:contributors", "work:contributor"),
+                     {"name": ("work:credit-name",)})}
+
+    Calling the extractor on a file returns `(values, groups)`: the text of every
+    field found, and one dict per occurrence of every group in document order.
+    Text is whitespace-stripped and missing or empty elements are left out, which
+    is how xmltodict and `get_recursive_key` treat them.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Path],
+        groups: Optional[Dict[str, Tuple[Path, Dict[str, Path]]]] = None,
+    ):
+        self.fields = dict(fields)
+        self.groups = dict(groups or {})
+
+        # Leaf element path -> output name, split by whether it sits in a group
+        self._texts: Dict[Path, str] = {}
+        self._group_texts: Dict[Path, Tuple[str, str]] = {}
+        # Element path -> [(attribute, output name)]
+        self._attrs: Dict[Path, List[Tuple[str, str]]] = {}
+        self._group_attrs: Dict[Path, List[Tuple[str, str, str]]] = {}
+        # Element path -> group name for each repeated element
+        self._group_roots: Dict[Path, str] = {}
+
+        for name, path in self.fields.items():
+            if path and path[-1] == "#text":
+                self._texts[path[:-1]] = name
+            elif path and path[-1].startswith("@"):
+                self._attrs.setdefault(path[:-1], []).append((path[-1][1:], name))
+            else:
+                self._texts[path] = name
+
+        for group, (root, sub_fields) in self.groups.items():
+            self._group_roots[root] = group
+            for name, sub_path in sub_fields.items():
+                path = root + sub_path
+                if sub_path and sub_path[-1] == "#text":
+                    self._group_texts[path[:-1]] = (group, name)
+                elif sub_path and sub_path[-1].startswith("@"):
+                    self._group_attrs.setdefault(path[:-1], []).append(
+                        (sub_path[-1][1:], group, name)
+                    )
+                else:
+                    self._group_texts[path] = (group, name)
+
+        # Every element on the way to something wanted; anything else is skipped
+        # along with its whole subtree.
+        targets = (
+            list(self._texts)
+            + list(self._group_texts)
+            + list(self._attrs)
+            + list(self._group_attrs)
+            + list(self._group_roots)
+        )
+        self._wanted = set()
+        for path in targets:
+            for i in range(len(path) + 1):
+                self._wanted.add(path[:i])
+
+    def __call__(
+        self, xml_source: Union[str, bytes]
+    ) -> Tuple[Dict[str, str], Dict[str, Entries]]:
+        """Extracts from a file path, or from the raw bytes of an XML file."""
+        if isinstance(xml_source, bytes):
+            return self._parse(xml_source)
+        with open(xml_source, "rb") as f:
+            return self._parse(f.read())
+
+    def _parse(self, data: bytes) -> Tuple[Dict[str, str], Dict[str, Entries]]:
+        values: Dict[str, str] = {}
+        groups: Dict[str, Entries] = {g: [] for g in self.groups}
+
+        wanted = self._wanted
+        texts = self._texts
+        group_texts = self._group_texts
+        attrs = self._attrs
+        group_attrs = self._group_attrs
+        group_roots = self._group_roots
+
+        # `stack` holds the path below the root for every open wanted element,
+        # `skip` counts how deep we are inside an element nobody asked for and
+        # `buffers` collects text per depth for the open elements that want it.
+        stack: List[Path] = []
+        buffers: Dict[int, List[str]] = {}
+        skip = 0
+        entry: Optional[Dict[str, str]] = None
+
+        def start(name: str, attributes: Dict[str, str]) -> None:
+            nonlocal skip, entry
+            if skip:
+                skip += 1
+                return
+            path = stack[-1] + (name,) if stack else ()
+            if path not in wanted:
+                skip = 1
+                return
+            stack.append(path)
+
+            if path in group_roots:
+                entry = {}
+                groups[group_roots[path]].append(entry)
+            if path in attrs:
+                for attr, out in attrs[path]:
+                    if out not in values and attributes.get(attr):
+                        values[out] = attributes[attr]
+            if path in group_attrs and entry is not None:
+                for attr, _, out in group_attrs[path]:
+                    if out not in entry and attributes.get(attr):
+                        entry[out] = attributes[attr]
+            if path in texts or path in group_texts:
+                buffers[len(stack)] = []
+
+        def end(name: str) -> None:
+            nonlocal skip, entry
+            if skip:
+                skip -= 1
+                return
+            buffer = buffers.pop(len(stack), None)
+            path = stack.pop()
+            if buffer is not None:
+                text = "".join(buffer).strip()
+                if text:
+                    if path in texts:
+                        values.setdefault(texts[path], text)
+                    elif entry is not None:
+                        entry.setdefault(group_texts[path][1], text)
+            if path in group_roots:
+                entry = None
+
+        def char_data(data: str) -> None:
+            # Only text sitting directly inside a wanted element is kept, the
+            # same as xmltodict's '#text' for an element that also has children.
+            if not skip and len(stack) in buffers:
+                buffers[len(stack)].append(data)
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = char_data
+        parser.Parse(data, True)
+        return values, groups
@@ -8,6 +8,22 @@ from reportlab.lib.pagesizes import letter
 logger = logging.getLogger("orcid_cv")
 
 
+class CellParagraph(Paragraph):
+    """
+    A Paragraph for table cells. Tables wrap their cells each time they are
+    measured, split or drawn, always to the width of the column, so the lines
+    are only broken again when that width changes.
+    """
+
+    def wrap(self, availWidth: float, availHeight: float) -> Tuple[float, float]:
+        wrapped = getattr(self, "_wrapped", None)
+        if wrapped is not None and wrapped[0] == availWidth:
+            return wrapped[1]
+        size = super().wrap(availWidth, availHeight)
+        self._wrapped = (availWidth, size)
+        return size
+
+
 class BaseStyleRenderer:
     """Abstract base class for CV style renderers."""
     def __init__(self, config: Dict[str, Any]):
@@ -16,7 +32,30 @@ class BaseStyleRenderer:
     def get_column_widths(self, section_type: str) -> List[float]:
         raise NotImplementedError()
 
-    def _heading_table_style(self) -> List[Tuple[Any, ...]]:
+    def heading_rows(self, section_heading: str) -> List[List[Any]]:
+        """The section heading row and the empty row carrying its rule."""
+        raise NotImplementedError()
+
+    def section_style(self, section_type: str) -> List[Tuple[Any, ...]]:
+        """
+        Style commands that hold for every row of a section's entries, so a
+        section laid out as one table needs them only once.
+        """
+        raise NotImplementedError()
+
+    def affiliation_rows(self, affiliation: Dict[str, Any]) -> List[List[Any]]:
+        raise NotImplementedError()
+
+    def work_rows(self, work_title: str, work_body: Paragraph, work_date: str) -> List[List[Any]]:
+        raise NotImplementedError()
+
+    def funding_rows(self, fund: Dict[str, Any]) -> List[List[Any]]:
+        raise NotImplementedError()
+
+    def review_rows(self, r: Tuple[str, int, str, int]) -> List[List[Any]]:
+        raise NotImplementedError()
+
+    def heading_style(self) -> List[Tuple[Any, ...]]:
         """
         Shared styles for the two rows that carry a section heading and its rule.
         The rule is drawn at the bottom of the empty row below the heading, so
@@ -80,9 +119,31 @@ class GreensponDefaultRenderer(BaseStyleRenderer):
         right_col_width = round(table_width / ratio)
         return [table_width - right_col_width, right_col_width]
 
-    def make_affiliation_table(
-        self, affiliation: Dict[str, Any], section_heading: str = ""
+    def heading_rows(self, section_heading: str) -> List[List[Any]]:
+        return [
+            [CellParagraph(section_heading, style=self.config["section_style"]), ""],
+            ["", ""],
+        ]
+
+    def section_style(self, section_type: str) -> List[Tuple[Any, ...]]:
+        style = [("VALIGN", (0, 0), (-1, -1), "TOP")]
+        if section_type == "review":
+            style.append(("HALIGN", (0, 0), (-1, -1), "LEFT"))
+        return style
+
+    def _entry_table(
+        self, section_type: str, rows: List[List[Any]], section_heading: str
     ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
+        """One entry as its own table, below the section heading if given."""
+        table_style = self.section_style(section_type) + [("NOSPLIT", (0, 0), (-1, -1))]
+        if section_heading == "":
+            return rows, table_style
+        return (
+            self.heading_rows(section_heading) + rows,
+            self.heading_style() + table_style,
+        )
+
+    def affiliation_rows(self, affiliation: Dict[str, Any]) -> List[List[Any]]:
         # Service entries do not always carry a department, so only join the
         # parts that are actually present.
         body = ", ".join(
@@ -93,123 +154,67 @@ class GreensponDefaultRenderer(BaseStyleRenderer):
             )
             if p
         )
-        affiliation_head = [
-            Paragraph(affiliation["role"], style=self.config["item_title_style"]),
-            Paragraph(affiliation["date_range"], style=self.config["item_date_style"]),
+        return [
+            [
+                CellParagraph(affiliation["role"], style=self.config["item_title_style"]),
+                CellParagraph(affiliation["date_range"], style=self.config["item_date_style"]),
+            ],
+            [CellParagraph(body, style=self.config["item_body_style"]), ""],
         ]
-        affiliation_body = [
-            Paragraph(body, style=self.config["item_body_style"]),
-            "",
+
+    def make_affiliation_table(
+        self, affiliation: Dict[str, Any], section_heading: str = ""
+    ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
+        return self._entry_table(
+            "affiliation", self.affiliation_rows(affiliation), section_heading
+        )
+
+    def work_rows(self, work_title: str, work_body: Paragraph, work_date: str) -> List[List[Any]]:
+        return [
+            [
+                CellParagraph(work_title, style=self.config["item_title_style"]),
+                CellParagraph(str(work_date), style=self.config["item_date_style"]),
+            ],
+            [work_body, ""],
         ]
-        if section_heading == "":
-            table_data = [affiliation_head, affiliation_body]
-            table_style = [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        else:
-            table_data = [
-                [Paragraph(section_heading, style=self.config["section_style"]), ""],
-                ["", ""],
-                affiliation_head,
-                affiliation_body,
-            ]
-            table_style = self._heading_table_style() + [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        return table_data, table_style
 
     def make_work_table(
         self, work_title: str, work_body: Paragraph, work_date: str, section_heading: str = ""
     ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
-        if section_heading == "":
-            table_data = [
-                [
-                    Paragraph(work_title, style=self.config["item_title_style"]),
-                    Paragraph(str(work_date), style=self.config["item_date_style"]),
-                ],
-                [work_body, ""],
-            ]
-            table_style = [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        else:
-            table_data = [
-                [Paragraph(section_heading, style=self.config["section_style"]), ""],
-                ["", ""],
-                [
-                    Paragraph(work_title, style=self.config["item_title_style"]),
-                    Paragraph(str(work_date), style=self.config["item_date_style"]),
-                ],
-                [work_body, ""],
-            ]
-            table_style = self._heading_table_style() + [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        return table_data, table_style
+        return self._entry_table(
+            "work", self.work_rows(work_title, work_body, work_date), section_heading
+        )
+
+    def funding_rows(self, fund: Dict[str, Any]) -> List[List[Any]]:
+        return [
+            [
+                CellParagraph(fund["title"], style=self.config["item_title_style"]),
+                CellParagraph(fund["start_year"], style=self.config["item_date_style"]),
+            ],
+            [
+                f"{fund['org']}, {fund['id']}",
+                CellParagraph(fund["role"], style=self.config["item_misc_style"]),
+            ],
+        ]
 
     def make_funding_table(
         self, fund: Dict[str, Any], section_heading: str = ""
     ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
-        fund_head = [
-            Paragraph(fund["title"], style=self.config["item_title_style"]),
-            Paragraph(fund["start_year"], style=self.config["item_date_style"]),
-        ]
-        fund_body = [
-            f"{fund['org']}, {fund['id']}",
-            Paragraph(fund["role"], style=self.config["item_misc_style"]),
-        ]
-        if section_heading == "":
-            table_data = [fund_head, fund_body]
-            table_style = [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        else:
-            table_data = [
-                [Paragraph(section_heading, style=self.config["section_style"]), ""],
-                ["", ""],
-                fund_head,
-                fund_body,
-            ]
-            table_style = self._heading_table_style() + [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-            ]
-        return table_data, table_style
+        return self._entry_table("affiliation", self.funding_rows(fund), section_heading)
 
-    def make_review_table(
-        self, r: Tuple[str, int, str, int], section_heading: str = ""
-    ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
+    def review_rows(self, r: Tuple[str, int, str, int]) -> List[List[Any]]:
         rev_body1 = f"{r[0]}, {r[1]} reviews" if r[1] > 1 else f"{r[0]}, 1 review"
         
         if r[3] == 0:
             rev_body2 = ""
         else:
             rev_body2 = f"{r[2]}, {r[3]} reviews" if r[3] > 1 else f"{r[2]}, 1 review"
+        return [[rev_body1, rev_body2]]
 
-        if section_heading == "":
-            table_data = [[rev_body1, rev_body2]]
-            table_style = [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-                ("HALIGN", (0, 0), (-1, -1), "LEFT"),
-            ]
-        else:
-            table_data = [
-                [Paragraph(section_heading, style=self.config["section_style"]), ""],
-                ["", ""],
-                [rev_body1, rev_body2],
-            ]
-            table_style = self._heading_table_style() + [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("NOSPLIT", (0, 0), (-1, -1)),
-                ("HALIGN", (0, 0), (-1, -1), "LEFT"),
-            ]
-        return table_data, table_style
+    def make_review_table(
+        self, r: Tuple[str, int, str, int], section_heading: str = ""
+    ) -> Tuple[List[List[Any]], List[Tuple[Any, ...]]]:
+        return self._entry_table("review", self.review_rows(r), section_heading)
 
     def add_person_section(self, elements: List[Any], orcid_dict: Dict[str, Any]) -> None:
         from orcid_cv.utils import dict_to_list
@@ -11,8 +11,9 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from orcid_cv.content import (
     prepare_affiliations,
@@ -22,10 +23,14 @@ from orcid_cv.content import (
     prepare_service,
     prepare_works,
 )
-from orcid_cv.utils import package_directory
+from orcid_cv.icons import ICON_DIRECTORY, icon_path
 
 logger = logging.getLogger("orcid_cv")
 
+# (process id, project root) -> typst compiler and its lock, see `_compiler`
+_compilers: Dict[Tuple[int, str], Tuple[Any, threading.Lock]] = {}
+_compilers_lock = threading.Lock()
+
 
 def _ensure_renderer(config: Dict[str, Any]) -> None:
     """Ensures the typst style renderer and asset registry are present in the config."""
@@ -46,18 +51,19 @@ def process_external_links(
 ) -> Dict[str, str]:
     """
     Maps each website with an available icon to its URL and registers the icon
-    file so that `build_document` can copy it next to the generated .typ source.
+    file so that `build_document` can hand it to the compiler.
     """
     _ensure_renderer(config)
     icons: Dict[str, str] = {}
     for name, url in link_dict.items():
-        im_path = os.path.join(package_directory, "external_link_img", f"{name}.png")
-        if os.path.exists(im_path):
-            asset_name = f"{name}.png"
+        im_path = icon_path(name)
+        if im_path is not None:
+            asset_name = os.path.basename(im_path)
             config["typst_assets"][asset_name] = im_path
             icons[asset_name] = url
         else:
-            logger.warning(f"External link image missing at {im_path}")
+            missing = os.path.join(ICON_DIRECTORY, f"{name}.png")
+            logger.warning(f"External link image missing at {missing}")
     return icons
 
 
@@ -202,48 +208,102 @@ def assemble_source(
     return preamble + "\n".join(elements) + "\n"
 
 
-def build_document(
-    output_fname: str,
-    elements: List[str],
-    config: Dict[str, Any],
-    title: str = "",
-    author: str = "",
-    save_source: Optional[str] = None,
-) -> str:
-    """
-    Compiles the accumulated Typst markup into a PDF at `output_fname` and
-    returns the generated Typst source. Pass `save_source` to also keep the .typ.
-    """
+def _typst_module() -> Any:
     try:
         import typst
     except ImportError as e:  # pragma: no cover - depends on the environment
         raise ImportError(
             "The typst backend requires the 'typst' package: pip install typst"
         ) from e
+    return typst
 
-    source = assemble_source(elements, config, title=title, author=author)
 
-    # Build inside a scratch directory holding copies of every referenced asset,
-    # so that typst's project root never needs to reach into the user's folders.
+def _asset_root(assets: Dict[str, str]) -> Optional[str]:
+    """
+    The folder holding every asset under its asset name, which typst can then
+    use as the project root as it is, or None if there is no such folder.
+    """
+    if not assets:
+        return ICON_DIRECTORY
+    root = os.path.dirname(os.path.abspath(next(iter(assets.values()))))
+    for asset_name, asset_path in assets.items():
+        if os.path.abspath(asset_path) != os.path.join(root, asset_name):
+            return None
+    return root
+
+
+def _compiler(root: str) -> Tuple[Any, threading.Lock]:
+    """
+    The compiler of this process for project root `root` and the lock to hold
+    while using it. A compiler loads the fonts once and keeps them for every
+    document it compiles, which is most of the time a CV takes to compile.
+    """
+    key = (os.getpid(), root)  # a forked process makes its own
+    with _compilers_lock:
+        entry = _compilers.get(key)
+        if entry is None:
+            entry = _compilers[key] = (_typst_module().Compiler(root=root), threading.Lock())
+    return entry
+
+
+def compile_source(source: str, assets: Dict[str, str]) -> bytes:
+    """
+    Compiles Typst source to PDF bytes in memory. `assets` maps the file names
+    the source refers to, such as link icons, to the files holding them.
+    """
+    data = source.encode("utf-8")
+    root = _asset_root(assets)
+    if root is not None:
+        compiler, lock = _compiler(root)
+        with lock:
+            return compiler.compile(data, format="pdf")
+
+    # Assets from several folders: give typst a project root holding copies of
+    # them all, so that it never needs to reach into the user's folders.
     build_dir = tempfile.mkdtemp(prefix="orcid_cv_typst_")
     try:
-        for asset_name, asset_path in config.get("typst_assets", {}).items():
+        for asset_name, asset_path in assets.items():
             shutil.copyfile(asset_path, os.path.join(build_dir, asset_name))
+        return _typst_module().compile(data, root=build_dir, format="pdf")
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
 
-        typ_path = os.path.join(build_dir, "cv.typ")
-        with open(typ_path, "w", encoding="utf-8") as f:
-            f.write(source)
 
+def build_document(
+    output_fname: Union[str, BinaryIO, None],
+    elements: List[str],
+    config: Dict[str, Any],
+    title: str = "",
+    author: str = "",
+    save_source: Optional[str] = None,
+) -> Optional[bytes]:
+    """
+    Compiles the accumulated Typst markup into a PDF at `output_fname`. Pass
+    `save_source` to also keep the .typ, or use `assemble_source` to get the
+    source without compiling it.
+
+    `output_fname` may also be a binary file-like object to write the PDF to,
+    or None to get the PDF back as bytes; otherwise None is returned. The
+    source is compiled in memory and the icons are read where they are, so
+    nothing but the PDF itself goes through the disk.
+    """
+    source = assemble_source(elements, config, title=title, author=author)
+    pdf = compile_source(source, config.get("typst_assets", {}))
+
+    if output_fname is None:
+        pass
+    elif hasattr(output_fname, "write"):
+        output_fname.write(pdf)
+    else:
         output_dir = os.path.dirname(os.path.abspath(output_fname))
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-        typst.compile(typ_path, output=output_fname, root=build_dir)
-    finally:
-        shutil.rmtree(build_dir, ignore_errors=True)
+        with open(output_fname, "wb") as f:
+            f.write(pdf)
 
     if save_source:
         with open(save_source, "w", encoding="utf-8") as f:
             f.write(source)
         logger.info(f"Wrote typst source to {save_source}")
 
-    return source
+    return pdf if output_fname is None else None
@@ -1,6 +1,8 @@
 import os
 import logging
-from typing import Any, Dict, List, Union
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger("orcid_cv")
 
@@ -36,29 +38,85 @@ def initalize_name(input_str: str) -> str:
     return initialize_name(input_str)
 
 
-def is_self_author(person: Dict[str, Any], author: str) -> bool:
+def person_orcid(person: Dict[str, Any]) -> str:
+    """The owner's ORCID iD, e.g. '0000-0002-1825-0097', or '' if unknown."""
+    link = person.get("links", {}).get("ORCID", "")
+    return link.rstrip("/").rpartition("orcid.org/")[2] if "orcid.org/" in link else ""
+
+
+# (author, contributor ORCID iD) -> whether the author is the matcher's person
+AuthorMatcher = Callable[..., bool]
+
+
+def compile_author_matcher(person: Dict[str, Any]) -> AuthorMatcher:
     """
-    Returns True if an author string refers to the CV's owner. Markup-agnostic so
-    that every rendering backend can decide how to highlight the name.
+    Returns a function telling whether an author string refers to `person`. The
+    name variants (full name, initialized name, first and last name, first
+    initial and last name) are compiled into one regex alternation, so each
+    author is scanned once for all of them. An author's contributor ORCID iD,
+    when the work lists one, settles the question on its own.
     """
     lastname = person.get("lastname", "")
-    if not lastname or lastname not in author:
-        return False
-
-    fullname = person.get("fullname", "")
-    name_short = person.get("name-short", "")
     firstname = person.get("firstname", "")
-
-    if fullname in author:
-        return True
-    if name_short in author:
-        return True
-    if f"{firstname} {lastname}" in author:
-        return True
-    if f"{firstname[0] if firstname else ''}. {lastname}" in author:
+    variants = [
+        person.get("fullname", ""),
+        person.get("name-short", ""),
+        f"{firstname} {lastname}",
+        f"{firstname[0] if firstname else ''}. {lastname}",
+    ]
+    owner_orcid = person_orcid(person)
+
+    # An empty variant matches any author with the last name, as the substring
+    # test it stands for did
+    search = None
+    if "" not in variants:
+        variants = sorted(set(variants), key=len, reverse=True)
+        search = re.compile("|".join(map(re.escape, variants))).search
+
+    def matches(author: str, orcid: str = "") -> bool:
+        if orcid and owner_orcid:
+            return orcid == owner_orcid
+        # Most authors are someone else, and a plain scan for the last name
+        # turns them away before the variants are tried
+        if not lastname or lastname not in author:
+            return False
+        return search is None or search(author) is not None
+
+    return matches
+
+
+# Matchers by the person fields they were compiled from
+_MATCHERS: Dict[Tuple[str, ...], AuthorMatcher] = {}
+_MAX_MATCHERS = 64
+
+
+def author_matcher(person: Dict[str, Any]) -> AuthorMatcher:
+    """The compiled matcher for a person, built on first use and then reused."""
+    key = (
+        person.get("lastname", ""),
+        person.get("firstname", ""),
+        person.get("fullname", ""),
+        person.get("name-short", ""),
+        person_orcid(person),
+    )
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        if len(_MATCHERS) >= _MAX_MATCHERS:
+            _MATCHERS.clear()
+        matcher = _MATCHERS[key] = compile_author_matcher(person)
+    return matcher
+
+
+def is_self_author(person: Dict[str, Any], author: str, orcid: str = "") -> bool:
+    """
+    Returns True if an author string refers to the CV's owner. Markup-agnostic so
+    that every rendering backend can decide how to highlight the name. `orcid` is
+    the author's contributor ORCID iD, if the work lists one.
+    """
+    if author_matcher(person)(author, orcid):
         return True
-
-    logger.info(f"Did not embolden: {author}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Did not embolden: {author}")
     return False
 
 
@@ -67,8 +125,9 @@ def embolden_authors(person: Dict[str, Any], author_list: List[str]) -> List[str
     Emboldens the target person's name in a list of author names by wrapping
     it in HTML <b> tags.
     """
+    matcher = author_matcher(person)
     for i, author in enumerate(author_list):
-        if is_self_author(person, author):
+        if matcher(author):
             author_list[i] = f"<b>{author}</b>"
 
     return author_list
@@ -89,6 +148,54 @@ def add_equal_author(
             author_list[i - 1] += "*"
 
 
+# Reads one nested path out of a dictionary
+PathAccessor = Callable[[Any], Any]
+
+
+def compile_path(*keys: str, default: Any = "") -> PathAccessor:
+    """
+    Returns a function that looks `keys` up in a nested dictionary, e.g.
+    `compile_path("work:title", "common:title")(work_xml)`. Like
+    `get_recursive_key` it returns `default` ('') when any key is missing or
+    None, but the keys are checked once here instead of on every lookup, and
+    nothing is logged.
+    """
+    if len(keys) == 0 or not all(isinstance(k, str) for k in keys):
+        raise TypeError("Keys must all be of type 'str'.")
+
+    if len(keys) == 1:
+        (key,) = keys
+
+        def get_one(input_dict: Any) -> Any:
+            if isinstance(input_dict, dict):
+                value = input_dict.get(key)
+                if value is not None:
+                    return value
+            return default
+
+        return get_one
+
+    def get(input_dict: Any) -> Any:
+        value = input_dict
+        for key in keys:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key)
+            if value is None:
+                return default
+        return value
+
+    return get
+
+
+_NOT_FOUND = object()
+
+
+@lru_cache(maxsize=256)
+def _cached_path(keys: Tuple[str, ...]) -> PathAccessor:
+    return compile_path(*keys, default=_NOT_FOUND)
+
+
 def get_recursive_key(input_dict: Dict[str, Any], *keys: str) -> Any:
     """
     Safely retrieves a value nested deep inside a dictionary.
@@ -97,21 +204,22 @@ def get_recursive_key(input_dict: Dict[str, Any], *keys: str) -> Any:
     if not isinstance(input_dict, dict):
         raise TypeError("first argument must be a dict.")
 
-    if len(keys) == 0 or not all(isinstance(k, str) for k in keys):
-        raise TypeError("Keys must all be of type 'str'.")
-
-    _dict = input_dict
-    for key in keys:
-        if isinstance(_dict, dict) and key in _dict and _dict[key] is not None:
-            _dict = _dict[key]
-        else:
+    value = _cached_path(keys)(input_dict)
+    if value is _NOT_FOUND:
+        if logger.isEnabledFor(logging.INFO):
             put_code = input_dict.get("@put-code", "unknown")
             logger.info(f"Could not find: {'-'.join(keys)} in item #{put_code}")
-            return ""
-
-    return _dict
+        return ""
+    return value
 
 
 def dict_to_list(input_dict: Dict[str, Any]) -> List[Any]:
     """Converts a dictionary's values to a list."""
     return list(input_dict.values())
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Turns a worker count argument into a number of processes (None = every core)."""
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, workers)
@@ -0,0 +1,224 @@
+"""
+Several documents rendered from one parsed profile.
+
+A researcher often wants more than one document out of the same profile: the
+full CV, a papers-only list, a US-letter and an A4 copy. `render_variants` takes
+the profile once and a list of `Variant`s, each a config plus the sections to
+show, and renders them side by side in a process pool.
+
+The profile is parsed once and the work entries every variant shows are
+prepared once, in the calling process, before the pool starts. Workers receive
+the profile through the pool's initializer rather than with every variant.
+Where processes are forked (the default on Linux) they inherit it and its
+prepared entries outright, with nothing pickled, and only lay out and write
+their documents, so the wall time of a run approaches that of its slowest
+variant. Under spawn or forkserver (the default on macOS and Windows) the
+profile is pickled once per worker, without the prepared entries, which each
+worker then prepares again for the variants it renders.
+
+    config = make_document_config("greenspon-default")
+    variants = [
+        Variant("cv.pdf", config),
+        Variant("papers.pdf", config, sections=[("work", "Publications", "journal-article")]),
+    ]
+    render_variants("path/to/dump", variants)
+"""
+
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from orcid_cv.builder import (
+    add_affiliation_section,
+    add_funding_section,
+    add_person_section,
+    add_review_section,
+    add_service_section,
+    add_work_section,
+    build_document,
+)
+from orcid_cv.content import prepare_works
+from orcid_cv.parser import extract_orcid_info
+from orcid_cv.utils import resolve_workers
+from orcid_cv.workmap import work_map
+
+# Section name -> the builder function appending it
+SECTION_BUILDERS = {
+    "person": add_person_section,
+    "affiliation": add_affiliation_section,
+    "service": add_service_section,
+    "work": add_work_section,
+    "funding": add_funding_section,
+    "review": add_review_section,
+}
+
+# The sections of `add_standard_sections`, as a variant's section list
+STANDARD_SECTIONS = (
+    ("person",),
+    ("affiliation", "Employment", "employment"),
+    ("affiliation", "Education", "education"),
+    ("work", "Research Publications", "journal-article"),
+    ("work", "Talks", "public-speech"),
+    ("work", "Preprints", "preprint"),
+    ("service", "Mentorship & Service"),
+)
+
+# (section name, positional arguments after the config, keyword arguments)
+Section = Tuple[str, Tuple[Any, ...], Dict[str, Any]]
+
+# Profile of the worker processes, set by `_init_worker`
+_profile: Optional[Dict[str, Any]] = None
+
+
+def _section(entry: Sequence[Any]) -> Section:
+    """
+    Parses a section entry: the section name followed by the arguments its
+    builder takes after the config, the last one optionally a dict of keyword
+    arguments, e.g. ("service", "Mentorship", {"match": "mentor"}).
+    """
+    name, *args = entry
+    if name not in SECTION_BUILDERS:
+        raise ValueError(f"Invalid section: {name}. Choose one of {tuple(SECTION_BUILDERS)}.")
+    kwargs: Dict[str, Any] = {}
+    if args and isinstance(args[-1], dict):
+        kwargs = args.pop()
+    return name, tuple(args), kwargs
+
+
+class Variant:
+    """
+    One document to render: the file it is written to (None to get the PDF
+    back as bytes), its config (as made by `make_document_config`) and its
+    sections, in order. `title` and `author` default to "<full name> - CV" and
+    the full name.
+    """
+
+    __slots__ = ("output", "config", "sections", "title", "author")
+
+    def __init__(
+        self,
+        output: Optional[str],
+        config: Dict[str, Any],
+        sections: Iterable[Sequence[Any]] = STANDARD_SECTIONS,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+    ):
+        self.output = output
+        self.config = config
+        self.sections: List[Section] = [_section(entry) for entry in sections]
+        self.title = title
+        self.author = author
+
+    def __repr__(self) -> str:
+        return f"Variant({self.output!r}, sections={[s[0] for s in self.sections]})"
+
+
+def render_variant(orcid_dict: Dict[str, Any], variant: Variant) -> Dict[str, Any]:
+    """
+    Renders one variant from a parsed profile. Returns what was written and how
+    long it took, plus the PDF itself as "pdf" for a variant without an output.
+    """
+    start = time.perf_counter()
+    fullname = orcid_dict["personal"]["fullname"]
+    elements: List[Any] = []
+    for name, args, kwargs in variant.sections:
+        SECTION_BUILDERS[name](elements, orcid_dict, variant.config, *args, **kwargs)
+    result = build_document(
+        variant.output,
+        elements,
+        variant.config,
+        title=f"{fullname} - CV" if variant.title is None else variant.title,
+        author=fullname if variant.author is None else variant.author,
+    )
+    record = {"output": variant.output, "render_s": round(time.perf_counter() - start, 3)}
+    if variant.output is None:
+        record["pdf"] = result
+    return record
+
+
+def _prepare_shared(orcid_dict: Dict[str, Any], variants: List[Variant]) -> None:
+    """
+    Prepares the work entries of every variant in this process, where they are
+    kept with the profile (see `prepare_works`), so forked workers start with
+    them and variants with the same author settings share them.
+    """
+    work_map(orcid_dict)
+    for variant in variants:
+        for name, args, kwargs in variant.sections:
+            if name == "work":
+                search_str = kwargs.get("search_str", args[1] if len(args) > 1 else None)
+                if search_str is not None:
+                    prepare_works(orcid_dict, variant.config, search_str)
+
+
+def _isolated(variant: Variant) -> Variant:
+    """A copy of `variant` with its own config, as a worker would receive it."""
+    variant = copy.copy(variant)
+    variant.config = copy.deepcopy(variant.config)
+    return variant
+
+
+def _check_outputs(variants: List[Variant]) -> None:
+    """Raises a ValueError if two variants would write the same file."""
+    seen: Dict[str, str] = {}
+    for variant in variants:
+        if variant.output is None:
+            continue
+        path = os.path.normcase(os.path.abspath(variant.output))
+        if path in seen:
+            raise ValueError(
+                f"Variants {seen[path]!r} and {variant.output!r} write the same file."
+            )
+        seen[path] = variant.output
+
+
+def _init_worker(orcid_dict: Dict[str, Any]) -> None:
+    global _profile
+    _profile = orcid_dict
+
+
+def _render_job(variant: Variant) -> Dict[str, Any]:
+    """Runs in a worker: renders a variant from the profile it was started with."""
+    return render_variant(_profile, variant)
+
+
+def render_variants(
+    profile: Union[str, Dict[str, Any]],
+    variants: Iterable[Variant],
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Renders every variant from one profile, given parsed or as the path of a
+    dump, over up to `workers` processes (None for every core, at most one per
+    variant). Returns the record of each variant in the order given; an error
+    in any of them is raised once the others are done. Raises a ValueError
+    before rendering anything if two variants share an output file.
+
+    Every variant is rendered with a copy of its config, whether in a worker or
+    in this process, so renderers and other state the builders attach to it
+    never reach the caller's config.
+
+    On Windows the calling script needs an `if __name__ == "__main__":` guard.
+    """
+    orcid_dict = extract_orcid_info(profile) if isinstance(profile, str) else profile
+    variants = list(variants)
+    if not variants:
+        return []
+    _check_outputs(variants)
+
+    _prepare_shared(orcid_dict, variants)
+    workers = max(1, min(resolve_workers(workers), len(variants)))
+    if workers == 1:
+        return [render_variant(orcid_dict, _isolated(variant)) for variant in variants]
+
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(orcid_dict,)
+    ) as executor:
+        futures = [executor.submit(_render_job, variant) for variant in variants]
+        try:
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
@@ -0,0 +1,130 @@
+"""
+Works indexed by type and date.
+
+Every work section of a CV asks for the works of one or two types, newest
+first. `WorkMap` holds the works of a profile and answers those queries from an
+index that maps each type to its works already sorted by date, so a section
+only touches the works it shows.
+
+The index follows edits made between queries. The map counts every change that
+can move a work in the index: adding or removing a work, and setting its type,
+year or month. Works are kept as `Work` records, which report such changes to
+their map, and the index is rebuilt on the next query after one. Edits to other
+fields, such as the titles and authors `my_cv.py` adjusts, leave it alone.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Tuple
+
+from orcid_cv.authors import AuthorTable
+from orcid_cv.normalize import work_keys
+from orcid_cv.records import Work
+
+# (-year, -month, position in the map, work): ascending order is newest first,
+# ties keeping the order of the map
+_Entry = Tuple[int, int, int, Dict[str, Any]]
+
+_MISSING = object()
+
+
+class WorkMap(dict):
+    """
+    Work key -> work, with `sorted_works` answering type queries from an index.
+    Works stored in the map become `Work` records, so keep editing them through
+    the map rather than through a reference taken before they were added.
+    """
+
+    __slots__ = ("version", "author_table", "prepared", "_index", "_index_version")
+
+    def __init__(self, works: Any = (), **kwargs: Any):
+        super().__init__()
+        self.version = 0
+        # Display forms of the works' authors, see `orcid_cv.authors`
+        self.author_table = AuthorTable()
+        # (id of work, settings) -> (fingerprint, entry) kept by `prepare_works`
+        self.prepared: Dict[Any, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._index: Dict[Any, List[_Entry]] = {}
+        self._index_version = -1
+        self.update(works, **kwargs)
+
+    def __setitem__(self, key: Any, work: Dict[str, Any]) -> None:
+        if type(work) is not Work:
+            work = Work(work)
+        object.__setattr__(work, "_owner", self)
+        super().__setitem__(key, work)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        work = super().pop(key)
+        self.version += 1
+        return work
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, work in dict(*args, **kwargs).items():
+            self[key] = work
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def copy(self) -> "WorkMap":
+        return WorkMap({key: work.copy() for key, work in self.items()})
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+    def _build_index(self) -> None:
+        index: Dict[Any, List[_Entry]] = {}
+        for position, work in enumerate(self.values()):
+            keys = work_keys(work)
+            entry = (-keys["year"], -keys["month"], position, work)
+            index.setdefault(work.get("type"), []).append(entry)
+        for entries in index.values():
+            entries.sort(key=lambda entry: entry[:3])
+        self._index = index
+        self._index_version = self.version
+
+        # Drop prepared entries of works no longer in the map
+        live = {id(work) for work in self.values()}
+        self.prepared = {key: value for key, value in self.prepared.items() if key[0] in live}
+
+    def sorted_works(self, types: Iterable[Any]) -> List[Dict[str, Any]]:
+        """The works of any of `types`, newest first; equal dates keep map order."""
+        if self._index_version != self.version:
+            self._build_index()
+        lists = [self._index.get(t, []) for t in dict.fromkeys(types)]
+        if len(lists) == 1:
+            return [entry[3] for entry in lists[0]]
+        return [entry[3] for entry in heapq.merge(*lists, key=lambda entry: entry[:3])]
+
+
+def work_map(orcid_dict: Dict[str, Any]) -> WorkMap:
+    """
+    The works of a profile as a `WorkMap`. Profiles from `extract_orcid_info`
+    hold one from the start. A profile assembled by hand has its plain "work"
+    dictionary replaced on the first call by a map holding the same `Work`
+    records, and entries that are plain dicts converted to records, so take
+    references to its works after that call.
+    """
+    works = orcid_dict["work"]
+    if not isinstance(works, WorkMap):
+        works = orcid_dict["work"] = WorkMap(works)
+    return works
@@ -0,0 +1,101 @@
+"""Reloading and upgrading the ORCID.json cache."""
+
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import orcid_cv.cache  # noqa: E402
+from orcid_cv.cache import SOURCES_KEY, SectionedCache  # noqa: E402
+from orcid_cv.dedup import index_path, load_index  # noqa: E402
+from orcid_cv.lookups import DOI_HOST, LookupCache  # noqa: E402
+from orcid_cv.normalize import canonical_doi  # noqa: E402
+from orcid_cv.parser import extract_orcid_info  # noqa: E402
+from synthetic_dump import write_dump  # noqa: E402
+
+
+def _dump(tmp_path, monkeypatch):
+    root = str(tmp_path / "dump")
+    lookups = write_dump(root, n_works=12, duplicate_pairs=2, n_reviews=0)
+    lookup_cache = LookupCache(str(tmp_path / "lookups.sqlite"))
+    lookup_cache.put_many(
+        DOI_HOST, {canonical_doi(doi): (True, "bioRxiv") for doi in lookups["preprints"]}
+    )
+    monkeypatch.setenv("ORCID_CV_LOOKUP_CACHE", lookup_cache.path)
+    return root
+
+
+def _count_hashes(monkeypatch):
+    hashed = []
+    file_digest = orcid_cv.cache.file_digest
+
+    def counting(dump, rel):
+        hashed.append(rel)
+        return file_digest(dump, rel)
+
+    monkeypatch.setattr(orcid_cv.cache, "file_digest", counting)
+    return hashed
+
+
+def test_untracked_cache_is_upgraded_once(tmp_path, monkeypatch, capsys):
+    root = _dump(tmp_path, monkeypatch)
+    cache_path = os.path.join(root, "ORCID.json")
+    extract_orcid_info(root)
+
+    # A cache written before the per-file records were kept
+    with open(cache_path, encoding="utf-8") as f:
+        cached = json.load(f)
+    del cached[SOURCES_KEY]
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cached, f)
+
+    hashed = _count_hashes(monkeypatch)
+    first = extract_orcid_info(root)
+    assert hashed
+    with open(cache_path, encoding="utf-8") as f:
+        assert SOURCES_KEY in json.load(f)
+
+    hashed.clear()
+    second = extract_orcid_info(root)
+    assert hashed == []
+    assert set(second["work"]) == set(first["work"])
+
+
+def test_similarity_reaches_the_dedup_index(tmp_path, monkeypatch, capsys):
+    root = _dump(tmp_path, monkeypatch)
+    extract_orcid_info(root, similarity=0.85)
+    saved = index_path(os.path.join(root, "ORCID.json"))
+    assert load_index(saved, 0.85) is not None
+    assert load_index(saved, 1.0) is None
+
+
+def test_sectioned_cache_can_be_updated_while_an_older_one_is_held(
+    tmp_path, monkeypatch, capsys
+):
+    root = _dump(tmp_path, monkeypatch)
+    extract_orcid_info(root, cache_format="sections")
+    held = extract_orcid_info(root, cache_format="sections")
+    assert isinstance(held, SectionedCache)
+    personal = held["personal"]
+
+    works_dir = os.path.join(root, "works")
+    work_path = os.path.join(works_dir, sorted(os.listdir(works_dir))[0])
+    with open(work_path, encoding="utf-8") as f:
+        xml = f.read()
+    with open(work_path, "w", encoding="utf-8") as f:
+        f.write(xml.replace("<common:title>", "<common:title>Revised ", 1))
+    capsys.readouterr()
+
+    updated = extract_orcid_info(root, cache_format="sections")
+    assert "1 new or edited" in capsys.readouterr().out
+    assert any(work["title"].startswith("Revised ") for work in updated["work"].values())
+
+    # The older cache keeps what it loaded but no longer reads the replaced file
+    assert held["personal"] == personal
+    with pytest.raises(ValueError):
+        held["work"]
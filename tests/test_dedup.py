@@ -0,0 +1,102 @@
+"""Duplicate grouping of preprints and articles."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orcid_cv.dedup import DedupIndex  # noqa: E402
+from orcid_cv.normalize import normalize_title  # noqa: E402
+from orcid_cv.parser import check_duplicates, prune_duplicate_works  # noqa: E402
+
+
+def _work(work_type, title, year=2020, authors=("Charles M. Greenspon",), eids=()):
+    return {
+        "type": work_type,
+        "title": title,
+        "year": str(year),
+        "authors": list(authors),
+        "external_ids": list(eids),
+    }
+
+
+def _merged(preprint, article, similarity=0.85):
+    index = DedupIndex(similarity)
+    index.add("preprint", preprint, normalize_title(preprint["title"]))
+    index.add("article", article, normalize_title(article["title"]))
+    return index.find("preprint") == index.find("article")
+
+
+NUMBERED_PAIRS = [
+    (
+        "Cortical encoding of vibrotactile frequency in the somatosensory cortex, part I",
+        "Cortical encoding of vibrotactile frequency in the somatosensory cortex, part II",
+    ),
+    (
+        "Outcomes of intracortical microstimulation in tetraplegia: 1-year follow-up",
+        "Outcomes of intracortical microstimulation in tetraplegia: 2-year follow-up",
+    ),
+]
+
+
+@pytest.mark.parametrize("preprint_title, article_title", NUMBERED_PAIRS)
+def test_numbered_titles_are_not_merged(preprint_title, article_title):
+    preprint = _work("preprint", preprint_title)
+    article = _work("journal-article", article_title)
+    assert not _merged(preprint, article)
+    assert not _merged(preprint, article, similarity=0.5)
+
+
+@pytest.mark.parametrize("preprint_title, article_title", NUMBERED_PAIRS)
+def test_prune_keeps_numbered_works(preprint_title, article_title):
+    works = {
+        "1": _work("preprint", preprint_title),
+        "2": _work("journal-article", article_title),
+    }
+    assert set(prune_duplicate_works(works)) == {"1", "2"}
+    assert set(prune_duplicate_works(works, similarity=0.85)) == {"1", "2"}
+
+
+def test_near_matches_are_opt_in():
+    preprint = _work("preprint", "Spatial patterns of touch encoding in the human hand")
+    article = _work("journal-article", "The spatial patterns of touch encoding in the human hand")
+    assert not _merged(preprint, article, similarity=1.0)
+    assert _merged(preprint, article)
+
+
+def test_near_matches_need_the_same_first_author_and_close_years():
+    title = "Spatial patterns of touch encoding in the human hand"
+    reworded = "The spatial patterns of touch encoding in the human hand"
+    preprint = _work("preprint", title)
+    assert not _merged(preprint, _work("journal-article", reworded, authors=["A. Other"]))
+    assert not _merged(preprint, _work("journal-article", reworded, year=2026))
+
+
+def test_exact_matches_still_merge():
+    title = "Spatial patterns of touch encoding in the human hand"
+    assert _merged(_work("preprint", title), _work("journal-article", title.upper()), 1.0)
+    assert _merged(
+        _work("preprint", "A", eids=["10.1101/1"]),
+        _work("journal-article", "B", eids=["10.1101/1"]),
+        1.0,
+    )
+
+
+def test_dois_link_whatever_their_case_or_prefix():
+    assert _merged(
+        _work("preprint", "A", eids=["10.1101/ABC"]),
+        _work("journal-article", "B", eids=["https://doi.org/10.1101/abc"]),
+        1.0,
+    )
+
+
+def test_plain_dicts_get_no_stored_keys():
+    works = {
+        "1": _work("preprint", "Touch encoding in the hand", eids=["10.1101/1"]),
+        "2": _work("journal-article", "Vibration coding in cortex"),
+    }
+    check_duplicates(works)
+    prune_duplicate_works(works)
+    assert all("keys" not in work for work in works.values())